@@ -0,0 +1,78 @@
+"""
+PROJECT: ONCOLOGICAL CLINICAL TRIAGE SYSTEM
+VERSION: 1.0.0
+AUTHOR: [Laurien Michel /GitHub Username:Laurien03]
+
+DESCRIPTION:
+This system is a Clinical Decision Support Tool designed to streamline oncology 
+patient registration and triage. It utilizes an 8-level class inheritance 
+structure to ensure data integrity across multiple clinical stages, including 
+vital signs, symptom assessment, and emergency protocol detection.
+
+KEY LOGIC:
+- Multi-level Inheritance Architecture
+- Real-time Clinical Scoring (0-10 Scale)
+- Automated Emergency 'Red Flag' Triggers (Score >= 8)
+- High-volume data processing (unbounded streaming intake, soft capacity alerts)
+
+PACKAGE LAYOUT:
+- onc.core      menus, validation, BMI, red-flag/symptom scoring
+- onc.clinical  interactive front-desk stages (Receptionnist ... Clinical_Summary)
+- onc.flow      declarative question flow compiled into a field -> step dispatch table
+- onc.dosing    BMI, BSA, ideal/adjusted body weight and weight-based dose checks
+- onc.formulary regimen consistency and drug-interaction checks against a formulary file
+- onc.record    compact slotted PatientRecord and columnar PatientBatch
+- onc.engine    headless batch triage of pre-collected intake files
+- onc.parallel  process-pool triage of large backlogs, merged in arrival/priority order
+- onc.checkpoint  per-stage session journal for resuming interrupted desk sessions
+- onc.escalation  emergency events and their queue/file/callback sinks
+- onc.events    typed dashboard events, batched EventBus, file/socket sinks
+- onc.census    incremental census counters with per-site/day/hour rollups
+- onc.metrics   per-stage timings, validation/decline counters, Prometheus/JSON export
+- onc.priority  acuity score and heap-based TriageQueue
+- onc.report    templated text/JSON/HTML report renderer and bulk writer
+- onc.export    streamed Parquet/Arrow IPC (CSV fallback) export of triage records
+- onc.store     SQLite patient store with indexed lookups and bulk inserts
+- onc.trends    per-patient symptom histories with incremental trend alerts
+- onc.vocabulary  IntEnum codes of every menu option, interned terms, ICD-O/CTCAE/SNOMED IDs
+- onc.matcher   trigram-indexed matching of 'Other' free text to coded terms, LRU-cached
+- onc.sessions  asyncio session server: one state machine per kiosk conversation
+- onc.synthetic seeded synthetic patients (batch answers or desk input)
+- onc.bench     benchmark suite with stored results for regression comparison
+- onc.vectorized  NumPy census re-scoring and dose review (imported on demand, needs NumPy)
+- python -m onc runs the front desk; importing the package has no side effects
+"""
+from .census import CensusEngine
+from .checkpoint import SessionJournal
+from .clinical import Clinical_Summary
+from .core import (SYMPTOM_ALERT_THRESHOLD, compute_bmi, first_red_flag,
+                   is_alert_score, symptom_alerts)
+from .dosing import body_metrics, dose_check
+from .escalation import (CallbackSink, EmergencyEscalation, EmergencyEvent,
+                         FileSink, QueueSink)
+from .events import DashboardEvent, EventBus, open_dashboard
+from .engine import (IntakeError, read_intake, run_batch, stream_triage,
+                     triage_answers)
+from .export import ColumnarWriter
+from .formulary import FormularyIndex, load_formulary
+from .matcher import TermMatcher
+from .metrics import Metrics
+from .priority import TriageQueue, acuity_score
+from .record import PatientBatch, PatientRecord
+from .report import build_professional_report, render, write_reports
+from .store import PatientStore
+from .synthetic import synthetic_patients
+from .trends import TrendEngine
+from .vocabulary import TERMS, display, tally, term
+
+__all__ = ["Clinical_Summary", "SYMPTOM_ALERT_THRESHOLD",
+           "build_professional_report", "compute_bmi", "first_red_flag",
+           "is_alert_score", "symptom_alerts", "IntakeError", "read_intake",
+           "run_batch", "stream_triage", "triage_answers", "PatientBatch",
+           "PatientRecord", "PatientStore", "render", "write_reports",
+           "CallbackSink", "EmergencyEscalation", "EmergencyEvent", "FileSink",
+           "QueueSink", "TriageQueue", "acuity_score", "DashboardEvent",
+           "EventBus", "open_dashboard", "Metrics", "synthetic_patients",
+           "body_metrics", "dose_check", "SessionJournal", "TrendEngine",
+           "FormularyIndex", "load_formulary", "TERMS", "display", "tally",
+           "term", "TermMatcher", "CensusEngine", "ColumnarWriter"]
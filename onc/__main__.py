@@ -0,0 +1,224 @@
+"""
+Entry point: `python -m onc` opens the interactive front desk,
+`python -m onc --batch FILE` triages a pre-collected intake file,
+`python -m onc --serve` runs the asyncio session server for kiosks and tablets,
+`python -m onc --synthetic N` writes seeded test patients,
+`python -m onc --review DB` checks every active regimen against the formulary,
+`python -m onc --export DB -o FILE` writes every stored session to Parquet/Arrow/CSV and
+`python -m onc --bench` runs the performance regression suite.
+"""
+import argparse
+import sys
+
+from .bench import bench_main
+from .census import DEFAULT_SITE, CensusEngine
+from .checkpoint import SessionJournal, SessionParked
+from .clinical import DESK_STAGES, Clinical_Summary, run_session
+from .engine import DEFAULT_SOFT_CAPACITY, batch_main
+from .escalation import EmergencyEscalation, FileSink
+from .events import open_dashboard, trend_event
+from .export import export_main
+from .flow import DESK_COMMANDS
+from .formulary import DEFAULT_FORMULARY, load_formulary, review_main
+from .metrics import Metrics
+from .priority import TriageQueue
+from .sessions import serve_main
+from .store import PatientStore
+from .synthetic import synthetic_main
+from .trends import TrendEngine, describe
+
+NEXT_PATIENT_COMMAND = "/next"
+PARK_COMMAND = "/park"
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "--batch":
+        # Headless mode: triage a whole intake file instead of opening the front desk
+        return batch_main(argv[1:])
+    if argv and argv[0] == "--serve":
+        # Kiosk/tablet backend: many concurrent sessions on one event loop
+        return serve_main(argv[1:])
+    if argv and argv[0] == "--bench":
+        # Performance regression suite on synthetic patients
+        return bench_main(argv[1:])
+    if argv and argv[0] == "--review":
+        # Pharmacy review of the whole active-regimen table
+        return review_main(argv[1:])
+    if argv and argv[0] == "--export":
+        # Columnar export of the patient store for the research team
+        return export_main(argv[1:])
+    if argv and argv[0] == "--synthetic":
+        # Seeded test patients for the batch engine, the kiosks or the desk
+        return synthetic_main(argv[1:])
+    parser = argparse.ArgumentParser(
+        prog="python -m onc", description="Interactive oncology triage front desk.")
+    parser.add_argument("--emergency-log",
+                        help="append every emergency event as a JSON line to this file")
+    parser.add_argument("--soft-capacity", type=int, default=DEFAULT_SOFT_CAPACITY,
+                        help="show a capacity notice every N sessions (0 disables)")
+    parser.add_argument("--store", metavar="DB",
+                        help="save every completed or emergency triage to this SQLite patient store")
+    parser.add_argument("--dashboard", metavar="TARGET",
+                        help="stream dashboard events to tcp://HOST:PORT, unix:PATH or a JSON-lines file")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="keep per-stage timings and error counters in FILE (.prom: Prometheus text, else JSON)")
+    parser.add_argument("--journal", metavar="FILE",
+                        help="checkpoint every completed stage to FILE so interrupted sessions can resume")
+    parser.add_argument("--formulary", default=DEFAULT_FORMULARY,
+                        help="formulary JSON used to check each regimen (default: the bundled one)")
+    parser.add_argument("--census", metavar="FILE",
+                        help="keep the census (counts per visit reason, pathology, grade...) in FILE as JSON")
+    parser.add_argument("--site", default=DEFAULT_SITE,
+                        help="site name this desk's sessions are counted under in the census")
+    options = parser.parse_args(argv)
+    sink = FileSink(options.emergency_log) if options.emergency_log else None
+    store = PatientStore(options.store) if options.store else None
+    dashboard = open_dashboard(options.dashboard) if options.dashboard else None
+    metrics = Metrics() if options.metrics else None
+    formulary = load_formulary(options.formulary)
+    journal = SessionJournal(options.journal) if options.journal else None
+    # Symptom histories of every stored visit, then kept current visit by visit
+    trends = TrendEngine().load(store.iter_visits()) if store is not None else None
+    census = CensusEngine(options.site) if options.census else None
+    if census is not None and store is not None:
+        census.load(store.iter_visits())
+
+    # Completed patients wait here for the nurse, who calls them in acuity order
+    # by typing /next at any desk prompt; emergencies go to the ER, not this queue
+    waiting_room = TriageQueue()
+    DESK_COMMANDS[NEXT_PATIENT_COMMAND] = lambda: _call_next_patient(waiting_room)
+    DESK_COMMANDS[PARK_COMMAND] = _park_session
+    patients = 0
+    sessions = 0                    # desk sessions opened, parked ones included
+    # No hard ceiling: the desk serves patients until the operator closes it (Ctrl-D / Ctrl-C)
+    while True:
+
+        app = Clinical_Summary(name="", age=0, sex="",
+                               weight=0.0, height=0.0, BMI=0.0)
+        app.emergency_sink = sink
+        app.event_bus = dashboard
+        app.metrics = metrics
+        app.patient_lookup = store
+        app.formulary = formulary
+        checkpoint = None
+        sessions += 1
+        # Waiting-room key: namesakes are different patients, so key on the session
+        session = sessions
+        try:
+            if journal is not None:
+                checkpoint = _open_checkpoint(journal)
+                session = checkpoint.session_id
+            app.session_id = str(session)
+            run_session(app, metrics, checkpoint)
+        except SessionParked:
+            # The patient stepped away: keep their answers, serve the next patient
+            if checkpoint is not None:
+                checkpoint.park()
+                print(f"⏸️ Session {checkpoint.session_id} parked after {checkpoint.stages} of "
+                      f"{len(DESK_STAGES)} stages. Enter this ID at the resume prompt to continue.")
+            else:
+                print("⚠️ Session abandoned: start the desk with --journal to park sessions for later.")
+            if metrics is not None:
+                metrics.session_finished("parked")
+            continue
+        except EmergencyEscalation:
+            # The patient is flagged and routed to the ER; the rest of the queue keeps its turn
+            print("⚠️ Session closed for emergency routing. Next patient, please.")
+            record = app.to_record()
+            if session in waiting_room:
+                # Flagged while waiting for the nurse: the ER sees them instead
+                waiting_room.remove(session)
+            if store is not None:
+                store.add(record)
+            if census is not None:
+                census.add_record(record)
+            if metrics is not None:
+                metrics.session_finished("emergency")
+            if checkpoint is not None:
+                checkpoint.finish("emergency")
+        except (EOFError, KeyboardInterrupt):
+            # End of the intake stream: the unfinished session is dropped, the day is closed
+            print("\n" + "═"*60)
+            print(f"DESK CLOSED - {patients} patient sessions served")
+            print("═"*60)
+            break
+        else:
+            record = app.to_record()
+            if store is not None:
+                store.add(record)
+            if checkpoint is not None:
+                checkpoint.finish("complete")
+            if trends is not None:
+                for alert in trends.add_record(record):
+                    print(describe(alert))
+                    if dashboard is not None:
+                        dashboard.publish(trend_event(alert, session=str(session)))
+            if census is not None:
+                census.add_record(record)
+            if metrics is not None:
+                metrics.session_finished("complete")
+            # Nurses see patients by acuity, not by arrival order; a session
+            # re-triaged while still waiting keeps its place in the arrival order
+            if session in waiting_room:
+                waiting_room.update(session, record)
+            else:
+                waiting_room.push(session, record)
+            _, next_record, acuity = waiting_room.peek()
+            print(f"🩺 Next patient for the nurse: {next_record.name} (acuity {acuity}, {len(waiting_room)} waiting)")
+        patients += 1
+        if metrics is not None:
+            # Rewritten after every patient so a scraper always sees current numbers
+            metrics.write(options.metrics)
+        if census is not None:
+            census.write(options.census)
+        if options.soft_capacity and patients % options.soft_capacity == 0:
+            # Soft alert only: staffing can react, nobody is turned away
+            print("\n" + "═"*60)
+            print(f"CAPACITY NOTICE - {patients} sessions served today. Intake continues.")
+            print("═"*60)
+    DESK_COMMANDS.pop(NEXT_PATIENT_COMMAND, None)
+    DESK_COMMANDS.pop(PARK_COMMAND, None)
+    if store is not None:
+        store.close()
+    if dashboard is not None:
+        dashboard.close()
+    if metrics is not None:
+        metrics.write(options.metrics)
+    if journal is not None:
+        # The unfinished session (if any) stays in the journal for the next desk
+        journal.close()
+    return 0
+
+
+def _park_session():
+    """/park: sets the current session aside (kept in the --journal) and starts the next patient."""
+    raise SessionParked()
+
+
+def _call_next_patient(waiting_room):
+    """/next: the nurse takes the most urgent waiting patient."""
+    if not waiting_room:
+        print("🩺 No patients waiting for the nurse.")
+        return
+    _, record, acuity = waiting_room.pop()
+    print(f"🩺 Nurse calls {record.name} (acuity {acuity}). {len(waiting_room)} still waiting.")
+
+
+def _open_checkpoint(journal):
+    """Asks for a session ID to resume; an empty answer starts a new patient."""
+    session_id = input("Session ID to resume (press Enter for a new patient): ").strip()
+    if session_id and session_id not in journal:
+        print("⛔️ No interrupted session with that ID. Starting a new patient.")
+        session_id = None
+    checkpoint = journal.session(session_id or None)
+    if checkpoint.resumed:
+        print(f"✅ Resuming session {checkpoint.session_id} at "
+              f"'{DESK_STAGES[min(checkpoint.stages, len(DESK_STAGES) - 1)]}' ({checkpoint.stages} of {len(DESK_STAGES)} stages done).")
+    else:
+        print(f"Session ID: {checkpoint.session_id} - quote it to resume if the session is interrupted.")
+    return checkpoint
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+Benchmark suite for the triage pipeline.
+
+Feeds seeded synthetic patients (onc.synthetic) through the headless engine
+and times each step per patient: triage (validation and scoring), report
+rendering and columnar storage, at 1k/100k/1M patients by default. It also
+measures memory per record and drives the interactive desk end to end with
+per-stage timings from onc.metrics. Every run is appended to a JSON results
+file and compared with the previous run of the same seed, so a slowdown shows
+up as a regression instead of a feeling.
+"""
+import argparse
+import builtins
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from .clinical import Clinical_Summary, run_session
+from .engine import IntakeError, triage_answers
+from .escalation import EmergencyEscalation
+from .metrics import Metrics
+from .record import PatientBatch
+from .report import render_text
+from .synthetic import desk_script, synthetic_patients
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_DESK_PATIENTS = 1_000
+DEFAULT_RESULTS = "bench_results.json"
+DEFAULT_THRESHOLD = 0.10          # a >10% slower rate counts as a regression
+MEMORY_SAMPLE = 10_000
+
+
+def bench_engine(count, seed=0):
+    """Per-step timings of count synthetic patients through the headless pipeline."""
+    timings = {"generate": 0.0, "triage": 0.0, "render": 0.0, "store": 0.0}
+    outcomes = {"complete": 0, "emergency": 0, "rejected": 0}
+    batch = PatientBatch()
+    clock = time.perf_counter
+    patients = iter(synthetic_patients(count, seed))
+    while True:
+        start = clock()
+        answers = next(patients, None)
+        generated = clock()
+        timings["generate"] += generated - start
+        if answers is None:
+            break
+        try:
+            record = triage_answers(answers)
+        except IntakeError:
+            outcomes["rejected"] += 1
+            timings["triage"] += clock() - generated
+            continue
+        triaged = clock()
+        render_text(record)
+        rendered = clock()
+        batch.append(record)
+        stored = clock()
+        timings["triage"] += triaged - generated
+        timings["render"] += rendered - triaged
+        timings["store"] += stored - rendered
+        outcomes[record.status] += 1
+
+    pipeline = timings["triage"] + timings["render"] + timings["store"]
+    triaged = outcomes["complete"] + outcomes["emergency"]
+    return {
+        "patients": count,
+        "outcomes": outcomes,
+        "seconds": timings,
+        "end_to_end_per_second": count / pipeline if pipeline else 0.0,
+        "triage_per_second": count / timings["triage"] if timings["triage"] else 0.0,
+        "render_per_second": triaged / timings["render"] if timings["render"] else 0.0,
+        "store_per_second": triaged / timings["store"] if timings["store"] else 0.0,
+    }
+
+
+def bench_memory(sample=MEMORY_SAMPLE, seed=0):
+    """Bytes per patient held as PatientRecord objects and as PatientBatch rows."""
+    answers = list(synthetic_patients(sample, seed))
+    records = []
+    for row in answers:
+        try:
+            records.append(triage_answers(row))
+        except IntakeError:
+            pass
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.take_snapshot()
+        copies = [triage_answers(row) for row in answers
+                  if row["registration_confirmed"] == "Y"]
+        as_objects = _allocated_since(baseline)
+        del copies
+        baseline = tracemalloc.take_snapshot()
+        batch = PatientBatch(records)
+        as_batch = _allocated_since(baseline)
+        del batch
+    finally:
+        tracemalloc.stop()
+    return {"records": len(records),
+            "bytes_per_record": as_objects / len(records),
+            "bytes_per_batch_row": as_batch / len(records)}
+
+
+def _allocated_since(snapshot):
+    return sum(stat.size_diff for stat in
+               tracemalloc.take_snapshot().compare_to(snapshot, "filename"))
+
+
+def bench_desk(count, seed=0):
+    """
+    Runs count synthetic patients through the interactive desk stages, with
+    input() fed from desk_script() and the conversation sent to os.devnull.
+    Returns per-stage timings and the end-to-end session rate.
+    """
+    lines = iter([line for answers in synthetic_patients(count, seed)
+                  for line in desk_script(answers)])
+    metrics = Metrics()
+    real_input = builtins.input
+    builtins.input = lambda prompt="": next(lines)
+    start = time.perf_counter()
+    try:
+        with open(os.devnull, "w", encoding="utf-8") as null, contextlib.redirect_stdout(null):
+            for _ in range(count):
+                app = Clinical_Summary(name="", age=0, sex="", weight=0.0, height=0.0, BMI=0.0)
+                app.metrics = metrics
+                try:
+                    run_session(app, metrics)
+                    metrics.session_finished("complete")
+                except EmergencyEscalation:
+                    metrics.session_finished("emergency")
+    finally:
+        builtins.input = real_input
+    elapsed = time.perf_counter() - start
+    return {
+        "patients": count,
+        "sessions_per_second": count / elapsed if elapsed else 0.0,
+        "stages": {stage: timing.to_dict() for stage, timing in metrics.timings.items()},
+        "validation_failures": dict(metrics.validation_failures),
+        "confirmation_declines": dict(metrics.declines),
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, seed=0, desk_patients=DEFAULT_DESK_PATIENTS,
+                   progress=None):
+    """One full benchmark run, as stored in the results file."""
+    run = {"timestamp": time.time(), "python": platform.python_version(),
+           "machine": platform.machine(), "seed": seed, "engine": {}}
+    for size in sizes:
+        if progress:
+            progress(f"engine: {size} patients")
+        run["engine"][str(size)] = bench_engine(size, seed)
+    if progress:
+        progress(f"memory: {MEMORY_SAMPLE} patients")
+    run["memory"] = bench_memory(seed=seed)
+    if desk_patients:
+        if progress:
+            progress(f"desk: {desk_patients} patients")
+        run["desk"] = bench_desk(desk_patients, seed)
+    return run
+
+
+def _rates(run):
+    # Higher-is-better figures compared between runs
+    rates = {}
+    for size, result in run.get("engine", {}).items():
+        for name in ("end_to_end_per_second", "triage_per_second",
+                     "render_per_second", "store_per_second"):
+            rates[f"engine[{size}].{name}"] = result[name]
+    if "desk" in run:
+        rates["desk.sessions_per_second"] = run["desk"]["sessions_per_second"]
+    return rates
+
+
+def compare_runs(previous, current, threshold=DEFAULT_THRESHOLD):
+    """[(metric, previous, current, relative change, regressed)] for the shared rates."""
+    before, after = _rates(previous), _rates(current)
+    rows = []
+    for metric, value in after.items():
+        if metric in before and before[metric]:
+            change = (value - before[metric]) / before[metric]
+            rows.append((metric, before[metric], value, change, change < -threshold))
+    return rows
+
+
+def load_results(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as results:
+        return json.load(results)
+
+
+def save_results(path, runs):
+    with open(path, "w", encoding="utf-8") as results:
+        json.dump(runs, results, indent=2)
+        results.write("\n")
+
+
+def bench_main(argv):
+    """Command line entry: python -m onc --bench [--sizes 1000,100000] [--results FILE]."""
+    parser = argparse.ArgumentParser(
+        prog="python -m onc --bench",
+        description="Benchmark the triage pipeline on seeded synthetic patients.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated patient counts for the engine benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--desk-patients", type=int, default=DEFAULT_DESK_PATIENTS,
+                        help="patients driven through the interactive desk (0 skips it)")
+    parser.add_argument("--results", default=DEFAULT_RESULTS,
+                        help="JSON file the run is appended to and compared against")
+    parser.add_argument("--label", help="free-text note stored with the run (branch, change...)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown reported as a regression (default 0.10)")
+    parser.add_argument("--no-save", action="store_true", help="compare only, do not store the run")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="exit with status 1 when a rate regressed")
+    options = parser.parse_args(argv)
+    sizes = [int(size) for size in options.sizes.split(",") if size]
+
+    run = run_benchmarks(sizes, options.seed, options.desk_patients,
+                         progress=lambda step: print(f"⏱  {step}...", file=sys.stderr))
+    if options.label:
+        run["label"] = options.label
+
+    for size, result in run["engine"].items():
+        print(f"engine {size:>9} patients: {result['end_to_end_per_second']:>10.0f}/s end-to-end | "
+              f"triage {result['triage_per_second']:.0f}/s | render {result['render_per_second']:.0f}/s | "
+              f"store {result['store_per_second']:.0f}/s")
+    memory = run["memory"]
+    print(f"memory: {memory['bytes_per_record']:.0f} B per PatientRecord, "
+          f"{memory['bytes_per_batch_row']:.0f} B per PatientBatch row")
+    if "desk" in run:
+        desk = run["desk"]
+        slowest = sorted(desk["stages"].items(), key=lambda item: -item[1]["total_seconds"])[:3]
+        print(f"desk: {desk['sessions_per_second']:.0f} sessions/s; slowest stages: "
+              + ", ".join(f"{stage} {timing['mean_seconds'] * 1e6:.0f}µs" for stage, timing in slowest))
+
+    runs = load_results(options.results)
+    previous = next((old for old in reversed(runs) if old.get("seed") == run["seed"]), None)
+    regressed = False
+    if previous is not None:
+        for metric, before, after, change, slower in compare_runs(previous, run, options.threshold):
+            regressed = regressed or slower
+            mark = "⚠️ REGRESSION" if slower else ""
+            print(f"  {metric}: {before:.0f} -> {after:.0f} ({change:+.1%}) {mark}")
+    if not options.no_save:
+        save_results(options.results, runs + [run])
+    return 1 if regressed and options.fail_on_regression else 0
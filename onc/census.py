@@ -0,0 +1,158 @@
+"""
+Daily census analytics.
+
+CensusEngine keeps the counts the charge nurse's dashboard shows: sessions
+and emergencies, the symptom-alert rate, and patients per visit reason,
+pathology type, pathology type x stage, treatment category, CTCAE grade and
+functional status. Every count lives in a fixed-size typed array indexed by
+the onc.vocabulary code, and a finished session increments the arrays of
+its site, of its day and of its hour (and of the all-sites totals), so
+adding a session and reading any snapshot both take constant time however
+many sessions the day has seen. Nothing is recomputed from raw records.
+"""
+import json
+import time
+from array import array
+from collections import OrderedDict
+
+from .vocabulary import ENUMS, PathologyStage, PathologyType
+
+DEFAULT_SITE = "main"
+DEFAULT_HOUR_RETENTION = 7 * 24       # hourly buckets kept (daily and per-site buckets are kept for good)
+ALL_SITES = None                      # site key of the all-sites rollup
+
+# Record fields counted per code (severity codes are CTCAE grades)
+CENSUS_FIELDS = ("visit_reason", "pathology_type", "pathology_stage", "treatment",
+                 "severity", "functional_status")
+
+_STAGES = len(PathologyStage) + 1     # row width of the type x stage table (0: not asked)
+
+
+def _zeros(size):
+    return array("L", [0]) * size
+
+
+class CensusCounts:
+    """
+    Counters of one bucket (a site, a day or an hour). codes[field][code]
+    counts patients per option; index 0 is "not asked" (emergencies,
+    questions the desk does not ask).
+    """
+    __slots__ = ("sessions", "emergencies", "alerted", "codes", "type_by_stage")
+
+    def __init__(self):
+        self.sessions = 0
+        self.emergencies = 0
+        self.alerted = 0                  # completed sessions with a symptom alert
+        self.codes = {field: _zeros(len(ENUMS[field]) + 1) for field in CENSUS_FIELDS}
+        self.type_by_stage = _zeros((len(PathologyType) + 1) * _STAGES)
+
+    def add(self, record):
+        self.sessions += 1
+        if record.status == "emergency":
+            self.emergencies += 1
+            return
+        if record.alerts:
+            self.alerted += 1
+        codes = self.codes
+        for field in CENSUS_FIELDS:
+            codes[field][getattr(record, field)] += 1
+        self.type_by_stage[record.pathology_type * _STAGES + record.pathology_stage] += 1
+
+    @property
+    def completed(self):
+        return self.sessions - self.emergencies
+
+    @property
+    def alert_rate(self):
+        """Share of completed sessions with at least one symptom alert."""
+        return self.alerted / self.completed if self.completed else 0.0
+
+    def to_dict(self):
+        """JSON-ready snapshot; options are keyed by their onc.vocabulary code name."""
+        result = {"sessions": self.sessions, "completed": self.completed,
+                  "emergencies": self.emergencies, "symptom_alerts": self.alerted,
+                  "symptom_alert_rate": round(self.alert_rate, 4)}
+        for field in CENSUS_FIELDS:
+            result[field] = _named(ENUMS[field], self.codes[field])
+        result["pathology_type_by_stage"] = {
+            kind.name: stages for kind in PathologyType
+            if (stages := _named(PathologyStage, self.type_by_stage[kind * _STAGES:(kind + 1) * _STAGES]))}
+        return result
+
+
+def _named(enum, counts):
+    return {member.name: counts[member] for member in enum if counts[member]}
+
+
+class CensusEngine:
+    """
+    Incremental census of one or more sites, with rollups per site, per
+    day ("YYYY-MM-DD", local time) and per hour ("YYYY-MM-DDTHH:00").
+    """
+
+    def __init__(self, site=DEFAULT_SITE, hour_retention=DEFAULT_HOUR_RETENTION):
+        self.site = site                  # site of records added without one
+        self.hour_retention = hour_retention
+        self.started = time.time()
+        self._sites = {ALL_SITES: CensusCounts()}
+        self._days = {}                   # day -> {site: CensusCounts}
+        self._hours = OrderedDict()       # hour -> {site: CensusCounts}, oldest first
+
+    def add_record(self, record, timestamp=None, site=None):
+        """Counts one finished session (completed or emergency) at timestamp (default: now)."""
+        site = site or self.site
+        moment = time.localtime(time.time() if timestamp is None else timestamp)
+        day = time.strftime("%Y-%m-%d", moment)
+        hour = time.strftime("%Y-%m-%dT%H:00", moment)
+        hours = self._hours.get(hour)
+        if hours is None:
+            hours = self._hours[hour] = {}
+            if len(self._hours) > self.hour_retention:
+                self._hours.popitem(last=False)
+        for buckets in (self._sites, self._days.setdefault(day, {}), hours):
+            for key in (ALL_SITES, site):
+                counts = buckets.get(key)
+                if counts is None:
+                    counts = buckets[key] = CensusCounts()
+                counts.add(record)
+
+    def load(self, visits, site=None):
+        """Replays (timestamp, record) pairs, e.g. PatientStore.iter_visits()."""
+        for timestamp, record in visits:
+            self.add_record(record, timestamp, site)
+        return self
+
+    def counts(self, site=ALL_SITES, day=None, hour=None):
+        """CensusCounts of one bucket (an empty one when nothing was counted there)."""
+        if hour is not None:
+            buckets = self._hours.get(hour, {})
+        elif day is not None:
+            buckets = self._days.get(day, {})
+        else:
+            buckets = self._sites
+        return buckets.get(site) or CensusCounts()
+
+    def snapshot(self, site=ALL_SITES, day=None, hour=None):
+        """to_dict() of one bucket: all sites and all time by default."""
+        return self.counts(site, day, hour).to_dict()
+
+    def today(self, site=ALL_SITES):
+        return self.snapshot(site, day=time.strftime("%Y-%m-%d"))
+
+    def rollup(self, by, site=ALL_SITES):
+        """{site | day | hour: snapshot} of every bucket of one kind (by: "site", "day" or "hour")."""
+        if by == "site":
+            return {key: counts.to_dict() for key, counts in self._sites.items() if key is not ALL_SITES}
+        buckets = {"day": self._days, "hour": self._hours}[by]
+        return {key: sites[site].to_dict() for key, sites in buckets.items() if site in sites}
+
+    def to_json(self):
+        return json.dumps({"started": self.started, "total": self.snapshot(),
+                           "sites": self.rollup("site"), "days": self.rollup("day"),
+                           "hours": self.rollup("hour")}, ensure_ascii=False, indent=2)
+
+    def write(self, path):
+        """Writes the whole census (totals and every rollup) as JSON."""
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(self.to_json() + "\n")
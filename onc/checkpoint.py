@@ -0,0 +1,141 @@
+"""
+Session checkpoint journal.
+
+Every desk stage that completes appends one JSON line to a local journal:
+the session ID, the number of stages done and only the answers that stage
+changed. A session interrupted by a patient walking away or by the process
+dying is rebuilt from its lines and resumes at the first stage it had not
+finished, instead of at patient_registration_step1. A session can also be
+parked on purpose (the /park desk command): it stays open in the journal
+while the desk serves the next patient. Finished sessions are marked as
+such, and reopening the journal compacts it to one line per session still
+open (older than max_age seconds: dropped).
+"""
+import json
+import os
+import time
+import uuid
+
+DEFAULT_MAX_AGE = 24 * 3600       # seconds an interrupted session can still be resumed
+
+# Collaborators (and the desk session id) attached to a desk object at run time, never journaled
+RUNTIME_ATTRIBUTES = frozenset({"emergency_sink", "event_bus", "metrics", "patient_lookup",
+                                "formulary", "session_id"})
+
+
+class SessionParked(Exception):
+    """Raised at a desk prompt to set the current session aside (see SessionCheckpoint.park)."""
+
+
+class SessionJournal:
+    """Append-only JSON-lines journal of desk sessions, keyed by session ID."""
+
+    def __init__(self, path, max_age=DEFAULT_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self._open = self._load()      # session -> {"stages", "state", "at"}
+        self._compact()
+        self._log = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        sessions = {}
+        if not os.path.exists(self.path):
+            return sessions
+        with open(self.path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue               # torn last line of a crashed process
+                if "end" in entry:
+                    sessions.pop(entry["session"], None)
+                    continue
+                session = sessions.setdefault(entry["session"], {"stages": 0, "state": {}})
+                session["stages"] = entry["stages"]
+                session["state"].update(entry["state"])
+                session["at"] = entry["at"]
+        oldest = time.time() - self.max_age
+        return {session_id: session for session_id, session in sessions.items()
+                if session["at"] >= oldest}
+
+    def _compact(self):
+        # One merged line per open session; written aside, then swapped in atomically
+        partial = self.path + ".tmp"
+        with open(partial, "w", encoding="utf-8") as journal:
+            for session_id, session in self._open.items():
+                journal.write(_line(session=session_id, **session))
+        os.replace(partial, self.path)
+
+    def __contains__(self, session_id):
+        return session_id in self._open
+
+    def open_sessions(self):
+        """IDs of the interrupted sessions that can be resumed, oldest first."""
+        return list(self._open)
+
+    def session(self, session_id=None):
+        """SessionCheckpoint of session_id (restored if it was interrupted), or of a new ID."""
+        if session_id is None:
+            session_id = uuid.uuid4().hex[:8]
+        return SessionCheckpoint(self, session_id, self._open.pop(session_id, None))
+
+    def reopen(self, session_id, stages, state):
+        """Lists a parked session among the open ones again, so this desk can resume it."""
+        self._open[session_id] = {"stages": stages, "state": state, "at": time.time()}
+
+    def write(self, **entry):
+        self._log.write(_line(at=time.time(), **entry))
+        # Flushed per stage: a crash loses at most the stage being answered
+        self._log.flush()
+
+    def close(self):
+        self._log.close()
+
+
+def _line(**entry):
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class SessionCheckpoint:
+    """The journal of one session: restore() once, save() after each stage, finish() at the end."""
+
+    def __init__(self, journal, session_id, saved=None):
+        self.journal = journal
+        self.session_id = session_id
+        self.stages = saved["stages"] if saved else 0
+        self._state = saved["state"] if saved else {}
+
+    @property
+    def resumed(self):
+        return self.stages > 0
+
+    def restore(self, app):
+        """Puts the journaled answers back on app; returns the number of stages already done."""
+        for attribute, value in self._state.items():
+            setattr(app, attribute, value)
+        return self.stages
+
+    def save(self, app):
+        """Journals one completed stage: only the answers it added or changed."""
+        changed = {}
+        for attribute, value in vars(app).items():
+            if attribute in RUNTIME_ATTRIBUTES:
+                continue
+            if attribute not in self._state or self._state[attribute] != value:
+                changed[attribute] = value
+        # Round-tripped so later in-place edits (symptom_selection) show up as changes
+        changed = json.loads(json.dumps(changed))
+        self._state.update(changed)
+        self.stages += 1
+        self.journal.write(session=self.session_id, stages=self.stages, state=changed)
+
+    def park(self):
+        """
+        Keeps the session open, resumable by its ID from this journal (or a
+        later one) at the first stage it had not finished.
+        """
+        self.journal.write(session=self.session_id, stages=self.stages, state={})
+        self.journal.reopen(self.session_id, self.stages, self._state)
+
+    def finish(self, status):
+        self.journal.write(session=self.session_id, end=status)
@@ -0,0 +1,694 @@
+"""
+Interactive front-desk stages.
+
+The 8-level class inheritance structure walks one patient through
+registration, red flags, pathology, regimen, side effects and clinical
+context at the terminal. All rules and menus come from onc.core and every menu
+question is declared once in onc.flow; this module only adds the
+input()/print() conversation around them.
+"""
+from collections import namedtuple
+
+from .core import (MAX_AGE, MENU_FIELDS, NO_CONCERNS, PATIENT_SYMPTOMS, RED_FLAG_CHECKLIST,
+                   is_alert_score, is_valid_age, is_valid_name, is_valid_sex)
+from .dosing import PER_M2, body_metrics, dose_check
+from .escalation import EmergencyEscalation, escalate
+from .events import (RED_FLAG, REGIMEN_VERIFIED, REGISTRATION_COMPLETE,
+                     REPORT_READY, SYMPTOM_ALERT, DashboardEvent)
+from .flow import FLOW, ask, desk_input
+from .record import PatientRecord
+from .report import render_text
+from .vocabulary import VisitReason
+
+# Stage attribute holding the display text of each flow field
+SELECTED_ATTRIBUTES = {
+    "visit_reason": "visit_reason_confirmation",
+    "pathology_type": "pathology_type_confirmation",
+    "pathology_stage": "pathology_stage_confirmation",
+    "treatment": "treatment_selected",
+    "medication": "medication_selected",
+    "dosage": "dosage_selected",
+    "frequency": "frequency_selected",
+    "body_area": "symptom_area_selected",
+    "symptom": "symptom_identification_selected",
+    "severity": "symptom_severity_selected",
+    "duration": "symptom_duration_selected",
+    "functional_status": "functional_status_selected",
+    "recent_tests": "recent_tests_selected",
+}
+
+# Follow-up visits can carry these over from the last stored record: field -> code attribute
+CARRIED_OVER = {
+    "pathology_type": "pathology_type_selection",
+    "pathology_stage": "pathology_stage_selection",
+    "treatment": "treatment_choice",
+    "medication": "medication_choice",
+    "dosage": "dosage_choice",
+    "frequency": "frequency_choice",
+}
+# Stages that only collect carried-over fields: skipped once the patient confirms them
+CARRIED_OVER_STAGES = ("Pathology_information", "add_treatment", "add_medication",
+                       "medication_dosage", "medication_frequency")
+
+
+# --- Registration state machine ---
+RegistrationField = namedtuple(
+    "RegistrationField", "field prompt convert valid recorded error invalid")
+
+REGISTRATION_FIELDS = {
+    "name": RegistrationField(
+        "name", "Welcome to our clinic. Please provide your full legal name as it appears on your ID:",
+        str.strip, is_valid_name,
+        "✅Name recorded successfully. Proceeding to demographic verification",
+        " ⛔️Invalid entry Please ensure you provide a full name using only alphabetic characters", None),
+    "age": RegistrationField(
+        "age", "Please enter your current age in years using numbers:", int, is_valid_age,
+        "✅Age verified. Eligibility criteria met for the next phase",
+        " ⛔️Data entry error. Please enter a valid numerical age (e.g., 45)",
+        f" ⛔️Data entry error. Please enter an age between 0 and {MAX_AGE} years."),
+    "sex": RegistrationField(
+        "sex", "Please indicate your sex (M/F/Other): ", lambda answer: answer.strip().lower(),
+        is_valid_sex, "✅ Patient sex documented. Initializing physical metrics module",
+        "⛔️ Selection not recognized. Please choose from M, F, or Other.", None),
+    "weight": RegistrationField(
+        "weight", "Enter your current weight in kilograms (kg) for dosage precision: ", float, None,
+        "✅Weight captured. Metric has been stored for clinical calculations",
+        "⛔️input error. Please enter weight as a number or decimal (e.g., 70.5).", None),
+    "height": RegistrationField(
+        "height", "Enter your height in meters (m) to complete your physical profile: ", float,
+        lambda height: height > 0, "✅ Height captured. Finalizing biometric analysis.",
+        "⛔️ Entry failed. Ensure height is entered in meters (e.g., 1.75).",
+        "⛔️ Entry failed. Height must be greater than 0."),
+}
+REGISTRATION_STATES = (*REGISTRATION_FIELDS, "confirm", "done")
+REGISTRATION_CORRECTIONS = dict(zip("12345", REGISTRATION_FIELDS))
+REGISTRATION_CORRECTION_PROMPT = (
+    "Which detail needs correcting? 1 Name | 2 Age | 3 Sex | 4 Weight | 5 Height "
+    "| A Re-enter everything: ")
+
+
+class _StageContext:
+    """Exposes a stage's answers to the flow templates under their field names."""
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __getitem__(self, key):
+        return getattr(self.stage, SELECTED_ATTRIBUTES.get(key, key))
+
+
+class Receptionnist:
+    # Dashboard EventBus (onc.events); None keeps the desk silent
+    event_bus = None
+    # onc.metrics.Metrics collecting re-prompts and declines; None disables counting
+    metrics = None
+    # Returning-patient lookup with last_visit(name, age), e.g. onc.store.PatientStore; None: every visit is new
+    patient_lookup = None
+    # Desk session this patient's dashboard events belong to; None: events go by name
+    session_id = None
+
+    # >>The entire sequence from first contact to the patient sitting in the waiting room .. for more information BMI stands for Body Mass Index
+    def __init__(self, name, age, sex, weight, height, BMI):
+        self.age = age
+        self.name = name
+        self.sex = sex
+        self.weight = weight
+        self.height = height
+        self.BMI = BMI
+        # Registration state machine: next REGISTRATION_STATES entry to run
+        self.registration_state = "name"
+        self.registration_editing = False
+        # Stages answered from the last visit instead of asked (see CARRIED_OVER_STAGES)
+        self.prefilled_stages = []
+
+    @property
+    def derived_metrics(self):
+        """BMI, BSA and ideal/adjusted body weight, recomputed only when weight or height change."""
+        return body_metrics(self.weight, self.height, self.sex)
+
+    def publish_event(self, kind, **data):
+        """Sends a typed event about this patient to the dashboard, when one is attached."""
+        if self.event_bus is not None:
+            self.event_bus.publish(DashboardEvent(kind, self.name, data, session=self.session_id))
+
+    def last_visit(self):
+        """This patient's most recent stored record (same name and a consistent age), or None."""
+        if self.patient_lookup is None or not self.name:
+            return None
+        return self.patient_lookup.last_visit(self.name, self.age)
+
+    def count_invalid(self):
+        if self.metrics is not None:
+            self.metrics.invalid()
+
+    def count_decline(self):
+        if self.metrics is not None:
+            self.metrics.declined()
+
+    def patient_registration_step1(self):
+        # """Captures and validates basic identity and demographic data."""
+        self.run_registration(until="weight")
+
+    def patient_registration_step2(self):
+        # """Captures physical metrics required for clinical BMI and dosage calculations."""
+        self.run_registration(until="confirm")
+
+    def patient_registration_step3(self):
+        # Calculates BMI and performs a final data accuracy confirmation.
+        self.run_registration(until="done")
+
+    def run_registration(self, until="done"):
+        """
+        Advances the registration state machine up to the `until` state.
+        The state lives on the patient (registration_state), so a later call
+        resumes where the last one stopped, and a declined confirmation loops
+        back to the one field being corrected instead of recursing.
+        """
+        while REGISTRATION_STATES.index(self.registration_state) < REGISTRATION_STATES.index(until):
+            state = self.registration_state
+            if state == "confirm":
+                self.registration_state = self._confirm_registration()
+            else:
+                self._collect_registration_field(REGISTRATION_FIELDS[state])
+                if self.registration_editing:
+                    # Single-field correction: straight back to the confirmation
+                    self.registration_editing = False
+                    self.registration_state = "confirm"
+                elif state == "age" and self._prefill_registration():
+                    # Returning patient (name and age match a visit on file):
+                    # straight to the review of the details on file
+                    self.registration_state = "confirm"
+                else:
+                    self.registration_state = REGISTRATION_STATES[REGISTRATION_STATES.index(state) + 1]
+
+    def _collect_registration_field(self, question):
+        while True:
+            try:
+                value = question.convert(desk_input(question.prompt))
+            except ValueError:
+                self.count_invalid()
+                print(question.error)
+                continue
+            if question.valid is not None and not question.valid(value):
+                self.count_invalid()
+                print(question.invalid or question.error)
+                continue
+            setattr(self, question.field, value)
+            print(question.recorded)
+            return
+
+    def _prefill_registration(self):
+        last = self.last_visit()
+        if last is None:
+            return False
+        reuse = desk_input(
+            f"Welcome back, {last.name}. Details on file: sex {last.sex.upper()}, "
+            f"{last.weight} kg, {last.height} m. Use them? (Y/N): ").strip().upper()
+        if reuse not in ("Y", "YES"):
+            return False
+        self.sex, self.weight, self.height = last.sex, last.weight, last.height
+        print("✅ Details pre-filled from your last visit. Correct anything that changed at the review.")
+        return True
+
+    def _confirm_registration(self):
+        # Calculate BMI using the standard formula (Weight / Height^2)
+        # We round to 1 decimal place for professional medical reporting
+        if self.height > 0:
+            self.BMI = self.derived_metrics.bmi
+            print(
+                f"Based on the information provided, your BMI is: {round(self.BMI, 1)}")
+
+        # Final Verification Gate
+        confirmation = desk_input(
+            "Is all the information provided correct? (Yes/No): ").strip().lower()
+
+        if confirmation in ["yes", "y"]:
+            print("Registration Finalized ✅. Your profile has been successfully updated.")
+            # Signal that registration is complete
+            self.publish_event(REGISTRATION_COMPLETE, age=self.age, sex=self.sex,
+                               BMI=round(self.BMI, 1))
+            return "done"
+        # notifying the user about the failure
+        self.count_decline()
+        print("Validation Declined ⛔️. Basic registration incomplete.")
+        while True:
+            correction = desk_input(REGISTRATION_CORRECTION_PROMPT).strip().upper()
+            if correction == "A":
+                # Full restart, without growing the call stack
+                return "name"
+            if correction in REGISTRATION_CORRECTIONS:
+                self.registration_editing = True
+                return REGISTRATION_CORRECTIONS[correction]
+            self.count_invalid()
+            print("⛔️ Please enter a number from 1 to 5, or 'A' to re-enter everything.")
+
+
+class Oncology_Clinical(Receptionnist):
+    def __init__(self, name, age, sex, weight, height, BMI):
+        super().__init__(name, age, sex, weight, height, BMI)
+        self.name = name
+
+    def verify_consultation_type(self):
+        # Declared once in onc.flow: menu, validation and messages
+        self.patient_choice, self.visit_reason_confirmation = ask(
+            FLOW["visit_reason"], _StageContext(self), self.metrics)
+        if self.patient_choice == VisitReason.FOLLOW_UP:
+            self.carry_over_regimen()
+
+    def carry_over_regimen(self):
+        """
+        Follow-up fast path: offers the diagnosis and regimen of the last
+        stored visit; once confirmed, their stages are skipped.
+        """
+        last = self.last_visit()
+        if last is None or last.status != "complete":
+            return
+        print("Your diagnosis and regimen on file from your last visit:")
+        print(f"• Pathology:  {last.display('pathology_type')} - {last.display('pathology_stage')}")
+        print(f"• Treatment:  {last.display('treatment')}")
+        print(f"• Medication: {last.display('medication')}")
+        print(f"• Dosage:     {last.display('dosage')}")
+        print(f"• Frequency:  {last.display('frequency')}")
+        current = desk_input("Is all of this still current? (Y/N): ").strip().upper()
+        if current not in ("Y", "YES"):
+            return
+        for field, attribute in CARRIED_OVER.items():
+            setattr(self, attribute, getattr(last, field))
+            setattr(self, SELECTED_ATTRIBUTES[field], last.display(field))
+        self.prefilled_stages = list(CARRIED_OVER_STAGES)
+        print("✅ Diagnosis and regimen carried over. Only today's symptoms will be asked.")
+        # Same dose, possibly a new weight: screen it again
+        self.check_dosage()
+
+    def Pathology_information(self):
+        """
+        Manages the collection of specific oncological data.
+        This method captures both the cancer category and the clinical stage,
+        ensuring both are validated before finalizing the patient profile.
+        """
+        context = _StageContext(self)
+        # --- SECTION 1: Category Selection ---
+        self.pathology_type_selection, self.pathology_type_confirmation = ask(
+            FLOW["pathology_type"], context, self.metrics)
+        # --- SECTION 2: Staging Verification ---
+        self.pathology_stage_selection, self.pathology_stage_confirmation = ask(
+            FLOW["pathology_stage"], context, self.metrics)
+        # Final Summary: Integrates data from both sections into a final string output
+        print(
+            f"Dear {self.name} Your Clinical Profile Were Generated:{self.pathology_type_confirmation} - {self.pathology_stage_confirmation}")
+        print(
+            "All diagnostic data has been successfully validated. Task 2 complete")
+
+
+class Symptom_Severity_Assessment(Oncology_Clinical):
+    def __init__(self, name, age, sex, weight, height, BMI):
+        super().__init__(name, age, sex, weight, height, BMI)
+
+    def assess_symptom(self):
+        """
+        Captures patient-reported symptom intensity using a 0-10 scale.
+        Includes automated logic for critical value alerts (scores >= 8).
+        """
+        # Centralized error message for non-integer or out-of-range inputs
+        error = "⛔️ Entry not recognized. To ensure your doctor receives accurate data, please provide a numeric digit."
+        # Dictionary to store session data for clinical analysis or database entry
+        self.symptom_selection = {}
+        # Iterates through each symptom to ensure a complete clinical picture
+        for self.selection in PATIENT_SYMPTOMS:
+            while True:
+                try:
+                    print(f"\n Assesssing:{self.selection}")
+                    self.score = int(desk_input(
+                        f"How would you describe your {self.selection} today? Please enter a number from 0 (not present) to 10 (extremely severe):"))
+                    # Range validation to maintain data integrity
+                    if 0 <= self.score <= 10:
+                        self.symptom_selection[self.selection] = self.score
+                        # Critical Threshold Logic: High scores trigger immediate notification flags
+                        if is_alert_score(self.score):
+                            self.publish_event(SYMPTOM_ALERT, symptom=self.selection.strip(),
+                                               score=self.score)
+                            print(
+                                f"⚠️ URGENT ALERT: Dear {self.name}, a score of {self.score} for {self.selection} has triggered an emergency notification. This information has been directed to your doctor immediately. Please seek urgent care.")
+
+                            break  # Exits while loop to move to next symptom
+                        else:
+                            print(
+                                f"✅ Information saved. Your report for {self.selection} of {self.score} has been forwarded to your clinical record for review.")
+
+                            break  # Exits while loop to move to next symptom
+
+                    else:
+                        self.count_invalid()
+                        print(error)
+                except ValueError:
+                    self.count_invalid()
+                    print(error)
+        print("\n✅ Assessment complete. All symptom variables have been successfully validated and stored in the clinical dictionary.")
+
+
+class Clinical_Checking(Symptom_Severity_Assessment):
+    # Where emergency events go (QueueSink, FileSink, CallbackSink...); None only flags the patient
+    emergency_sink = None
+
+    def __init__(self, name, age, sex, weight, height, BMI):
+        super().__init__(name, age, sex, weight, height, BMI)
+        # Checklist number (1-7) answered 'Y'; 0 while the patient is cleared
+        self.red_flag_triggered = 0
+     # Triage protocol: Designed to intercept life-threatening complications before general assessment.
+
+    def clinical_red_flag(self):
+        print("--- CRITICAL SAFETY CHECK ---")
+        print("Please confirm if you are experiencing any of the following emergency symptoms.")
+        for number, self.red_flag in enumerate(RED_FLAG_CHECKLIST, start=1):
+            while True:
+                # Normalization: the validation logic.
+                response = desk_input(
+                    f" Are you currently experiencing {self.red_flag} ? Please enter 'Y' for Yes or 'N' for No:").strip().upper()
+                if response == "Y":
+                    self.red_flag_triggered = number
+                    event = escalate(self.emergency_sink, self.name, number)
+                    self.publish_event(RED_FLAG, red_flag=number,
+                                       description=event.description)
+                    print("-- ⚠️ EMERGENCY PROTOCOL ACTIVATED --")
+                    print(f" Dear {self.name} , your report of {self.red_flag} has been directed to your doctor's emergency dashboard. Please stop this assessment and proceed to the nearest ER immediately.")
+                    print(
+                        "Information directed to your doctor. Please STOP and go to the ER now....")
+                    # Critical Safety Stop: ends this patient's session only; the desk keeps serving the queue.
+                    raise EmergencyEscalation(event)
+                elif response == "N":
+                    print(
+                        f"✅ Negative for {self.red_flag}. Continuing safety check...")
+                    break
+                else:
+                    self.count_invalid()
+                    print(
+                        "⛔️ ENTRY ERROR: To ensure your safety and direct your data correctly, please use 'Y' or 'N' only.")
+
+
+class Medical_Regimen(Clinical_Checking):
+    """
+     Purpose: Manages the collection and verification of oncological treatments.
+    It links treatment types to specific medications, dosages, and schedules.
+    """
+
+    # onc.formulary.FormularyIndex checking each regimen; None skips the pharmacy check
+    formulary = None
+
+    def __init__(self, name, age, sex, weight, height, BMI):
+        super().__init__(name, age, sex, weight, height, BMI)
+
+    def add_treatment(self):
+        self.treatment_choice, self.treatment_selected = ask(
+            FLOW["treatment"], _StageContext(self), self.metrics)
+
+    def add_medication(self):
+        self.medication_choice, self.medication_selected = ask(
+            FLOW["medication"], _StageContext(self), self.metrics)
+
+    def medication_dosage(self):
+        self.dosage_choice, self.dosage_selected = ask(
+            FLOW["dosage"], _StageContext(self), self.metrics)
+        self.check_dosage()
+
+    def check_dosage(self):
+        # Weight-based screening of the selected dose (onc.dosing); flat-dosed groups pass silently
+        check = dose_check(self.medication_choice, self.dosage_choice,
+                           self.weight, self.height, self.sex)
+        if check is not None and not check.within_limit:
+            size = (f"BSA {self.derived_metrics.bsa_mosteller:.2f} m²" if check.basis == PER_M2
+                    else f"{self.weight} kg")
+            print(f"⚠️ Dose review: {self.dosage_selected} is {check.dose_per_unit:.1f} {check.basis} "
+                  f"for {size}, above the {check.limit:g} {check.basis} ceiling. "
+                  "Flagged for pharmacist review.")
+
+    def medication_frequency(self):
+        self.frequency_choice, self.frequency_selected = ask(
+            FLOW["frequency"], _StageContext(self), self.metrics)
+
+    def regimen_issues(self):
+        """Formulary issues of the regimen entered (category, dose, frequency, interactions)."""
+        if self.formulary is None:
+            return ()
+        other = (self.medication_selected
+                 if self.medication_choice == MENU_FIELDS["medication"][1] else None)
+        return self.formulary.check(self.treatment_choice, self.medication_choice,
+                                    self.dosage_choice, self.frequency_choice, other)
+
+    def final_regimen_verification(self):
+        while True:
+            print(f"\nDear {self.name},")
+            print("Here is the summary of the regimen details you just completed:")
+            print("-" * 40)
+            print(f"• Treatment Category: {self.treatment_selected}")
+            print(f"• Medication Name:    {self.medication_selected}")
+            print(f"• Prescribed Dosage:  {self.dosage_selected}")
+            print(f"• Intake Frequency:   {self.frequency_selected}")
+            print("-" * 40)
+            # Checked on every pass: a re-entered regimen is never committed unchecked
+            for issue in self.regimen_issues():
+                print(f"⚠️ Pharmacy check: {issue.message}")
+            if self._confirm_regimen():
+                return
+            #  Safety Loop: Forces a re-entry of all data to ensure medical accuracy,
+            #  then the new regimen is checked and shown for verification again
+            self.add_treatment()
+            self.add_medication()
+            self.medication_dosage()
+            self.medication_frequency()
+
+    def _confirm_regimen(self):
+        while True:
+            verify = desk_input(
+                "Please take your time to verify if everything in this summary is correct. Reply 'Y' for Yes or 'N' for No: ").strip().upper()
+
+            if verify == 'Y':
+                self.publish_event(REGIMEN_VERIFIED, treatment=self.treatment_selected,
+                                   medication=self.medication_selected,
+                                   dosage=self.dosage_selected,
+                                   frequency=self.frequency_selected)
+                print(
+                    "✅ Thank you. Your information is verified. We can now continue to the next task.")
+                return True
+
+            elif verify == 'N':
+                self.count_decline()
+                print(
+                    "⚠️ Profile Redirected:⚠️ Please try Again..")
+                return False
+
+            else:
+                self.count_invalid()
+                print("⛔️Invalid input. Please enter 'y' or 'n'.")
+
+
+class Side_Effects_Tracker(Medical_Regimen):
+    def __init__(self, name, age, sex, weight, height, BMI):
+        super().__init__(name, age, sex, weight, height, BMI)
+
+    def symptom_localization(self):
+        """
+        Step 1: Identify the body region affected.
+        Either a standard checklist selection or a manual 'Other' description.
+        """
+        self.symptom_area_choice, self.symptom_area_selected = ask(
+            FLOW["body_area"], _StageContext(self), self.metrics)
+
+    def symptom_identification(self):
+        """
+        Step 2: Identify the specific symptom within the chosen body area.
+        The prompt dynamically references the body area from Step 1.
+        """
+        self.symptom_identification_choice, self.symptom_identification_selected = ask(
+            FLOW["symptom"], _StageContext(self), self.metrics)
+
+    def assess_severity(self):
+        """
+        Step 3: Grade the intensity of the reported symptom.
+        Uses the CTCAE-based scale (Grades 1-4) or a manual description for 'Other'.
+        """
+        self.symptom_severity_choice, self.symptom_severity_selected = ask(
+            FLOW["severity"], _StageContext(self), self.metrics)
+
+    def duration_checklist(self):
+        """
+        Step 4: Record the onset and timeframe of the symptom.
+        Captures either a range from the checklist or a specific pattern.
+        """
+        self.symptom_duration_choice, self.symptom_duration_selected = ask(
+            FLOW["duration"], _StageContext(self), self.metrics)
+
+    def verify_report(self):
+        """
+        Step 5: Final Summary.
+        Displays all collected symptom data to the user for final review.
+        """
+        print(f"Dear {self.name}, your report is ready.")
+        # Pulls identification and localization from Methods 1 & 2
+        print(
+            f"Summary: {self.symptom_identification_selected} affecting the {self.symptom_area_selected}.")
+        # Pulls severity and duration from Methods 3 & 4
+        print(f"Severity: {self.symptom_severity_selected}")
+        print(f"Duration: {self.symptom_duration_selected}")
+
+
+class ClinicalContext(Side_Effects_Tracker):
+    def __init__(self, name, age, sex, weight, height, BMI):
+        super().__init__(name, age, sex, weight, height, BMI)
+
+    def test_verification(self):
+        """
+        Identifies recent medical tests to provide clinical context.
+        Manual 'Other' entries are kept apart from the predefined categories.
+        """
+        self.recent_tests_choice, self.recent_tests_selected = ask(
+            FLOW["recent_tests"], _StageContext(self), self.metrics)
+
+    def patient_concern(self):
+        """Captures patient concerns by validating narrative length or an explicit skip ('N')."""
+
+        print("--- Patient Advocacy: Personal Concerns ---")
+
+        error = "⛔️ INPUT TOO SHORT >> Try Again: To ensure your doctor understands your perspective, please provide a bit more detail (at least 5 characters), or type 'N' to skip."
+        while True:
+            try:
+                clinical_staff_followup = "We want to ensure your voice is a central part of this report. The following statement will be shared directly with your doctor to highlight what matters most to you."
+                print(f'Dear {self.name} , {clinical_staff_followup}')
+                self.patient_concern_statement = desk_input(
+                    f"Regarding your {self.symptom_identification_selected}, what is your primary concern or question for the medical team? (Please write 1-2 sentences, or type 'N for None ' if you have no specific questions): ")
+                self.patient_concern_review = desk_input(
+                    f"You have expressed: '{self.patient_concern_statement}'. Should we include this exact wording in the final report for your doctor? Please enter 'Y' for Yes or 'N' for No: ").strip().upper()
+                no_concerns = ("N").strip().upper()
+                # Begins validation only if text is present and the user confirms with 'Y'.
+                if len(self.patient_concern_statement) >= 1 and self.patient_concern_review == "Y":
+                    # Path A: Standardizes the report if the user explicitly skips by typing 'N'.
+                    if self.patient_concern_statement.upper() == no_concerns:
+
+                        self.patient_concern_statement = NO_CONCERNS
+                        print(
+                            "✅ Noted:Patient reports no specific concerns at this time.")
+                        break
+                        # Path B: Accepts the narrative if it meets the minimum clinical detail requirement.
+                    elif len(self.patient_concern_statement) >= 5:
+                        print(
+                            "✅ Recorded: Your personal concern has been added to the physician's summary.")
+                        break
+                    else:
+                        self.count_invalid()
+                        print(
+                            # Error Handling: Triggered if input is 1-4 characters (too short for medical context).
+                            error)
+
+                else:
+                    self.count_decline()
+                    print(
+                        "Entry cleared. Let's try again. Please rephrase your concern or question!")
+            except ValueError:
+                self.count_invalid()
+                print(error)
+
+    def functional_status(self):
+        """Validates functional capability levels with nested confirmation to ensure medical record accuracy."""
+        self.functional_status_choice, self.functional_status_selected = ask(
+            FLOW["functional_status"], _StageContext(self), self.metrics)
+
+
+class Clinical_Summary(ClinicalContext):
+    """
+    Consolidates data from all 7 specialized child classes into a 
+    structured report formatted for physician-patient consultation.
+    """
+
+    def __init__(self, name, age, sex, weight, height, BMI):
+        super().__init__(name, age, sex, weight, height, BMI)
+
+    def to_record(self):
+        """
+        Packs the clinical fields gathered by every stage into a compact
+        PatientRecord, the same record type the headless engine produces.
+        """
+        if self.red_flag_triggered:
+            # Emergency sessions stop at the safety check: only registration is known
+            return PatientRecord(
+                name=self.name, age=self.age, sex=self.sex,
+                weight=self.weight, height=self.height,
+                status="emergency", red_flag=self.red_flag_triggered)
+        codes = {"visit_reason": self.patient_choice,
+                 "pathology_type": self.pathology_type_selection,
+                 "pathology_stage": self.pathology_stage_selection,
+                 "treatment": self.treatment_choice,
+                 "medication": self.medication_choice,
+                 "dosage": self.dosage_choice,
+                 "frequency": self.frequency_choice,
+                 "body_area": self.symptom_area_choice,
+                 "symptom": self.symptom_identification_choice,
+                 "severity": getattr(self, "symptom_severity_choice", 0),
+                 "duration": getattr(self, "symptom_duration_choice", 0),
+                 "functional_status": self.functional_status_choice,
+                 "recent_tests": self.recent_tests_choice}
+        other = {field: getattr(self, attribute)
+                 for field, attribute in SELECTED_ATTRIBUTES.items()
+                 if field in codes and codes[field] and codes[field] == MENU_FIELDS[field][1]}
+        return PatientRecord(
+            name=self.name, age=self.age, sex=self.sex,
+            weight=self.weight, height=self.height,
+            symptom_scores=bytes(self.symptom_selection.values()),
+            patient_concern=self.patient_concern_statement,
+            other=other or None, **codes)
+
+    def generate_professional_report(self):
+        """
+        Aggregates and prints the final report using the SOAP (Subjective, 
+        Objective, Assessment, Plan) clinical documentation standard.
+        """
+        # Rendered into one buffer: a single terminal write per report
+        print(render_text(self.to_record()))
+        self.publish_event(REPORT_READY, status="complete")
+
+
+# Stage methods in the order the desk calls them; a red flag ends the session early
+DESK_STAGES = (
+    # --- PHASE 1: Administrative ---
+    "patient_registration_step1",
+    "patient_registration_step2",
+    "patient_registration_step3",
+    # --- PHASE 2: Triage & Background ---
+    "clinical_red_flag",            # Safety check
+    "verify_consultation_type",     # Oncology branch
+    "Pathology_information",        # Diagnostic branch
+    # --- PHASE 3:  Treatment & Symptoms  ---
+    # (Medications, Dosages, Symptom Localization/ID)
+    "add_treatment",
+    "add_medication",
+    "medication_dosage",
+    "medication_frequency",
+    "symptom_localization",
+    "symptom_identification",
+    "assess_symptom",
+    # Verification
+    "final_regimen_verification",
+    # --- PHASE 4: Clinical Context ---
+    "functional_status",
+    "test_verification",
+    "patient_concern",
+    # --- PHASE 5: Output ---
+    "generate_professional_report",
+)
+
+
+def run_session(app, metrics=None, checkpoint=None):
+    """
+    Walks one patient through every stage; a red flag ends the session early.
+    With an onc.checkpoint.SessionCheckpoint, the stages it already holds are
+    restored instead of asked again and each completed stage is journaled.
+    Stages pre-filled from a returning patient's last visit are skipped.
+    """
+    done = checkpoint.restore(app) if checkpoint is not None else 0
+    for stage in DESK_STAGES[done:]:
+        if stage in app.prefilled_stages:
+            pass                    # answered from the patient's last visit
+        elif metrics is None:
+            getattr(app, stage)()
+        else:
+            metrics.timed(stage, getattr(app, stage))
+        if checkpoint is not None:
+            checkpoint.save(app)
@@ -0,0 +1,217 @@
+"""
+Importable clinical core of the triage system.
+
+Holds the menus, validation rules, BMI, red-flag and symptom scoring shared
+by the interactive desk (onc.clinical), the headless engine (onc.engine) and
+any worker that imports the package. Importing this
+module has no side effects: nothing is read from stdin or printed.
+"""
+
+# --- Clinical Menus ---
+# Shared by the interactive stages and the headless batch engine, so both
+# apply exactly the same option codes and display strings.
+
+# Dictionary mapping numeric codes to clinical visit types for easy updates
+VISIT_REASONS = {1: "New Diagnosis",
+                 2: "Follow-up",
+                 3: "Treatment sessions",
+                 4: "Side Effects",
+                 5: "Results Review"}
+
+PATHOLOGY_TYPES = {
+    1: "Carcinoma (Covers Breast, Lung, Prostate, Colon",
+    2: "Sarcoma (Bone and soft tissue)",
+    3: "Lymphoma (Lymph system)",
+    4: "Leukemia (Blood cancers)",
+    5: "Melanoma (Skin cancer)",
+    6: "Neuroendocrine (Nervous/Endocrine system)",
+    7: "Other / Rare Tumor"
+}
+
+PATHOLOGY_STAGES = {1: "Stage I", 2: "Stage II",
+                    3: "Stage III", 4: "Stage IV"}
+
+# Clinical variables list; can be modified to include specialty-specific symptoms
+PATIENT_SYMPTOMS = ["Pain", "Fever", "Fatigue",
+                    "Nausea/Vomiting", "Shortness of breath ", "Bleeding"]
+# Critical Threshold: symptom scores at or above this value trigger an urgent alert
+SYMPTOM_ALERT_THRESHOLD = 8
+
+# Scalable Checklist: New emergency criteria can be added here without modifying the loop logic.
+RED_FLAG_CHECKLIST = ["1. Neutropenic Fever:Do you have a fever of 100.4°F (38°C) or higher?",  "2. Respiratory Distress: Are you experiencing sudden shortness of breath or sharp chest pain?:", " 3. Neurological Change:Have you noticed any new confusion, dizziness, or sudden loss of balance ?: ", " 4. Hemostatic Failure: Do you have any active bleeding that won't stop or are you coughing up blood?",
+                      " 5. Bowel Obstruction:Are you experiencing persistent vomiting or an inability to pass stool for over 24 hours?", " 6. Neuropathy/Cord Compression: Do you have any new numbness, tingling, or sudden weakness in your legs?", "7.Severe Dehydration:Are you unable to keep any liquids down or feeling extremely faint when standing?"]
+
+# mapping for standardized clinical categories
+TREATMENT_CHECKLIST = {
+    1: "chemotherapy",
+    2: "Radiation",
+    3: "Immunotherapy",
+    4: "Hormonal",
+    5: "Targeted Therapy",
+    6: "Supportive Care",
+    7: "Other"
+}
+
+MEDICATION_CHECKLIST = {1: "Cisplatin, Paclitaxel, 5-Fluorouracil, Doxorubicin, Cyclophosphamide",
+                        2: "Pembrolizumab (Keytruda), Nivolumab (Opdivo), Ipilimumab, Atezolizumab",
+                        3: "Dexamethasone, Amifostine, Silver Sulfadiazine, Ondansetron ",
+                        4: "Tamoxifen, Letrozole, Anastrozole, Leuprolide, Goserelin",
+                        5: "Trastuzumab, Erlotinib, Imatinib, Bevacizumab, Rituximab",
+                        6: "Lorazepam, Prochlorperazine, Morphine, Gabapentin, Metoclopramide",
+                        7: "Other"
+                        }
+
+DOSAGE_LIST = {
+    1: "5 mg",
+    2: "10 mg",
+    3: "25 mg",
+    4: "50 mg",
+    5: "100 mg",
+    6: "250 mg",
+    7: "500 mg",
+    8: "Other"
+}
+
+MEDICATION_FREQUENCY_LIST = {
+    1: "Once daily (Morning)",
+    2: "Once daily (Night)",
+    3: "Twice daily (Every 12 hours)",
+    4: "Three times daily (Every 8 hours)",
+    5: "Four times daily (Every 6 hours)",
+    6: "Weekly",
+    7: "As needed (PRN) ",
+    8: "Other"
+}
+
+BODY_AREA_CHECKLIST = {
+    1: "Head & Neck (Headaches, dizziness, mouth issues)",
+    2: "Chest & Respiratory (Breathing, heart, or lungs)",
+    3: "Gastrointestinal (Stomach, digestion, or bowel)",
+    4: "Extremities (Arms, legs, joints, or neuropathy)",
+    5: "Systemic (Full body issues like fatigue or fever)",
+    6: "Skin & Integumentary (Rashes, itching, or injection site)",
+    7: "Other"
+}
+
+SYMPTOM_IDENTIFICATION_CHECKLIST = {
+    1: "Head & Neck	: Headaches, Dizziness, Mouth Sores, Sore Throat, Difficulty Swallowing",
+    2: "Chest:Shortness of Breath, Chest Pain, Coughing, Palpitations",
+    3: "Gastro: Nausea, Vomiting, Diarrhea, Constipation, Abdominal Pain",
+    4: "Extremities: Numbness/Tingling, Joint Pain, Swelling (Edema), Muscle Weakness",
+    5: "Systemic : 	Fatigue, Fever, Chills, Night Sweats, Weight Loss",
+    6: " Skin : Rash, Dryness, Redness, Itching, Hand-Foot Syndrome",
+    7: "Other"
+}
+
+SEVERITY_SCALE = {
+    1: "Grade 1: Mild (Asymptomatic or mild symptoms; intervention not indicated)",
+    2: "Grade 2: Moderate (Minimal, local, or non-invasive intervention indicated)",
+    3: "Grade 3: Severe (Severe or medically significant but not immediately life-threatening)",
+    4: "Grade 4: Critical (Life-threatening consequences; urgent intervention indicated)",
+    5: "Other"
+}
+
+DURATION_CHECKLIST = {
+    1: "Less than 24 hours",
+    2: "1 to 3 days",
+    3: "4 to 7 days (1 week)",
+    4: "1 to 2 weeks",
+    5: "More than 2 weeks",
+    6: "Other (Intermittent or specific timeframe)"
+}
+
+RECENT_TESTS_CHECKLIST = {
+    1: "Laboratory Work (Blood, Urine, or Stool Analysis)",
+    2: "Diagnostic Imaging (X-Ray, CT, MRI, or Ultrasound)",
+    3: "Pathology (Biopsy or Tissue Sample)",
+    4: "Functional Studies (EKG, ECG, or Stress Test)",
+    5: "None / No recent tests performed",
+    6: "Other"
+}
+
+FUNCTIONAL_STATUS_OPTION = {
+    1:	"Fully Independent (No impact on daily activities or work)",
+    2:	"Modified Independent (Can perform tasks but with pain or extra effort)",
+    3:	"Partially Restricted (Requires help with some tasks like lifting or stairs)",
+    4:	"Severely Restricted (Unable to perform basic daily activities)",
+    5: "Other"
+}
+
+# Front Desk Coordinator
+
+# Record field -> (menu, code of its 'Other' free-text option or None)
+MENU_FIELDS = {
+    "visit_reason": (VISIT_REASONS, None),
+    "pathology_type": (PATHOLOGY_TYPES, 7),
+    "pathology_stage": (PATHOLOGY_STAGES, None),
+    "treatment": (TREATMENT_CHECKLIST, 7),
+    "medication": (MEDICATION_CHECKLIST, 7),
+    "dosage": (DOSAGE_LIST, 8),
+    "frequency": (MEDICATION_FREQUENCY_LIST, 8),
+    "body_area": (BODY_AREA_CHECKLIST, 7),
+    "symptom": (SYMPTOM_IDENTIFICATION_CHECKLIST, 7),
+    "severity": (SEVERITY_SCALE, 5),
+    "duration": (DURATION_CHECKLIST, 6),
+    "functional_status": (FUNCTIONAL_STATUS_OPTION, 5),
+    "recent_tests": (RECENT_TESTS_CHECKLIST, 6),
+}
+
+ACCEPTED_SEX = ["m", "f", "other", "male", "female"]
+MAX_AGE = 130      # oldest plausible age in years; also keeps ages storable in 16 bits
+NO_CONCERNS = "Patient reports no specific concerns at this time."
+
+
+# --- Validation & Scoring ---
+
+def is_valid_name(name):
+    """Full legal name: alphabetic characters and spaces only, not empty."""
+    return name.replace(" ", "").isalpha() and len(name) > 0
+
+
+def is_valid_age(age):
+    """Age in whole years, from 0 (infants) to MAX_AGE."""
+    return 0 <= age <= MAX_AGE
+
+
+def is_valid_sex(sex):
+    """Sex answer, already stripped and lower-cased, against accepted categories."""
+    return sex in ACCEPTED_SEX
+
+
+def compute_bmi(weight, height):
+    """Body Mass Index using the standard formula (Weight / Height^2)."""
+    return weight / (height ** 2)
+
+
+def is_alert_score(score):
+    """True when a 0-10 symptom score crosses the urgent alert threshold."""
+    return score >= SYMPTOM_ALERT_THRESHOLD
+
+
+def symptom_alerts(symptom_selection):
+    """Symptoms of a {symptom: score} assessment that triggered an urgent alert."""
+    return [symptom for symptom, score in symptom_selection.items()
+            if score >= SYMPTOM_ALERT_THRESHOLD]
+
+
+def first_red_flag(responses):
+    """
+    Returns the first checklist item answered 'Y' in a sequence of Y/N answers
+    (one per RED_FLAG_CHECKLIST entry), or None when every answer is 'N'.
+    """
+    for red_flag, response in zip(RED_FLAG_CHECKLIST, responses):
+        if response == "Y":
+            return red_flag
+    return None
+
+
+def normalize_concern(statement):
+    """
+    Applies the patient-concern rules: 'N' becomes the standard no-concern
+    sentence, 5+ characters are kept as written, anything shorter returns None.
+    """
+    if statement.upper() == "N":
+        return NO_CONCERNS
+    if len(statement) >= 5:
+        return statement
+    return None
@@ -0,0 +1,119 @@
+"""
+Derived body metrics and weight-based dose checks.
+
+body_metrics() turns the registration weight (kg), height (m) and sex into
+BMI, body-surface area (Mosteller and DuBois), ideal body weight (Devine) and
+adjusted body weight, and dose_check() compares a medication_dosage
+selection against the per-kg or per-m² ceiling of its medication group.
+Results are memoised on their inputs, so a patient's metrics are computed
+once and only recomputed when the weight or height changes. The whole-census
+variants live in onc.vectorized (NumPy).
+
+The ceilings are screening thresholds that send a dose to pharmacist review,
+not prescribing rules.
+"""
+import math
+from functools import lru_cache
+from typing import NamedTuple
+
+from .core import DOSAGE_LIST, compute_bmi
+
+INCH = 0.0254                      # metres
+DEVINE_BASE = {"m": 50.0, "male": 50.0}   # kg at 5 ft; everyone else 45.5 kg
+DEVINE_BASE_OTHER = 45.5
+DEVINE_PER_INCH = 2.3              # kg per inch over 5 ft
+ADJUSTED_WEIGHT_FACTOR = 0.4       # AdjBW = IBW + 0.4 * (actual - IBW)
+
+# Dose basis of a ceiling
+PER_KG = "mg/kg"
+PER_M2 = "mg/m²"
+
+# MEDICATION_CHECKLIST code -> (basis, highest single dose per unit of basis).
+# Groups dosed flat (supportive, hormonal, symptom control) are not checked.
+DOSE_LIMITS = {
+    1: (PER_M2, 75.0),     # cytotoxics: doxorubicin/cisplatin ceiling, tightest of the group
+    2: (PER_KG, 10.0),     # checkpoint inhibitors: ipilimumab high-dose ceiling
+    5: (PER_KG, 15.0),     # targeted agents: bevacizumab ceiling
+}
+
+CACHE_SIZE = 4096
+
+
+class BodyMetrics(NamedTuple):
+    bmi: float
+    bsa_mosteller: float            # m²
+    bsa_dubois: float               # m²
+    ideal_body_weight: float        # kg
+    adjusted_body_weight: float     # kg; the actual weight when not above IBW
+
+
+class DoseCheck(NamedTuple):
+    medication: int
+    dose_mg: float
+    basis: str                      # PER_KG or PER_M2
+    dose_per_unit: float            # mg/kg or mg/m² of this patient
+    limit: float
+    within_limit: bool
+
+
+def bsa_mosteller(weight, height):
+    """Body-surface area in m²: sqrt(height_cm * weight_kg / 3600)."""
+    if weight <= 0 or height <= 0:
+        return 0.0
+    return math.sqrt(height * 100 * weight / 3600)
+
+
+def bsa_dubois(weight, height):
+    """Body-surface area in m²: 0.007184 * weight_kg^0.425 * height_cm^0.725."""
+    if weight <= 0 or height <= 0:
+        return 0.0
+    return 0.007184 * weight ** 0.425 * (height * 100) ** 0.725
+
+
+def ideal_body_weight(height, sex):
+    """Devine ideal body weight in kg; never below zero for short patients."""
+    inches_over_five_feet = height / INCH - 60
+    base = DEVINE_BASE.get(sex.lower(), DEVINE_BASE_OTHER)
+    return max(base + DEVINE_PER_INCH * inches_over_five_feet, 0.0)
+
+
+def adjusted_body_weight(weight, ideal):
+    """Adjusted body weight for patients above their ideal weight."""
+    if weight <= ideal:
+        return float(weight)
+    return ideal + ADJUSTED_WEIGHT_FACTOR * (weight - ideal)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def body_metrics(weight, height, sex):
+    """All derived metrics of one patient (memoised on weight, height and sex)."""
+    ideal = ideal_body_weight(height, sex)
+    return BodyMetrics(compute_bmi(weight, height), bsa_mosteller(weight, height),
+                       bsa_dubois(weight, height), ideal,
+                       adjusted_body_weight(weight, ideal))
+
+
+def dose_mg(dosage):
+    """Milligrams of a DOSAGE_LIST code, or None for 'Other' / not asked."""
+    text = DOSAGE_LIST.get(dosage, "")
+    if not text.endswith(" mg"):
+        return None
+    return float(text[:-len(" mg")])
+
+
+def dose_check(medication, dosage, weight, height, sex):
+    """
+    DoseCheck of a medication/dosage selection for this patient, or None when
+    the medication group is dosed flat, either answer is 'Other' or the
+    weight/height cannot scale a dose.
+    """
+    limit = DOSE_LIMITS.get(medication)
+    milligrams = dose_mg(dosage)
+    if limit is None or milligrams is None:
+        return None
+    basis, ceiling = limit
+    size = body_metrics(weight, height, sex).bsa_mosteller if basis == PER_M2 else weight
+    if size <= 0:
+        return None
+    per_unit = milligrams / size
+    return DoseCheck(medication, milligrams, basis, per_unit, ceiling, per_unit <= ceiling)
@@ -0,0 +1,395 @@
+"""
+Headless batch engine.
+
+Replays pre-collected intake answers (CSV or JSONL, one patient per row)
+through the same validation and scoring rules as the interactive stages,
+without a single input() call.
+"""
+import argparse
+import csv
+import json
+import queue
+import sys
+import threading
+import time
+
+from .core import (MAX_AGE, MENU_FIELDS, is_valid_age, is_valid_name,
+                   is_valid_sex, normalize_concern)
+from .census import DEFAULT_SITE, CensusEngine
+from .escalation import FileSink, escalate
+from .events import open_dashboard
+from .export import ColumnarWriter
+from .matcher import default_matcher
+from .metrics import Metrics
+from .flow import RED_FLAG_FIELDS, SYMPTOM_FIELDS
+from .record import PatientRecord
+from .report import FORMATS, ReportWriter
+from .store import DEFAULT_CHUNK_SIZE, PatientStore
+
+
+class IntakeError(ValueError):
+    """Raised when a pre-collected answer fails the validation of its stage."""
+
+    def __init__(self, field, message):
+        super().__init__(f"{field}: {message}")
+        self.field = field
+        self.message = message
+
+
+def _answer(answers, field, default=None):
+    # Missing columns and blank cells both count as "not answered"
+    value = answers.get(field)
+    if value is None or str(value).strip() == "":
+        if default is None:
+            raise IntakeError(field, "missing answer")
+        return default
+    return str(value).strip()
+
+
+def _number(answers, field, cast=int):
+    try:
+        return cast(_answer(answers, field))
+    except ValueError:
+        raise IntakeError(field, "not a valid number") from None
+
+
+def _choice(answers, field, record):
+    # Mirrors the menu stages: the code must exist, and 'Other' takes free text
+    menu, other_code = MENU_FIELDS[field]
+    code = _number(answers, field)
+    if code not in menu:
+        raise IntakeError(field, f"{code} is not an option of the menu")
+    if code == other_code:
+        if record.other is None:
+            record.other = {}
+        record.other[field] = _answer(answers, f"{field}_other")
+    setattr(record, field, code)
+
+
+def _confirmed(answers, field, accepted=("Y", "YES")):
+    # Portal submissions are confirmed on screen, so an absent answer means 'Yes'
+    return _answer(answers, field, default="Y").upper() in accepted
+
+
+def triage_answers(answers):
+    """
+    Runs one patient's pre-collected answers through every stage of the
+    interactive flow and returns the validated PatientRecord.
+    Raises IntakeError on the first answer the matching stage would reject.
+    """
+    # --- PHASE 1: Administrative ---
+    name = _answer(answers, "name")
+    if not is_valid_name(name):
+        raise IntakeError("name", "only alphabetic characters are accepted")
+    age = _number(answers, "age")
+    if not is_valid_age(age):
+        raise IntakeError("age", f"age must be between 0 and {MAX_AGE} years")
+    sex = _answer(answers, "sex").lower()
+    if not is_valid_sex(sex):
+        raise IntakeError("sex", "choose from M, F, or Other")
+    weight = _number(answers, "weight", float)
+    height = _number(answers, "height", float)
+    if height <= 0:
+        raise IntakeError("height", "height must be greater than 0")
+    if not _confirmed(answers, "registration_confirmed"):
+        raise IntakeError("registration_confirmed", "registration declined")
+    record = PatientRecord(name, age, sex, weight, height)
+
+    # --- PHASE 2: Triage & Background ---
+    for number, field in enumerate(RED_FLAG_FIELDS, start=1):
+        response = _answer(answers, field).upper()
+        if response == "Y":
+            # Same safety stop as the interactive check: nothing else is collected
+            record.status = "emergency"
+            record.red_flag = number
+            return record
+        if response != "N":
+            raise IntakeError(field, "use 'Y' or 'N' only")
+    _choice(answers, "visit_reason", record)
+    _choice(answers, "pathology_type", record)
+    _choice(answers, "pathology_stage", record)
+
+    # --- PHASE 3: Treatment & Symptoms ---
+    _choice(answers, "treatment", record)
+    _choice(answers, "medication", record)
+    _choice(answers, "dosage", record)
+    _choice(answers, "frequency", record)
+    if not _confirmed(answers, "regimen_confirmed"):
+        raise IntakeError("regimen_confirmed", "regimen verification declined")
+    _choice(answers, "body_area", record)
+    _choice(answers, "symptom", record)
+    # CTCAE grade and duration are optional: the desk flow does not always ask them
+    if _answer(answers, "severity", default=""):
+        _choice(answers, "severity", record)
+    if _answer(answers, "duration", default=""):
+        _choice(answers, "duration", record)
+    scores = []
+    for field in SYMPTOM_FIELDS:
+        score = _number(answers, field)
+        if not 0 <= score <= 10:
+            raise IntakeError(field, "score must be between 0 and 10")
+        scores.append(score)
+    record.symptom_scores = bytes(scores)
+
+    # --- PHASE 4: Clinical Context ---
+    _choice(answers, "functional_status", record)
+    _choice(answers, "recent_tests", record)
+    concern = normalize_concern(_answer(answers, "patient_concern"))
+    if concern is None:
+        raise IntakeError("patient_concern", "at least 5 characters, or 'N' to skip")
+    record.patient_concern = concern
+    return record
+
+
+def read_intake(path):
+    """
+    Yields one answers dict per patient from a .jsonl/.ndjson or .csv intake
+    file, or from JSON lines on standard input when path is '-'.
+    """
+    if path == "-":
+        # An open-ended stream: answers are triaged as they arrive
+        for line in sys.stdin:
+            if line.strip():
+                yield json.loads(line)
+        return
+    with open(path, newline="", encoding="utf-8") as intake:
+        if path.endswith((".jsonl", ".ndjson")):
+            for line in intake:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(intake)
+
+
+def run_batch(rows, emergency_sink=None):
+    """
+    Triage every answers dict in rows.
+    Yields (row_number, record, error) where exactly one of record/error is set,
+    so a single bad submission never stops the rest of the batch.
+    Emergencies are emitted to emergency_sink as they are found.
+    """
+    for row_number, answers in enumerate(rows, start=1):
+        try:
+            record = triage_answers(answers)
+        except IntakeError as error:
+            yield row_number, None, error
+            continue
+        if record.red_flag:
+            escalate(emergency_sink, record.name, record.red_flag, source="batch")
+        yield row_number, record, None
+
+
+# --- Streaming Intake ---
+# No fixed cut-off: crossing the soft capacity raises an alert and intake
+# carries on for as long as the source produces patients.
+
+# Sessions per desk per day before the first soft-capacity alert
+DEFAULT_SOFT_CAPACITY = 100
+
+_END_OF_INTAKE = object()
+
+
+def _read_ahead(source, max_pending):
+    """
+    Iterates source on a background thread behind a bounded queue: a slow
+    source overlaps with triage, a fast one blocks (back-pressure) once
+    max_pending answers are waiting.
+    """
+    pending = queue.Queue(maxsize=max_pending)
+    stopped = threading.Event()
+    failure = []
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in source:
+                if not put(item):
+                    return
+        except Exception as error:  # re-raised on the consumer side
+            failure.append(error)
+        put(_END_OF_INTAKE)
+
+    threading.Thread(target=produce, name="onc-intake-reader", daemon=True).start()
+    try:
+        while True:
+            item = pending.get()
+            if item is _END_OF_INTAKE:
+                if failure:
+                    raise failure[0]
+                return
+            yield item
+    finally:
+        # Consumer stopped early (break, error): release the reader thread
+        stopped.set()
+
+
+def stream_triage(source, soft_capacity=DEFAULT_SOFT_CAPACITY, on_capacity=None,
+                  max_pending=0, emergency_sink=None):
+    """
+    Triage answers dicts from any iterator or generator until it is exhausted.
+    Yields the same (row_number, record, error) tuples as run_batch.
+    on_capacity(served) is called every time the number of processed sessions
+    reaches a multiple of soft_capacity (0 disables the alerts).
+    max_pending > 0 enables background read-ahead bounded to that many answers.
+    """
+    rows = _read_ahead(source, max_pending) if max_pending > 0 else source
+    return with_capacity_alerts(run_batch(rows, emergency_sink), soft_capacity, on_capacity)
+
+
+def with_capacity_alerts(results, soft_capacity=DEFAULT_SOFT_CAPACITY, on_capacity=None):
+    """Passes results through, calling on_capacity(served) every soft_capacity results."""
+    for served, result in enumerate(results, start=1):
+        yield result
+        if soft_capacity and served % soft_capacity == 0 and on_capacity is not None:
+            on_capacity(served)
+
+
+def print_capacity_alert(served):
+    """Default on_capacity hook: a soft alert on stderr, never a refusal."""
+    print(f"⚠️ CAPACITY NOTICE: {served} sessions processed - intake continues.",
+          file=sys.stderr)
+
+
+def batch_main(argv):
+    """Command line entry for headless mode; writes one JSON result per line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m onc --batch",
+        description="Triage a pre-collected intake file without interactive prompts.")
+    parser.add_argument("intake",
+                        help="CSV or JSONL file, one patient per row ('-' streams JSONL from stdin)")
+    parser.add_argument("-o", "--output",
+                        help="JSONL results file (default: standard output)")
+    parser.add_argument("--emergency-log",
+                        help="append every emergency event as a JSON line to this file")
+    parser.add_argument("--soft-capacity", type=int, default=DEFAULT_SOFT_CAPACITY,
+                        help="alert every N sessions without stopping intake (0 disables)")
+    parser.add_argument("--read-ahead", type=int, default=0, metavar="N",
+                        help="read up to N answers ahead on a background thread")
+    parser.add_argument("--store", metavar="DB",
+                        help="also save every triaged record to this SQLite patient store")
+    parser.add_argument("--reports", metavar="FILE",
+                        help="write the clinical summary of every triaged patient to this file")
+    parser.add_argument("--report-format", choices=sorted(FORMATS), default="text",
+                        help="format of --reports (html is print/PDF-ready)")
+    parser.add_argument("--dashboard", metavar="TARGET",
+                        help="stream dashboard events to tcp://HOST:PORT, unix:PATH or a JSON-lines file")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="write row timings and rejection counters to FILE (.prom: Prometheus text, else JSON)")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="triage on N worker processes (0: one per CPU)")
+    parser.add_argument("--order", choices=("arrival", "priority"), default="arrival",
+                        help="with --workers: output in arrival order or most urgent first")
+    parser.add_argument("--match-other", action="store_true",
+                        help="recode 'Other' answers whose text matches a menu option")
+    parser.add_argument("--census", metavar="FILE",
+                        help="write the census of the run (counts per visit reason, pathology, grade...) as JSON")
+    parser.add_argument("--site", default=DEFAULT_SITE,
+                        help="site name the run is counted under in the census")
+    parser.add_argument("--export", metavar="FILE",
+                        help="also write every triaged record to FILE (.parquet, .arrow or .csv)")
+    options = parser.parse_args(argv)
+    sink = FileSink(options.emergency_log) if options.emergency_log else None
+    store = PatientStore(options.store) if options.store else None
+    dashboard = open_dashboard(options.dashboard) if options.dashboard else None
+    metrics = Metrics() if options.metrics else None
+    matcher = default_matcher() if options.match_other else None
+    census = CensusEngine(options.site) if options.census else None
+    export = ColumnarWriter(options.export) if options.export else None
+    pending = []                # records waiting for the next bulk transaction
+
+    out = open(options.output, "w", encoding="utf-8") if options.output else sys.stdout
+    reports = None
+    if options.reports:
+        reports = ReportWriter(open(options.reports, "w", encoding="utf-8"),
+                               options.report_format)
+    totals = {"complete": 0, "emergency": 0, "rejected": 0}
+    recoded = 0
+    try:
+        if options.workers == 1:
+            results = stream_triage(read_intake(options.intake), options.soft_capacity,
+                                    print_capacity_alert, options.read_ahead, sink)
+        else:
+            # Imported on demand: onc.parallel builds on this module
+            from .parallel import parallel_triage
+            intake = read_intake(options.intake)
+            if options.read_ahead > 0:
+                intake = _read_ahead(intake, options.read_ahead)
+            results = with_capacity_alerts(
+                parallel_triage(intake, options.workers or None, order=options.order,
+                                emergency_sink=sink,
+                                # Recoded records are rendered here, after matching
+                                report_format=options.report_format
+                                if reports and matcher is None else None),
+                options.soft_capacity, print_capacity_alert)
+        started = time.perf_counter()
+        for row_number, record, error, *rendered in results:
+            if metrics is not None:
+                now = time.perf_counter()
+                # Read + validate + score time of this row
+                metrics.observe("batch_row", now - started)
+                started = now
+            if error is None:
+                matched = matcher.recode(record) if matcher is not None else None
+                result = {"row": row_number, **record.to_dict()}
+                if matched:
+                    recoded += len(matched)
+                    result["matched_other"] = {field: {"text": record.other[field],
+                                                       "phrase": match.phrase,
+                                                       "score": match.score}
+                                               for field, match in matched.items()}
+                if reports is not None:
+                    if rendered and rendered[0] is not None:
+                        reports.add_rendered(rendered[0])   # already rendered by a worker
+                    else:
+                        reports.add(record)
+                if dashboard is not None:
+                    dashboard.publish_record(record, "batch", f"row-{row_number}")
+                if census is not None:
+                    census.add_record(record)
+                if export is not None:
+                    export.add(record)
+                if store is not None:
+                    pending.append(record)
+                    if len(pending) >= DEFAULT_CHUNK_SIZE:
+                        store.add_many(pending)
+                        pending.clear()
+            else:
+                result = {"row": row_number, "status": "rejected",
+                          "field": error.field, "error": error.message}
+                if metrics is not None:
+                    metrics.invalid(error.field)
+            totals[result["status"]] += 1
+            if metrics is not None:
+                metrics.session_finished(result["status"])
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        if store is not None:
+            store.add_many(pending)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if store is not None:
+            store.close()
+        if reports is not None:
+            reports.close()
+            reports.out.close()
+        if dashboard is not None:
+            dashboard.close()
+        if metrics is not None:
+            metrics.write(options.metrics)
+        if census is not None:
+            census.write(options.census)
+        if export is not None:
+            export.close()
+    print(f"✅ {totals['complete']} triaged | ⚠️ {totals['emergency']} emergencies | "
+          f"⛔️ {totals['rejected']} rejected", file=sys.stderr)
+    if matcher is not None:
+        print(f"✅ {recoded} 'Other' answers matched to a menu option", file=sys.stderr)
+    return 0
@@ -0,0 +1,84 @@
+"""
+Non-fatal emergency escalation.
+
+A red flag no longer ends the process: the patient is flagged, an
+EmergencyEvent is emitted to a pluggable sink and only that patient's session
+stops. A sink is any object with an emit(event) method; the queue, file and
+callback sinks below cover the common deployments.
+"""
+import json
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+from .core import RED_FLAG_CHECKLIST
+
+
+@dataclass(slots=True, frozen=True)
+class EmergencyEvent:
+    """One patient routed to the ER by the red-flag safety check."""
+    name: str
+    red_flag: int                     # 1-7: RED_FLAG_CHECKLIST item answered 'Y'
+    source: str = "desk"              # "desk" or "batch"
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def description(self):
+        return RED_FLAG_CHECKLIST[self.red_flag - 1].strip()
+
+    def to_dict(self):
+        return {**asdict(self), "description": self.description}
+
+
+class EmergencyEscalation(Exception):
+    """
+    Raised once an emergency has been emitted, so the caller can close this
+    patient's session and move on to the next one in the queue.
+    """
+
+    def __init__(self, event):
+        super().__init__(f"{event.name}: {event.description}")
+        self.event = event
+
+
+class QueueSink:
+    """Puts every event on a queue.Queue for another thread or process to consume."""
+
+    def __init__(self, events=None):
+        self.events = queue.Queue() if events is None else events
+
+    def emit(self, event):
+        self.events.put(event)
+
+
+class FileSink:
+    """Appends one JSON line per event and flushes immediately."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, event):
+        line = json.dumps(event.to_dict(), ensure_ascii=False) + "\n"
+        # Emergencies are rare: open/append/close keeps the file safe to rotate
+        with self._lock, open(self.path, "a", encoding="utf-8") as log:
+            log.write(line)
+
+
+class CallbackSink:
+    """Calls a function with every event (pager hook, web push, test spy...)."""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def emit(self, event):
+        self.callback(event)
+
+
+def escalate(sink, name, red_flag, source="desk"):
+    """Builds the EmergencyEvent for a patient, emits it when a sink is set, returns it."""
+    event = EmergencyEvent(name, red_flag, source)
+    if sink is not None:
+        sink.emit(event)
+    return event
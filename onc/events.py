@@ -0,0 +1,308 @@
+"""
+Structured event stream to the clinical dashboard.
+
+The desk, the batch engine and the kiosk sessions publish typed
+DashboardEvents (registration complete, symptom alert, red flag, regimen
+verified, report ready, symptom trend across visits) to an EventBus instead of only printing that data
+was "directed to the dashboard". The bus delivers red flags at once, ahead
+of anything buffered; routine events wait in a bounded buffer where a newer
+event of the same kind for the same visit (desk session, batch row or kiosk
+session, never just the patient's name: namesakes are different patients)
+replaces the older one, and go out in batches to a pluggable sink. A sink is any object with
+emit_batch(events) or, like the escalation sinks, emit(event).
+"""
+import itertools
+import json
+import socket
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+
+from .core import PATIENT_SYMPTOMS, RED_FLAG_CHECKLIST, is_alert_score
+
+# --- Event kinds ---
+REGISTRATION_COMPLETE = "registration_complete"
+SYMPTOM_ALERT = "symptom_alert"
+RED_FLAG = "red_flag"
+REGIMEN_VERIFIED = "regimen_verified"
+REPORT_READY = "report_ready"
+SYMPTOM_TREND = "symptom_trend"
+
+# Delivery priority, most urgent first
+EMERGENCY = 0
+ALERT = 1
+ROUTINE = 2
+
+PRIORITIES = {RED_FLAG: EMERGENCY, SYMPTOM_ALERT: ALERT, SYMPTOM_TREND: ALERT,
+              REGISTRATION_COMPLETE: ROUTINE, REGIMEN_VERIFIED: ROUTINE,
+              REPORT_READY: ROUTINE}
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_BUFFER = 10_000
+DEFAULT_FLUSH_INTERVAL = 2.0      # seconds a routine event may wait for its batch
+
+
+@dataclass(slots=True, frozen=True)
+class DashboardEvent:
+    """One typed dashboard notification about a patient."""
+    kind: str
+    patient: str
+    data: dict = field(default_factory=dict)
+    source: str = "desk"              # "desk", "batch" or "kiosk"
+    timestamp: float = field(default_factory=time.time)
+    session: str = None               # visit the event is about (desk session, batch row...)
+
+    @property
+    def priority(self):
+        return PRIORITIES[self.kind]
+
+    @property
+    def key(self):
+        # Coalescing key: a newer event with the same key supersedes a buffered one.
+        # Events without a session fall back to the patient name.
+        visit = self.patient if self.session is None else self.session
+        if self.kind in (SYMPTOM_ALERT, SYMPTOM_TREND):
+            return self.kind, visit, self.data.get("symptom")
+        return self.kind, visit
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def record_events(record, source="batch", session=None):
+    """
+    The dashboard events of a finished PatientRecord, in the order the desk
+    emits them; session identifies the visit (e.g. the batch row).
+    """
+    yield DashboardEvent(REGISTRATION_COMPLETE, record.name,
+                         {"age": record.age, "sex": record.sex, "BMI": round(record.BMI, 1)},
+                         source, session=session)
+    if record.red_flag:
+        yield DashboardEvent(RED_FLAG, record.name,
+                             {"red_flag": record.red_flag,
+                              "description": RED_FLAG_CHECKLIST[record.red_flag - 1].strip()},
+                             source, session=session)
+        return
+    yield DashboardEvent(REGIMEN_VERIFIED, record.name,
+                         {field: record.display(field)
+                          for field in ("treatment", "medication", "dosage", "frequency")},
+                         source, session=session)
+    for symptom, score in zip(PATIENT_SYMPTOMS, record.symptom_scores):
+        if is_alert_score(score):
+            yield DashboardEvent(SYMPTOM_ALERT, record.name,
+                                 {"symptom": symptom.strip(), "score": score}, source,
+                                 session=session)
+    yield DashboardEvent(REPORT_READY, record.name, {"status": record.status}, source,
+                         session=session)
+
+
+def trend_event(alert, source="desk", session=None):
+    """DashboardEvent of an onc.trends.TrendAlert; session: the visit that raised it."""
+    return DashboardEvent(SYMPTOM_TREND, alert.patient,
+                          {"symptom": alert.symptom, "trend": alert.kind,
+                           "previous": alert.previous, "score": alert.current,
+                           "delta": alert.delta}, source, session=session)
+
+
+class EventBus:
+    """
+    Buffers routine events and delivers them to sink in batches of
+    batch_size, or when the oldest has waited flush_interval seconds (a
+    timer thread flushes them even if nothing else is published, e.g. while
+    the desk waits for the next patient). Red flags bypass the buffer and are delivered immediately. When
+    max_buffer events are waiting, the oldest are dropped (counted in
+    dropped); failed deliveries go back to the buffer and are retried first.
+    """
+
+    def __init__(self, sink, batch_size=DEFAULT_BATCH_SIZE,
+                 max_buffer=DEFAULT_MAX_BUFFER, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.failures = 0
+        self._buffer = OrderedDict()      # coalescing key -> event, oldest first
+        self._oldest = None               # monotonic time the buffer stopped being empty
+        self._timer = None                # pending flush_interval flush, while events wait
+        self._lock = threading.Lock()
+        self._sending = threading.Lock()  # one delivery at a time: the timer runs on its own thread
+        self._visits = itertools.count(1)  # session ids of records published without one
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def publish(self, event):
+        if event.priority == EMERGENCY:
+            # Anything buffered is older but less urgent: the emergency goes first
+            if not self._deliver([event]):
+                self._requeue([event])
+            return
+        with self._lock:
+            if event.key in self._buffer:
+                del self._buffer[event.key]
+                self.coalesced += 1
+            elif len(self._buffer) >= self.max_buffer:
+                self._buffer.popitem(last=False)
+                self.dropped += 1
+            self._buffer[event.key] = event
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+                self._arm()
+            due = (len(self._buffer) >= self.batch_size
+                   or time.monotonic() - self._oldest >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def publish_record(self, record, source="batch", session=None):
+        """Publishes record_events(); without a session id, each call is a visit of its own."""
+        if session is None:
+            session = f"{source}-{next(self._visits)}"
+        for event in record_events(record, source, session):
+            self.publish(event)
+
+    def flush(self):
+        """Delivers everything buffered, alerts before routine events."""
+        with self._lock:
+            events = sorted(self._buffer.values(), key=lambda event: event.priority)
+            self._buffer.clear()
+            self._oldest = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for start in range(0, len(events), self.batch_size):
+            if not self._deliver(events[start:start + self.batch_size]):
+                self._requeue(events[start:])
+                return
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            # Events still undelivered are not retried once the bus is closed
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        close = getattr(self.sink, "close", None)
+        if close is not None:
+            close()
+
+    def _arm(self):
+        # Called under self._lock when the buffer stops being empty
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self._flush_due)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_due(self):
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def _deliver(self, events):
+        with self._sending:
+            return self._send(events)
+
+    def _send(self, events):
+        try:
+            emit_batch = getattr(self.sink, "emit_batch", None)
+            if emit_batch is not None:
+                emit_batch(events)
+            else:
+                for event in events:
+                    self.sink.emit(event)
+        except OSError:
+            # Dashboard unreachable: keep the events, the desk keeps running
+            self.failures += 1
+            return False
+        self.delivered += len(events)
+        return True
+
+    def _requeue(self, events):
+        with self._lock:
+            pending = self._buffer
+            self._buffer = OrderedDict()
+            for event in events:
+                self._buffer[event.key] = event
+            for key, event in pending.items():
+                self._buffer.pop(key, None)
+                self._buffer[key] = event
+            while len(self._buffer) > self.max_buffer:
+                self._buffer.popitem(last=False)
+                self.dropped += 1
+            if self._buffer and self._oldest is None:
+                self._oldest = time.monotonic()
+            if self._buffer:
+                # Retried after flush_interval even if nothing else is published
+                self._arm()
+
+
+# --- Sinks ---
+
+def _json_lines(events):
+    return "".join(json.dumps(event.to_dict(), ensure_ascii=False) + "\n"
+                   for event in events)
+
+
+class JsonLinesSink:
+    """Appends each batch to a file as JSON lines, in one write (local dashboard stand-in)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit_batch(self, events):
+        with self._lock, open(self.path, "a", encoding="utf-8") as log:
+            log.write(_json_lines(events))
+
+
+class SocketSink:
+    """
+    Sends each batch as JSON lines over TCP (host, port) or a unix socket
+    path. Connects lazily and reconnects on the next batch after a failure.
+    """
+
+    def __init__(self, address, timeout=5.0):
+        self.address = address
+        self.timeout = timeout
+        self._socket = None
+
+    def emit_batch(self, events):
+        payload = _json_lines(events).encode("utf-8")
+        try:
+            if self._socket is None:
+                self._socket = self._connect()
+            self._socket.sendall(payload)
+        except OSError:
+            self.close()
+            raise
+
+    def _connect(self):
+        if isinstance(self.address, str):
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self.timeout)
+            connection.connect(self.address)
+            return connection
+        return socket.create_connection(self.address, self.timeout)
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+def open_dashboard(target, **options):
+    """
+    EventBus for a command-line target: tcp://HOST:PORT, unix:PATH, or a
+    file path for JSON lines.
+    """
+    if target.startswith("tcp://"):
+        host, _, port = target[len("tcp://"):].rpartition(":")
+        sink = SocketSink((host or "127.0.0.1", int(port)))
+    elif target.startswith("unix:"):
+        sink = SocketSink(target[len("unix:"):])
+    else:
+        sink = JsonLinesSink(target)
+    return EventBus(sink, **options)
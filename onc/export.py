@@ -0,0 +1,237 @@
+"""
+Columnar export of triage records for bulk analysis.
+
+ColumnarWriter streams records into a Parquet file, an Arrow IPC file
+(.arrow / .feather, memory-mappable with pyarrow.memory_map) or, without
+pyarrow, a CSV file with the same columns. Records are gathered into a
+PatientBatch of row_group_size rows, and each full batch is written as one
+row group straight from its typed arrays. Code, score and metric columns
+reach Arrow without a copy (Array.from_buffers over the array's memory), so
+memory stays at one row group however many sessions are exported.
+
+Menu answers are exported as their onc.vocabulary codes, with the typed
+text of 'Other' answers in <field>_other; the code -> display table of each
+field is stored in the Arrow schema metadata ("onc.vocabulary").
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from array import array
+
+from .core import MENU_FIELDS, PATIENT_SYMPTOMS, compute_bmi
+from .record import CODE_FIELDS, PatientBatch
+from .store import PatientStore
+from .vocabulary import TERMS
+
+DEFAULT_ROW_GROUP_SIZE = 65_536
+
+# Formats
+PARQUET = "parquet"
+ARROW = "arrow"
+CSV = "csv"
+FORMATS = {".parquet": PARQUET, ".arrow": ARROW, ".feather": ARROW, ".ipc": ARROW, ".csv": CSV}
+
+# Column names of the six symptom scores: "pain", ..., "shortness_of_breath"
+SYMPTOM_COLUMNS = tuple(re.sub(r"\W+", "_", symptom.strip()).casefold()
+                        for symptom in PATIENT_SYMPTOMS)
+OTHER_FIELDS = tuple(field for field in CODE_FIELDS if MENU_FIELDS[field][1] is not None)
+
+# (column, Arrow type) in file order; every format writes these columns
+SCHEMA = (
+    ("recorded_at", "float64"),        # epoch seconds
+    ("name", "string"),
+    ("age", "uint16"),
+    ("sex", "string"),
+    ("weight", "float64"),
+    ("height", "float64"),
+    ("BMI", "float64"),
+    ("status", "string"),
+    ("red_flag", "uint8"),
+    *((field, "uint8") for field in CODE_FIELDS),
+    *((f"{field}_other", "string") for field in OTHER_FIELDS),
+    *((column, "uint8") for column in SYMPTOM_COLUMNS),
+    ("patient_concern", "string"),
+)
+
+
+def format_for(path):
+    """Export format of a path, from its extension (CSV when not recognised)."""
+    return FORMATS.get(os.path.splitext(path)[1].casefold(), CSV)
+
+
+def _pyarrow():
+    # Optional dependency: imported on first use only
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def _columns(batch, recorded_at):
+    """{column: sequence} of one row group, in SCHEMA order."""
+    rows = len(batch)
+    other = {field: [None] * rows for field in OTHER_FIELDS}
+    for row, answers in batch.other.items():
+        for field, text in answers.items():
+            other[field][row] = text
+    width = len(PATIENT_SYMPTOMS)
+    columns = {
+        "recorded_at": recorded_at,
+        "name": batch.names,
+        "age": batch.ages,
+        "sex": batch.sexes,
+        "weight": batch.weights,
+        "height": batch.heights,
+        "BMI": array("d", (compute_bmi(weight, height) if height else 0.0
+                           for weight, height in zip(batch.weights, batch.heights))),
+        "status": batch.statuses,
+        "red_flag": batch.red_flags,
+        **batch.codes,
+        **{f"{field}_other": texts for field, texts in other.items()},
+        **{column: batch.symptom_scores[index::width] for index, column in enumerate(SYMPTOM_COLUMNS)},
+        "patient_concern": batch.concerns,
+    }
+    return {column: columns[column] for column, _ in SCHEMA}
+
+
+# --- Sinks: one per format, each writing one row group per write() ---
+
+class _CsvSink:
+    def __init__(self, path):
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(column for column, _ in SCHEMA)
+
+    def write(self, columns):
+        self._writer.writerows(zip(*columns.values()))
+
+    def close(self):
+        self._file.close()
+
+
+class _ArrowSink:
+    def __init__(self, path, pyarrow, fmt):
+        self.pa = pyarrow
+        vocabulary = {field: {int(code): item.display for code, item in TERMS[field].items()}
+                      for field in CODE_FIELDS}
+        self.schema = pyarrow.schema(
+            [(column, getattr(pyarrow, kind)()) for column, kind in SCHEMA],
+            metadata={"onc.vocabulary": json.dumps(vocabulary, ensure_ascii=False)})
+        if fmt == PARQUET:
+            import pyarrow.parquet
+            self._writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        else:
+            import pyarrow.ipc
+            self._writer = pyarrow.ipc.new_file(path, self.schema)
+
+    def write(self, columns):
+        pa = self.pa
+        arrays = []
+        for field, values in zip(self.schema, columns.values()):
+            if isinstance(values, array):
+                # Typed arrays share their memory with Arrow instead of being converted
+                arrays.append(pa.Array.from_buffers(field.type, len(values),
+                                                    [None, pa.py_buffer(values)]))
+            else:
+                arrays.append(pa.array(values, field.type))
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self._writer.close()
+
+
+class ColumnarWriter:
+    """
+    Streams records to path in row groups of row_group_size records.
+    fmt: PARQUET, ARROW or CSV (default: from the extension). Without
+    pyarrow, Parquet and Arrow exports fall back to CSV next to path
+    (same name, .csv); self.path and self.format say what was written.
+    Records with a value no column can hold (e.g. a stored age of -4) are
+    skipped and counted in self.skipped.
+    """
+
+    def __init__(self, path, fmt=None, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+        fmt = fmt or format_for(path)
+        pyarrow = _pyarrow() if fmt != CSV else None
+        if fmt != CSV and pyarrow is None:
+            path = os.path.splitext(path)[0] + ".csv"
+            print(f"⚠️ pyarrow is not installed: exporting CSV to {path} instead of {fmt}.",
+                  file=sys.stderr)
+            fmt = CSV
+        self.path = path
+        self.format = fmt
+        self.row_group_size = row_group_size
+        self.written = 0
+        self.skipped = 0
+        self._sink = _CsvSink(path) if fmt == CSV else _ArrowSink(path, pyarrow, fmt)
+        self._batch = PatientBatch()
+        self._recorded_at = array("d")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, record, recorded_at=None):
+        """Buffers one record; returns False when it was skipped."""
+        try:
+            recorded_at = float(time.time() if recorded_at is None else recorded_at)
+            # Checked before any column grows (see PatientBatch.append)
+            self._batch.append(record)
+        except (OverflowError, TypeError, ValueError):
+            self.skipped += 1
+            return False
+        self._recorded_at.append(recorded_at)
+        if len(self._batch) >= self.row_group_size:
+            self.flush()
+        return True
+
+    def add_visits(self, visits):
+        """Adds (recorded_at, record) pairs, e.g. PatientStore.iter_visits()."""
+        for recorded_at, record in visits:
+            self.add(record, recorded_at)
+
+    def flush(self):
+        """Writes the pending records as one row group."""
+        if len(self._batch):
+            self._sink.write(_columns(self._batch, self._recorded_at))
+            self.written += len(self._batch)
+            self._batch = PatientBatch()
+            self._recorded_at = array("d")
+
+    def close(self):
+        # The sink is closed (and its footer written) even if the last row group fails
+        try:
+            self.flush()
+        finally:
+            self._sink.close()
+
+
+def export_main(argv):
+    """Command line entry: python -m onc --export patients.db -o FILE [--format F]."""
+    parser = argparse.ArgumentParser(
+        prog="python -m onc --export",
+        description="Export every stored triage session to a columnar file for analysis.")
+    parser.add_argument("store", help="SQLite patient store (--store) to export")
+    parser.add_argument("-o", "--output", required=True,
+                        help="export file: .parquet, .arrow/.feather (Arrow IPC) or .csv")
+    parser.add_argument("--format", choices=(PARQUET, ARROW, CSV),
+                        help="export format (default: from the output extension)")
+    parser.add_argument("--row-group", type=int, default=DEFAULT_ROW_GROUP_SIZE, metavar="N",
+                        help="records per row group (and held in memory at once)")
+    options = parser.parse_args(argv)
+    with PatientStore(options.store) as store, \
+            ColumnarWriter(options.output, options.format, options.row_group) as writer:
+        writer.add_visits(store.iter_visits())
+    print(f"✅ {writer.written} sessions exported to {writer.path} ({writer.format})",
+          file=sys.stderr)
+    if writer.skipped:
+        print(f"⚠️ {writer.skipped} sessions skipped: values out of range for the export columns",
+              file=sys.stderr)
+    return 0
@@ -0,0 +1,333 @@
+"""
+Declarative question-flow engine.
+
+Every step of the desk flow is declared once below (prompt, options,
+validation, 'Other' follow-up, confirmation and messages) and compiled at
+import time into FLOW, a dispatch table from field name to a ready-to-run
+CompiledStep: menu text, valid codes and the 'Other' code are precomputed, so
+asking a step costs a dict lookup instead of rebuilding a menu. The
+interactive desk runs steps with ask(); the kiosk sessions validate answers
+with CompiledStep.check(). Adding a step means adding a declaration, not
+another 40-line loop.
+"""
+from dataclasses import dataclass
+
+from .core import (MAX_AGE, MENU_FIELDS, PATIENT_SYMPTOMS, RED_FLAG_CHECKLIST,
+                   is_valid_age, is_valid_name, is_valid_sex, normalize_concern)
+
+CONFIRM_PROMPT = "Is the information provided correct? (Yes/No) Please enter 'y' for Yes or 'n' for No : "
+
+# Intake columns that carry the 0-10 symptom scores and the Y/N red-flag answers
+SYMPTOM_FIELDS = ["pain", "fever", "fatigue",
+                  "nausea_vomiting", "shortness_of_breath", "bleeding"]
+RED_FLAG_FIELDS = [f"red_flag_{number}"
+                   for number in range(1, len(RED_FLAG_CHECKLIST) + 1)]
+
+# Desk commands: typed at any desk prompt, they run and the same question is
+# asked again. python -m onc registers them (e.g. "/next": the nurse calls
+# the most urgent waiting patient) for the life of the desk.
+DESK_COMMANDS = {}
+
+
+def desk_input(prompt):
+    """input() of the interactive desk, with DESK_COMMANDS handled in between."""
+    while True:
+        answer = input(prompt)
+        command = DESK_COMMANDS.get(answer.strip().lower())
+        if command is None:
+            return answer
+        command()
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    """
+    Declaration of one question. Menu steps (field in MENU_FIELDS) take their
+    options from onc.core; free-answer steps provide check(answer), which
+    returns an error message or None. Templates may reference answers already
+    given ({name}, {treatment}, {symptom}...) and, in confirm, the {option}
+    just chosen; recorded/other_recorded receive {selected}.
+    """
+    field: str
+    prompt: str
+    error: str = ""
+    title: str = ""
+    option_format: str = "{key} : {value}"
+    preamble: str = ""              # printed before every attempt
+    confirm: str = ""               # Y/N confirmation; empty means none
+    other_prompt: str = "You selected 'Other'. Please type your answer:"
+    confirm_other: bool = False     # re-confirm the typed 'Other' text
+    recorded: str = "✅ Recorded: {selected}"
+    other_recorded: str = ""        # defaults to recorded
+    check: object = None
+
+
+class CompiledStep:
+    """A Step with everything precomputed for the hot path."""
+    __slots__ = ("step", "field", "menu", "codes", "other_code", "menu_text",
+                 "other_recorded")
+
+    def __init__(self, step):
+        self.step = step
+        self.field = step.field
+        self.menu, self.other_code = MENU_FIELDS.get(step.field, (None, None))
+        self.codes = frozenset(self.menu or ())
+        self.menu_text = ""
+        if self.menu is not None:
+            options = "\n".join(step.option_format.format(key=key, value=value)
+                                for key, value in self.menu.items())
+            self.menu_text = f"{step.title}\n{options}" if step.title else options
+        self.other_recorded = step.other_recorded or step.recorded
+
+    def parse(self, answer):
+        """Menu code of an answer, or None when it is not a valid option."""
+        try:
+            code = int(answer)
+        except ValueError:
+            return None
+        return code if code in self.codes else None
+
+    def check(self, answer, context=None):
+        """Error message for an invalid answer, or None."""
+        if self.menu is not None:
+            if self.parse(answer) is not None:
+                return None
+            return render(self.step.error, context or {})
+        return self.step.check(answer)
+
+
+def compile_flow(steps):
+    """Builds the field -> CompiledStep dispatch table."""
+    return {step.field: CompiledStep(step) for step in steps}
+
+
+class _Answers:
+    # format_map() view: extra values first, then earlier answers; unknown keys render blank
+    __slots__ = ("context", "extra")
+
+    def __init__(self, context, extra):
+        self.context = context
+        self.extra = extra
+
+    def __getitem__(self, key):
+        if key in self.extra:
+            return self.extra[key]
+        try:
+            return self.context[key]
+        except (KeyError, AttributeError):
+            return ""
+
+
+def render(template, context, **extra):
+    """Fills a step template from the answers given so far."""
+    return template.format_map(_Answers(context, extra)) if "{" in template else template
+
+
+def ask(compiled, context, metrics=None):
+    """
+    Runs a menu step at the terminal: menu -> code -> Y/N confirmation ->
+    'Other' free text. Returns (code, selected display string or typed text).
+    context maps earlier fields to their answers for the prompt templates;
+    metrics (onc.metrics.Metrics) counts re-prompts and declined confirmations.
+    """
+    step = compiled.step
+    print(compiled.menu_text)
+    while True:
+        if step.preamble:
+            print(render(step.preamble, context))
+        code = compiled.parse(desk_input(render(step.prompt, context)))
+        if code is None:
+            if metrics is not None:
+                metrics.invalid()
+            print(render(step.error, context))
+            continue
+        if step.confirm:
+            review = desk_input(render(step.confirm, context, option=compiled.menu[code]))
+            if review.strip().upper() != "Y":
+                if metrics is not None:
+                    metrics.declined()
+                print(render(step.error, context))
+                continue
+        if code == compiled.other_code:
+            selected = desk_input(render(step.other_prompt, context))
+            if step.confirm_other and desk_input(CONFIRM_PROMPT).strip().upper() != "Y":
+                if metrics is not None:
+                    metrics.declined()
+                print("Selection cleared Please Try Again..")
+                continue
+            print(compiled.other_recorded.format(selected=selected))
+        else:
+            selected = compiled.menu[code]
+            print(step.recorded.format(selected=selected))
+        return code, selected
+
+
+# --- Free-answer checks: return an error message, or None when the answer is valid ---
+
+def _check_name(value):
+    if not is_valid_name(value):
+        return "⛔️ Invalid entry Please ensure you provide a full name using only alphabetic characters"
+
+
+def _check_age(value):
+    try:
+        age = int(value)
+    except ValueError:
+        return "⛔️ Data entry error. Please enter a valid numerical age (e.g., 45)"
+    if not is_valid_age(age):
+        return f"⛔️ Data entry error. Please enter an age between 0 and {MAX_AGE} years."
+
+
+def _check_sex(value):
+    if not is_valid_sex(value.lower()):
+        return "⛔️ Selection not recognized. Please choose from M, F, or Other."
+
+
+def _check_weight(value):
+    try:
+        float(value)
+    except ValueError:
+        return "⛔️ input error. Please enter weight as a number or decimal (e.g., 70.5)."
+
+
+def _check_height(value):
+    try:
+        if float(value) > 0:
+            return None
+    except ValueError:
+        pass
+    return "⛔️ Entry failed. Ensure height is entered in meters (e.g., 1.75)."
+
+
+def _check_yes_no(value):
+    if value.upper() not in ("Y", "YES", "N", "NO"):
+        return "⛔️ Invalid input. Please enter 'y' or 'n'."
+
+
+def _check_red_flag(value):
+    if value.upper() not in ("Y", "N"):
+        return "⛔️ ENTRY ERROR: To ensure your safety and direct your data correctly, please use 'Y' or 'N' only."
+
+
+def _check_score(value):
+    try:
+        if 0 <= int(value) <= 10:
+            return None
+    except ValueError:
+        pass
+    return "⛔️ Entry not recognized. To ensure your doctor receives accurate data, please provide a numeric digit."
+
+
+def _check_concern(value):
+    if not value or normalize_concern(value) is None:
+        return "⛔️ INPUT TOO SHORT >> Try Again: To ensure your doctor understands your perspective, please provide a bit more detail (at least 5 characters), or type 'N' to skip."
+
+
+# --- The desk flow, in the order run_session asks it ---
+
+STEPS = (
+    # PHASE 1: Administrative
+    Step("name", "Welcome to our clinic. Please provide your full legal name as it appears on your ID:", check=_check_name),
+    Step("age", "Please enter your current age in years using numbers:", check=_check_age),
+    Step("sex", "Please indicate your sex (M/F/Other): ", check=_check_sex),
+    Step("weight", "Enter your current weight in kilograms (kg) for dosage precision: ", check=_check_weight),
+    Step("height", "Enter your height in meters (m) to complete your physical profile: ", check=_check_height),
+    Step("registration_confirmed", "Is all the information provided correct? (Yes/No): ", check=_check_yes_no),
+    # PHASE 2: Triage & Background
+    *(Step(field, f" Are you currently experiencing {red_flag} ? Please enter 'Y' for Yes or 'N' for No:", check=_check_red_flag)
+      for field, red_flag in zip(RED_FLAG_FIELDS, RED_FLAG_CHECKLIST)),
+    Step("visit_reason",
+         "To route your file correctly, please select your assigned department number from the list above.:",
+         error="⛔️ Invalid entry. Please enter a number (1-5) from the menu",
+         title="\n--Reason for Visit---", option_format="{key} {value}",
+         recorded="✅ Entry verified. Your file has been updated with the following status :{selected}"),
+    Step("pathology_type", "Select the numeric code (1-7) corresponding to your primary diagnosis:",
+         error="⛔️ Validation failed. To ensure data integrity, please re-verify your Category and Stage starting from the menu above.",
+         title="\n--- Clinical Pathology Classification ---", option_format="{key} , {value}",
+         confirm="Is  the information provided correct? Please enter 'Y' for Yes or 'N' for No : ",
+         other_prompt="You selected 'Other'. Please type the name of the pathology you are currently being treated for:",
+         recorded="✅ Pathology synchronized. Recording category:{selected}"),
+    Step("pathology_stage", "Please enter the number (1-4) representing your current clinical stage:",
+         error="⛔️ Validation failed. To ensure data integrity, please re-verify your Category and Stage starting from the menu above.",
+         title="--- Staging Verification ---", option_format="{key} , {value}",
+         confirm="Is the information provided correct? Please enter 'Y' for Yes or 'N' for No: ",
+         recorded="✅ Staging confirmed. Recording:{selected}"),
+    # PHASE 3: Treatment & Symptoms
+    Step("treatment", "Please select your primary treatment category (1-7) from the list below by entering the corresponding number:",
+         error="⛔️ INVALID SELECTION: Please enter a number from the list provided (e.g., 1-7).",
+         title="--- Treatment list Verification  ---", option_format=" {key} : {value} ",
+         confirm=CONFIRM_PROMPT, other_prompt="Please type your treatment name:",
+         recorded="✅ You have selected: {selected}. This has been added to your profile.",
+         other_recorded="Recorded : {selected}"),
+    Step("medication", "Based on your treatment ({treatment}), please select your medication (1-7):",
+         error="⛔️ INVALID SELECTION: Please enter a number from the list provided (e.g., 1-7).",
+         title="-- Medication verification --",
+         confirm=CONFIRM_PROMPT, other_prompt="Please type your medication name:",
+         recorded="✅ You have selected: {selected}. This has been added to your profile.",
+         other_recorded="Recorded : {selected}"),
+    Step("dosage", "Based on your medication :({medication}), Please select the prescribed dosage for your medication from the list (1-8:",
+         error=" ⛔️ INVALID INPUT: Please enter a number between 1 and 8 to select your dosage.",
+         title="-- Dosage Verification --",
+         confirm=CONFIRM_PROMPT, other_prompt="You selected 'Other.' Please type your specific frequency instructions (e.g., Every 48 hours): ",
+         recorded="✅ Dosage Recorded:: {selected}. has been saved to your regiment",
+         other_recorded="Recorded : {selected}"),
+    Step("frequency", "Please select your medication schedule (1-8): ",
+         error="⛔️ SELECTION ERROR: Please choose a valid frequency number from 1 to 8.",
+         title="-- Medication Frequency Verification --",
+         confirm=CONFIRM_PROMPT, other_prompt="You selected 'Other.' Please specify  your medication schedule: ",
+         recorded="✅ Schedule Recorded: {selected}.", other_recorded="Recorded : {selected}"),
+    Step("regimen_confirmed", "Please take your time to verify if everything in this summary is correct. Reply 'Y' for Yes or 'N' for No: ",
+         check=_check_yes_no),
+    Step("body_area", "To begin your report, Based on the list above, please type the number (1-7) that corresponds to the body region you wish to report: ",
+         error="⛔️ INPUT ERROR: That is not a valid selection. You must enter a single number from 1 to 7 to proceed.",
+         title="--- Symptom Localization Assessment ---",
+         confirm="Is the selected area correct? Please enter 'Y' for Yes or 'N' for No: ",
+         other_prompt="Please provide a specific description of the area or location: ",
+         recorded="✅ Area Recorded: We are now documenting symptoms for the {selected}"),
+    Step("symptom", "Based on the area selected ({body_area}), please select the specific symptom you are experiencing (1-7): ",
+         error="⛔️ SELECTION ERROR: Please enter a number from 1 to 7 to identify your specific symptom.",
+         title="--- Symptom Identification ---",
+         confirm="Is the selected symptom correct? Please enter 'Y' for Yes or 'N' for No: ",
+         other_prompt="You selected 'Other' Please type the name of the symptom you are experiencing in this area: ",
+         recorded="✅ Symptom Logged: {selected}  You have reported We will now assess the severity.",
+         other_recorded="✅ Recorded: {selected}. This has been added to your symptom report."),
+    Step("severity", "Based on your report of {symptom}, please select the severity grade that best describes your current state (1-5): ",
+         error="⛔️ INPUT ERROR: Please enter a number between 1 and 5 to accurately grade your symptom severity.",
+         title="--- Symptom Severity Assessment ---",
+         confirm="Is this severity rating correct? Enter 'Y' for Yes or 'N' for No: :",
+         other_prompt="Please provide any additional details regarding the intensity of this symptom: ",
+         recorded="✅ Severity Recorded: This symptom is logged as {selected}.",
+         other_recorded="✅ Recorded: {selected}. This has been added to your symptom report."),
+    Step("duration", "How long have you been experiencing {symptom}? Please select a timeframe (1-6): ",
+         error="⛔️ SELECTION ERROR: Please enter a valid number (1-6) to record the duration.",
+         title="--- Symptom Duration Assessment ---",
+         confirm="Is this timeframe correct? (Y/N):",
+         other_prompt="You selected 'Other.' Please type the specific duration or pattern (e.g., 'Only after meals' or 'Started 3 hours ago'): ",
+         recorded="✅ Duration Logged: This symptom has been present for {selected}",
+         other_recorded="✅ Recorded: {selected}. This has been added to your symptom report."),
+    *(Step(field, f"How would you describe your {symptom} today? Please enter a number from 0 (not present) to 10 (extremely severe):", check=_check_score)
+      for field, symptom in zip(SYMPTOM_FIELDS, PATIENT_SYMPTOMS)),
+    # PHASE 4: Clinical Context
+    Step("functional_status", "Based on the list above, which level best describes your current physical capability? Please choose a number (1-5):",
+         error="⛔️ SELECTION ERROR: Please select a valid level **(1-5)** to ensure the severity of your condition is correctly logged.",
+         title="--- Functional Status Assessment ---", option_format="{key} {value}",
+         preamble="Dear {name} ,  to assist with clinical triaging, we need to assess how your {body_area} symptoms affect your daily routine.",
+         confirm="Confirming: You have categorized your functional status as '{option}'. Is this accurate for your medical record? Please enter 'Y' for Yes or 'N' for No: ",
+         other_prompt="You selected Other **Please briefly describe how your symptoms are currently limiting your physical activities:** ",
+         confirm_other=True,
+         recorded="✅ Assessment Complete : Your {selected} has been recorded as Your current functional status"),
+    Step("recent_tests", "Dear {name} , to better understand your {symptom},have you had any medical tests recently that might be related? Please choose a number between (1-6) from the list above: ",
+         error="⛔️ INPUT ERROR: Please select a valid category (1-6) to ensure your {body_area} symptoms are properly documented.",
+         title="--- Recent Medical Tests Verification ---", option_format="{key} {value}",
+         confirm="Confirming: You would like to link '{option}' to your current report? Please enter 'Y' for Yes or 'N' for No: ",
+         other_prompt="You selected 'Other.' Please type the name of the specific test or procedure performed: ",
+         recorded="✅ Linked: Your {selected} results have been flagged for review alongside your symptoms."),
+    Step("patient_concern", "Regarding your {symptom}, what is your primary concern or question for the medical team? (Please write 1-2 sentences, or type 'N for None ' if you have no specific questions): ",
+         check=_check_concern),
+)
+
+FLOW = compile_flow(STEPS)
+
+# Fields the kiosk conversation asks, in order (severity/duration are desk-optional)
+KIOSK_FLOW = tuple(step.field for step in STEPS
+                  if step.field not in ("severity", "duration"))
@@ -0,0 +1,204 @@
+"""
+Regimen consistency and drug-interaction checks against a local formulary.
+
+A formulary file (JSON; onc/formulary.json by default) lists which
+medication groups each treatment category may use, the dose range of every
+drug, the dosing frequencies of each group and the drug pairs that
+interact. FormularyIndex turns it into in-memory lookups once:
+category -> allowed groups, drug -> group and dose range, group -> dose
+range and frequencies, drug pair -> interaction. Because the desk menus
+have a few hundred code combinations at most, the verdict of every
+(treatment, medication, dosage, frequency) combination is precomputed too,
+so checking a coded regimen is a single dictionary lookup; only regimens
+naming drugs in 'Other' free text are analysed on the spot.
+"""
+import argparse
+import json
+import os
+import sys
+from itertools import combinations, product
+from typing import NamedTuple
+
+from .core import (DOSAGE_LIST, MEDICATION_CHECKLIST, MEDICATION_FREQUENCY_LIST,
+                   MENU_FIELDS, TREATMENT_CHECKLIST)
+from .dosing import dose_mg
+from .record import PatientBatch
+from .store import PatientStore
+
+DEFAULT_FORMULARY = os.path.join(os.path.dirname(__file__), "formulary.json")
+
+# Issue kinds
+CATEGORY = "category"          # medication group not used by this treatment category
+DOSE = "dose"                  # dose outside the drug's (or group's) range
+FREQUENCY = "frequency"        # frequency not used for this medication group
+INTERACTION = "interaction"    # two drugs of the regimen interact
+UNKNOWN_DRUG = "unknown_drug"  # 'Other' medication text names no formulary drug
+
+_OTHER = {field: MENU_FIELDS[field][1] for field in ("treatment", "medication", "dosage", "frequency")}
+
+
+class RegimenIssue(NamedTuple):
+    kind: str
+    message: str
+
+
+class Interaction(NamedTuple):
+    drugs: tuple
+    severity: str              # "major", "moderate" or "minor"
+    note: str
+
+
+class FormularyIndex:
+    """Precomputed lookups of one formulary; see check() and review()."""
+
+    def __init__(self, formulary):
+        self.description = formulary.get("description", "")
+        self.treatments = {int(code): frozenset(groups)
+                           for code, groups in formulary["treatments"].items()}
+        self.frequencies = {int(code): frozenset(group["frequencies"])
+                            for code, group in formulary["groups"].items()}
+        self.drugs = {}                # casefolded name -> (name, group, (low, high))
+        group_ranges = {}
+        for name, drug in formulary["drugs"].items():
+            low, high = drug["dose_mg"]
+            self.drugs[name.casefold()] = (name, drug["group"], (low, high))
+            known = group_ranges.get(drug["group"], (low, high))
+            group_ranges[drug["group"]] = (min(known[0], low), max(known[1], high))
+        self.group_ranges = group_ranges
+        self.interactions = {}         # frozenset of two casefolded names -> Interaction
+        for first, second, severity, note in formulary["interactions"]:
+            self.interactions[frozenset((first.casefold(), second.casefold()))] = Interaction(
+                (first, second), severity, note)
+        # Every coded regimen, checked once
+        self._verdicts = {
+            regimen: tuple(self._coded_issues(*regimen))
+            for regimen in product(range(max(TREATMENT_CHECKLIST) + 1),
+                                   range(max(MEDICATION_CHECKLIST) + 1),
+                                   range(max(DOSAGE_LIST) + 1),
+                                   range(max(MEDICATION_FREQUENCY_LIST) + 1))}
+
+    def _coded_issues(self, treatment, medication, dosage, frequency):
+        allowed = self.treatments.get(treatment)
+        if allowed is not None and medication in self.group_ranges and medication not in allowed:
+            yield RegimenIssue(CATEGORY, f"{MEDICATION_CHECKLIST[medication].strip()} is not "
+                                         f"part of a {TREATMENT_CHECKLIST[treatment]} regimen.")
+        milligrams = dose_mg(dosage)
+        dose_range = self.group_ranges.get(medication)
+        if milligrams is not None and dose_range is not None:
+            yield from _dose_issue(MEDICATION_CHECKLIST[medication].strip(), milligrams, dose_range)
+        used = self.frequencies.get(medication)
+        if used is not None and frequency and frequency != _OTHER["frequency"] and frequency not in used:
+            yield RegimenIssue(FREQUENCY, f"{MEDICATION_FREQUENCY_LIST[frequency].strip()} is not a "
+                                          f"usual schedule for {MEDICATION_CHECKLIST[medication].strip()}.")
+
+    def named_drugs(self, text):
+        """Formulary drugs named in a comma-separated free-text answer, and the unknown names."""
+        known, unknown = [], []
+        for name in filter(None, (part.strip() for part in text.split(","))):
+            drug = self.drugs.get(name.casefold())
+            if drug is None:
+                unknown.append(name)
+            else:
+                known.append(drug)
+        return known, unknown
+
+    def interaction(self, first, second):
+        """Interaction between two drug names (any case), or None."""
+        return self.interactions.get(frozenset((first.casefold(), second.casefold())))
+
+    def check(self, treatment, medication, dosage, frequency, medication_other=None):
+        """
+        Issues of one regimen given as menu codes (medication_other: free text
+        of an 'Other' medication). An empty tuple means the regimen is consistent.
+        """
+        if medication != _OTHER["medication"] or not medication_other:
+            return self._verdicts.get((treatment, medication, dosage, frequency), ())
+        known, unknown = self.named_drugs(medication_other)
+        issues = [RegimenIssue(UNKNOWN_DRUG, f"{name} is not in the formulary.") for name in unknown]
+        allowed = self.treatments.get(treatment)
+        milligrams = dose_mg(dosage)
+        for name, group, dose_range in known:
+            if allowed is not None and group not in allowed:
+                issues.append(RegimenIssue(
+                    CATEGORY, f"{name} is not part of a {TREATMENT_CHECKLIST[treatment]} regimen."))
+            if milligrams is not None:
+                issues += _dose_issue(name, milligrams, dose_range)
+        for (first, *_), (second, *_) in combinations(known, 2):
+            found = self.interaction(first, second)
+            if found is not None:
+                issues.append(RegimenIssue(
+                    INTERACTION, f"{first} + {second} ({found.severity}): {found.note}"))
+        return tuple(issues)
+
+    def check_record(self, record):
+        """Issues of a PatientRecord's regimen (emergencies have none)."""
+        if record.status != "complete":
+            return ()
+        other = (record.other or {}).get("medication")
+        return self.check(record.treatment, record.medication, record.dosage,
+                          record.frequency, other)
+
+    def review(self, batch):
+        """
+        Bulk review of a PatientBatch (e.g. every active regimen): yields
+        (row, issues) for each regimen with at least one issue.
+        """
+        codes = batch.codes
+        verdicts = self._verdicts
+        rows = zip(codes["treatment"], codes["medication"], codes["dosage"], codes["frequency"])
+        for row, regimen in enumerate(rows):
+            if batch.statuses[row] != "complete":
+                continue
+            if regimen[1] == _OTHER["medication"] and row in batch.other:
+                issues = self.check(*regimen, batch.other[row].get("medication"))
+            else:
+                issues = verdicts.get(regimen, ())
+            if issues:
+                yield row, issues
+
+
+def _dose_issue(name, milligrams, dose_range):
+    low, high = dose_range
+    if not low <= milligrams <= high:
+        yield RegimenIssue(DOSE, f"{milligrams:g} mg is outside the {low:g}-{high:g} mg "
+                                 f"range of {name}.")
+
+
+def load_formulary(path=DEFAULT_FORMULARY):
+    """FormularyIndex of a formulary JSON file."""
+    with open(path, encoding="utf-8") as formulary:
+        return FormularyIndex(json.load(formulary))
+
+
+def review_main(argv):
+    """Command line entry: python -m onc --review patients.db [--formulary FILE] [-o FILE]."""
+    parser = argparse.ArgumentParser(
+        prog="python -m onc --review",
+        description="Check every active regimen of a patient store against the formulary.")
+    parser.add_argument("store", help="SQLite patient store (--store) holding the regimens")
+    parser.add_argument("--formulary", default=DEFAULT_FORMULARY, help="formulary JSON file")
+    parser.add_argument("-o", "--output", help="JSON lines of flagged regimens (default: standard output)")
+    options = parser.parse_args(argv)
+    index = load_formulary(options.formulary)
+    # Active regimen table: the latest visit of every patient
+    with PatientStore(options.store) as store:
+        visits = list(store.latest_visits())
+    batch = PatientBatch(record for _, record in visits)
+    out = open(options.output, "w", encoding="utf-8") if options.output else sys.stdout
+    flagged = 0
+    try:
+        for row, issues in index.review(batch):
+            flagged += 1
+            record = batch[row]
+            out.write(json.dumps({
+                "patient": record.name, "recorded_at": visits[row][0],
+                "regimen": {field: record.display(field)
+                            for field in ("treatment", "medication", "dosage", "frequency")},
+                "issues": [issue._asdict() for issue in issues]}, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    reviewed = batch.statuses.count("complete")
+    print(f"✅ {reviewed} active regimens reviewed | ⚠️ {flagged} flagged for pharmacy review",
+          file=sys.stderr)
+    return 0
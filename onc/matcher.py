@@ -0,0 +1,210 @@
+"""
+Free-text normalisation for 'Other' answers.
+
+TermMatcher maps the text typed after an 'Other' option back to a coded
+onc.vocabulary term. For every menu field it prebuilds a trigram index of
+the option texts, of their unambiguous fragments ("Breast", "Keytruda",
+"Biopsy") and of a few common aliases ("chemo", "radiotherapy"). A lookup
+normalises the text, tries an exact phrase first, then scores only the
+phrases that share a trigram with it, so its cost does not grow with the
+vocabulary. Resolutions go through a bounded LRU cache, since the same
+few spellings come back all day.
+
+A near miss must never change a quantity: dosage, frequency and duration
+are not matched at all ("1000 mg" is not "100 mg"), a match elsewhere needs
+the same numbers and units as the text, and text scoring about as well
+against two different options stays 'Other'.
+"""
+import re
+from array import array
+from functools import lru_cache
+from typing import NamedTuple
+
+from .core import MENU_FIELDS
+from .vocabulary import ENUMS, TERMS
+
+DEFAULT_THRESHOLD = 0.6        # lowest similarity accepted as a match
+DEFAULT_CACHE_SIZE = 4096      # (field, text) resolutions kept
+CONTAINMENT_WEIGHT = 0.9       # a phrase found whole inside longer text scores at most this
+MIN_FRAGMENT = 3               # shorter option fragments are too ambiguous to index
+AMBIGUITY_MARGIN = 0.2         # runner-up of another code this close: no match
+
+# Quantity fields: their options differ by a number or unit only
+UNMATCHED_FIELDS = frozenset({"dosage", "frequency", "duration"})
+UNITS = frozenset({"mg", "mcg", "ug", "g", "kg", "ml", "l", "iu", "units", "mg/m2",
+                   "hour", "hours", "day", "days", "week", "weeks", "month", "months",
+                   "year", "years", "daily", "weekly", "monthly", "once", "twice"})
+
+_SEPARATORS = re.compile(r"[(),:;/\t]+")
+_NOT_WORD = re.compile(r"[^\w]+")
+
+# Common spellings not found in the option texts: field -> {code: aliases}
+ALIASES = {
+    "pathology_type": {
+        1: ("adenocarcinoma", "breast cancer", "lung cancer", "prostate cancer",
+            "colon cancer", "colorectal cancer"),
+        2: ("osteosarcoma", "soft tissue sarcoma"),
+        3: ("hodgkin lymphoma", "non hodgkin lymphoma"),
+        4: ("leukaemia", "acute myeloid leukemia", "chronic lymphocytic leukemia"),
+        5: ("skin cancer",),
+        6: ("carcinoid", "neuroendocrine tumor"),
+    },
+    "treatment": {
+        1: ("chemo",),
+        2: ("radiotherapy", "radiation therapy"),
+        4: ("hormone therapy", "endocrine therapy"),
+        6: ("palliative care",),
+    },
+    "recent_tests": {
+        1: ("blood test", "blood work", "labs"),
+        2: ("ct scan", "mri scan", "x ray", "pet scan"),
+        4: ("electrocardiogram",),
+    },
+}
+
+
+class Match(NamedTuple):
+    field: str
+    code: int                  # onc.vocabulary enum member
+    phrase: str                # indexed phrase that matched
+    score: float               # 1.0 for an exact phrase
+
+
+def normalize(text):
+    """Case-folded words separated by single spaces, punctuation removed."""
+    return " ".join(_NOT_WORD.sub(" ", text.casefold()).split())
+
+
+def quantities(normalized):
+    """Number and unit words of normalised text, which a match must share exactly."""
+    return frozenset(word for word in normalized.split()
+                     if word in UNITS or any(character.isdigit() for character in word))
+
+
+def trigrams(normalized):
+    padded = f"  {normalized} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class _FieldIndex:
+    __slots__ = ("phrases", "codes", "sizes", "quantities", "exact", "postings")
+
+    def __init__(self, entries):
+        self.phrases = []
+        self.codes = []
+        self.sizes = array("H")
+        self.quantities = []
+        self.exact = {}
+        self.postings = {}     # trigram -> array of phrase indexes
+        for phrase, code in entries:
+            index = len(self.phrases)
+            grams = trigrams(phrase)
+            self.phrases.append(phrase)
+            self.codes.append(code)
+            self.sizes.append(len(grams))
+            self.quantities.append(quantities(phrase))
+            self.exact[phrase] = index
+            for gram in grams:
+                self.postings.setdefault(gram, array("I")).append(index)
+
+
+def _field_entries(field):
+    # (phrase, code) pairs: option texts, fragments unique to one option, aliases
+    _, other_code = MENU_FIELDS[field]
+    fragments = {}
+    entries = []
+    for code, term in TERMS[field].items():
+        if code == other_code:
+            continue
+        entries.append((normalize(term.display), code))
+        for part in _SEPARATORS.split(term.display):
+            for piece in part.split(","):
+                phrase = normalize(piece)
+                if len(phrase) >= MIN_FRAGMENT:
+                    fragments.setdefault(phrase, set()).add(code)
+    entries += [(phrase, codes.pop()) for phrase, codes in fragments.items() if len(codes) == 1]
+    enum = ENUMS[field]
+    for code, aliases in ALIASES.get(field, {}).items():
+        entries += [(normalize(alias), enum(code)) for alias in aliases]
+    # Keep the first (most specific) code of a duplicated phrase
+    unique = {}
+    for phrase, code in entries:
+        unique.setdefault(phrase, code)
+    return unique.items()
+
+
+class TermMatcher:
+    """
+    Resolves free text of the menu fields that have an 'Other' option
+    (except UNMATCHED_FIELDS). resolve(field, text) returns a Match or None;
+    results are cached (cache_size most recent (field, text) pairs).
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, cache_size=DEFAULT_CACHE_SIZE):
+        self.threshold = threshold
+        self.fields = tuple(field for field, (_, other) in MENU_FIELDS.items()
+                            if other is not None and field not in UNMATCHED_FIELDS)
+        self._indexes = {field: _FieldIndex(_field_entries(field)) for field in self.fields}
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _resolve(self, field, text):
+        index = self._indexes.get(field)
+        query = normalize(text)
+        if index is None or not query:
+            return None
+        exact = index.exact.get(query)
+        if exact is not None:
+            return Match(field, index.codes[exact], query, 1.0)
+        grams = trigrams(query)
+        shared = {}
+        postings = index.postings
+        for gram in grams:
+            for phrase in postings.get(gram, ()):
+                shared[phrase] = shared.get(phrase, 0) + 1
+        numbers = quantities(query)
+        best, best_score = None, 0.0
+        per_code = {}                  # code -> its best score, for the ambiguity test
+        for phrase, hits in shared.items():
+            if index.quantities[phrase] != numbers:
+                continue
+            size = index.sizes[phrase]
+            # Dice similarity, or how much of the phrase appears inside longer text
+            score = max(2 * hits / (len(grams) + size), CONTAINMENT_WEIGHT * hits / size)
+            code = index.codes[phrase]
+            per_code[code] = max(score, per_code.get(code, 0.0))
+            if score > best_score or (score == best_score and size > index.sizes[best]):
+                best, best_score = phrase, score
+        if best is None or best_score < self.threshold:
+            return None
+        runner_up = max((score for code, score in per_code.items() if code != index.codes[best]),
+                        default=0.0)
+        if best_score - runner_up < AMBIGUITY_MARGIN:
+            return None
+        return Match(field, index.codes[best], index.phrases[best], round(best_score, 3))
+
+    def resolve_many(self, field, texts):
+        """Matches (or None) of many texts of one field, in order."""
+        resolve = self.resolve
+        return [resolve(field, text) for text in texts]
+
+    def recode(self, record):
+        """
+        Replaces each 'Other' code of a PatientRecord whose text resolves
+        with the matched code; the typed text stays in record.other.
+        Returns {field: Match} of the fields recoded.
+        """
+        recoded = {}
+        for field, text in (record.other or {}).items():
+            if field not in self._indexes or getattr(record, field) != MENU_FIELDS[field][1]:
+                continue
+            match = self.resolve(field, text)
+            if match is not None:
+                setattr(record, field, int(match.code))
+                recoded[field] = match
+        return recoded
+
+
+@lru_cache(maxsize=1)
+def default_matcher():
+    """Process-wide TermMatcher with the default threshold (built on first use)."""
+    return TermMatcher()
@@ -0,0 +1,132 @@
+"""
+Hot-path instrumentation.
+
+Metrics collects per-stage wall-clock time, validation failures (every
+"⛔️" re-prompt), confirmation declines ('N' at a review question) and
+finished sessions per hour, and exports them as Prometheus text or a JSON
+snapshot. Instrumentation is opt-in: callers hold metrics=None by default and
+only test it on the stage boundary and on the error paths, so a desk without
+--metrics pays one comparison per stage.
+"""
+import json
+import time
+from collections import Counter
+
+
+class StageTiming:
+    """Running count/sum/max of one stage's wall-clock time, in seconds."""
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def to_dict(self):
+        return {"count": self.count, "total_seconds": self.total,
+                "mean_seconds": self.total / self.count if self.count else 0.0,
+                "max_seconds": self.max}
+
+
+class Metrics:
+    """Counters and timings of one desk, batch run or session server."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.stage = None                  # stage running now; error counters go to it
+        self.timings = {}                  # stage -> StageTiming
+        self.validation_failures = Counter()
+        self.declines = Counter()
+        self.sessions = Counter()          # status -> finished sessions
+        self.hourly = Counter()            # epoch hour -> finished sessions
+
+    def timed(self, stage, function, *args):
+        """Runs function(*args) as stage; its time is kept even if it raises."""
+        self.stage = stage
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def observe(self, stage, seconds):
+        timing = self.timings.get(stage)
+        if timing is None:
+            timing = self.timings[stage] = StageTiming()
+        timing.add(seconds)
+
+    def invalid(self, stage=None):
+        """One answer rejected by validation (the user is asked again)."""
+        self.validation_failures[stage or self.stage] += 1
+
+    def declined(self, stage=None):
+        """One 'N' at a confirmation question (the data is entered again)."""
+        self.declines[stage or self.stage] += 1
+
+    def session_finished(self, status):
+        self.sessions[status] += 1
+        self.hourly[int(time.time() // 3600)] += 1
+
+    def throughput_per_hour(self):
+        """Finished sessions per hour since the metrics were created."""
+        elapsed = max(time.time() - self.started, 1.0)
+        return sum(self.sessions.values()) * 3600 / elapsed
+
+    def snapshot(self):
+        """Everything collected so far as a JSON-ready dict."""
+        return {
+            "started": self.started,
+            "uptime_seconds": time.time() - self.started,
+            "stages": {stage: timing.to_dict() for stage, timing in self.timings.items()},
+            "validation_failures": dict(self.validation_failures),
+            "confirmation_declines": dict(self.declines),
+            "sessions": dict(self.sessions),
+            "sessions_per_hour": self.throughput_per_hour(),
+            "hourly": {time.strftime("%Y-%m-%dT%H:00", time.localtime(hour * 3600)): count
+                       for hour, count in sorted(self.hourly.items())},
+        }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = [
+            "# HELP onc_stage_seconds Wall-clock time spent in each triage stage.",
+            "# TYPE onc_stage_seconds summary",
+        ]
+        for stage, timing in self.timings.items():
+            lines.append(f'onc_stage_seconds_count{{stage="{stage}"}} {timing.count}')
+            lines.append(f'onc_stage_seconds_sum{{stage="{stage}"}} {timing.total:.6f}')
+        lines += ["# HELP onc_stage_seconds_max Longest time spent in each triage stage.",
+                  "# TYPE onc_stage_seconds_max gauge"]
+        lines += [f'onc_stage_seconds_max{{stage="{stage}"}} {timing.max:.6f}'
+                  for stage, timing in self.timings.items()]
+        lines += _counter("onc_validation_failures_total",
+                          "Answers rejected by validation.", "stage", self.validation_failures)
+        lines += _counter("onc_confirmation_declines_total",
+                          "Confirmations answered 'N'.", "stage", self.declines)
+        lines += _counter("onc_sessions_total",
+                          "Finished triage sessions.", "status", self.sessions)
+        lines += ["# HELP onc_sessions_per_hour Finished sessions per hour since start.",
+                  "# TYPE onc_sessions_per_hour gauge",
+                  f"onc_sessions_per_hour {self.throughput_per_hour():.3f}"]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Writes a snapshot: Prometheus text for *.prom, JSON otherwise."""
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json() + "\n"
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(text)
+
+
+def _counter(name, help_text, label, counts):
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    lines += [f'{name}{{{label}="{key}"}} {count}' for key, count in counts.items()]
+    return lines
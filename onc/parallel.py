@@ -0,0 +1,122 @@
+"""
+Multi-process triage of large patient backlogs.
+
+parallel_triage() shards a backlog of intake answers into chunks and triages
+them on a process pool, one chunk per task. Workers ship their results back
+as compact columnar PatientBatch arrays (plus the row numbers, acuities and,
+when asked, the rendered reports), never as pickled Clinical_Summary objects.
+The parent merges the chunks back in arrival order as they complete, or in
+priority order (most urgent first, ties in arrival order), and emits the
+emergencies to its sink.
+"""
+import heapq
+import itertools
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import IntakeError, triage_answers
+from .escalation import escalate
+from .priority import acuity_score
+from .record import PatientBatch
+from .report import render
+
+DEFAULT_CHUNK_SIZE = 2_000
+ORDERS = ("arrival", "priority")
+
+
+def _triage_chunk(chunk, report_format):
+    # Runs in a worker: everything returned is a flat, cheaply pickled column
+    rows = array("I")
+    acuities = array("H")
+    batch = PatientBatch()
+    errors = []
+    reports = [] if report_format else None
+    for row_number, answers in chunk:
+        try:
+            record = triage_answers(answers)
+            # All-or-nothing: a record the columns cannot hold leaves the batch aligned
+            batch.append(record)
+        except IntakeError as error:
+            errors.append((row_number, error.field, error.message))
+            continue
+        except (OverflowError, TypeError, ValueError) as error:
+            # Rejected like an invalid answer: one bad row never fails the whole run
+            errors.append((row_number, "record", f"cannot be stored: {error}"))
+            continue
+        rows.append(row_number)
+        acuities.append(acuity_score(record))
+        if reports is not None:
+            reports.append(render(record, report_format))
+    return rows, acuities, batch, errors, reports
+
+
+def _chunks(rows, chunk_size):
+    numbered = enumerate(rows, start=1)
+    while chunk := list(itertools.islice(numbered, chunk_size)):
+        yield chunk
+
+
+def _results(result):
+    # (row_number, record, error, report) of one chunk, in arrival order
+    rows, _, batch, errors, reports = result
+    merged = [(row, batch[index], None, reports[index] if reports else None)
+              for index, row in enumerate(rows)]
+    merged += [(row, None, IntakeError(field, message), None)
+               for row, field, message in errors]
+    merged.sort(key=lambda item: item[0])
+    return merged
+
+
+def parallel_triage(rows, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, order="arrival",
+                    emergency_sink=None, report_format=None):
+    """
+    Triage every answers dict in rows on a pool of worker processes
+    (default: one per CPU). Yields (row_number, record, error, report) where
+    exactly one of record/error is set and report is the record rendered in
+    report_format ("text", "json", "html") by the worker, or None.
+    order="arrival" streams results in input order with a bounded number of
+    chunks in flight; order="priority" waits for the whole backlog and
+    yields the most urgent patients first, rejected rows last.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"unknown order {order!r}; choose from {', '.join(ORDERS)}")
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if order == "arrival":
+            results = _in_arrival_order(pool, rows, workers, chunk_size, report_format)
+        else:
+            results = _in_priority_order(pool, rows, chunk_size, report_format)
+        for result in results:
+            record = result[1]
+            if record is not None and record.red_flag:
+                escalate(emergency_sink, record.name, record.red_flag, source="batch")
+            yield result
+
+
+def _in_arrival_order(pool, rows, workers, chunk_size, report_format):
+    # At most two chunks per worker in flight: a huge backlog is never all in memory
+    pending = []
+    for chunk in _chunks(rows, chunk_size):
+        pending.append(pool.submit(_triage_chunk, chunk, report_format))
+        if len(pending) >= 2 * workers:
+            yield from _results(pending.pop(0).result())
+    for future in pending:
+        yield from _results(future.result())
+
+
+def _in_priority_order(pool, rows, chunk_size, report_format):
+    futures = [pool.submit(_triage_chunk, chunk, report_format)
+               for chunk in _chunks(rows, chunk_size)]
+    chunks = [future.result() for future in futures]
+    # Each chunk sorted by (-acuity, row); one k-way merge gives the global order
+    runs = []
+    for position, (rows_done, acuities, _, _, _) in enumerate(chunks):
+        runs.append(sorted((-acuity, row, position, index)
+                           for index, (row, acuity) in enumerate(zip(rows_done, acuities))))
+    for _, row, position, index in heapq.merge(*runs):
+        _, _, batch, _, reports = chunks[position]
+        yield row, batch[index], None, reports[index] if reports else None
+    rejected = sorted(error for chunk in chunks for error in chunk[3])
+    for row, field, message in rejected:
+        yield row, None, IntakeError(field, message), None
@@ -0,0 +1,105 @@
+"""
+Priority triage queue ordered by clinical acuity.
+
+acuity_score() condenses the red-flag check, the 0-10 symptom scores, the
+CTCAE grade and the functional status of a PatientRecord into one number.
+TriageQueue is a binary heap keyed on that number: O(log n) push, pop of the
+most urgent patient and re-prioritization when new symptoms are reported,
+without ever re-sorting the census.
+"""
+import heapq
+import itertools
+
+from .core import MENU_FIELDS, is_alert_score
+
+# Acuity weights: a red flag always outranks any symptom picture
+RED_FLAG_WEIGHT = 1000
+MAX_SCORE_WEIGHT = 10       # per point of the worst 0-10 symptom score
+ALERT_WEIGHT = 5            # per symptom at or above the alert threshold
+CTCAE_GRADE_WEIGHT = 15     # per CTCAE grade (1-4)
+FUNCTIONAL_WEIGHT = 5       # per level of restriction beyond "Fully Independent"
+
+
+def acuity_score(record):
+    """Higher is more urgent. 'Other' grades and statuses add nothing (free text is not graded)."""
+    if record.red_flag:
+        return RED_FLAG_WEIGHT
+    scores = record.symptom_scores
+    acuity = MAX_SCORE_WEIGHT * max(scores, default=0)
+    acuity += ALERT_WEIGHT * sum(1 for score in scores if is_alert_score(score))
+    if record.severity and record.severity != MENU_FIELDS["severity"][1]:
+        acuity += CTCAE_GRADE_WEIGHT * record.severity
+    if record.functional_status and record.functional_status != MENU_FIELDS["functional_status"][1]:
+        acuity += FUNCTIONAL_WEIGHT * (record.functional_status - 1)
+    return acuity
+
+
+class TriageQueue:
+    """
+    Patients waiting for a nurse, most urgent first; ties keep arrival order.
+    Re-prioritized entries are invalidated in place and skipped lazily on pop,
+    so every operation stays O(log n).
+    """
+    _REMOVED = object()
+
+    def __init__(self):
+        self._heap = []
+        self._entries = {}             # patient_id -> live heap entry
+        self._arrivals = itertools.count()
+        self._pushes = itertools.count()   # unique tie-break: entries never compare ids
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, patient_id):
+        return patient_id in self._entries
+
+    def push(self, patient_id, record):
+        """Adds a patient, or re-prioritizes one already waiting. Returns the acuity."""
+        arrival = None
+        if patient_id in self._entries:
+            arrival = self._invalidate(patient_id)
+        if arrival is None:
+            arrival = next(self._arrivals)
+        acuity = acuity_score(record)
+        # heapq is a min-heap: negate acuity so the most urgent sits at the top
+        entry = [-acuity, arrival, next(self._pushes), patient_id, record]
+        self._entries[patient_id] = entry
+        heapq.heappush(self._heap, entry)
+        return acuity
+
+    def update(self, patient_id, record):
+        """Re-prioritizes a waiting patient after new symptoms; keeps their arrival rank."""
+        if patient_id not in self._entries:
+            raise KeyError(patient_id)
+        return self.push(patient_id, record)
+
+    def remove(self, patient_id):
+        """Takes a patient out of the queue (left, or seen elsewhere)."""
+        self._invalidate(patient_id)
+
+    def peek(self):
+        """(patient_id, record, acuity) of the most urgent patient, without removing it."""
+        self._discard_removed()
+        if not self._heap:
+            raise KeyError("peek from an empty triage queue")
+        negated, _, _, patient_id, record = self._heap[0]
+        return patient_id, record, -negated
+
+    def pop(self):
+        """Removes and returns (patient_id, record, acuity) of the most urgent patient."""
+        self._discard_removed()
+        if not self._heap:
+            raise KeyError("pop from an empty triage queue")
+        negated, _, _, patient_id, record = heapq.heappop(self._heap)
+        del self._entries[patient_id]
+        return patient_id, record, -negated
+
+    def _invalidate(self, patient_id):
+        entry = self._entries.pop(patient_id)
+        entry[3] = self._REMOVED
+        return entry[1]
+
+    def _discard_removed(self):
+        while self._heap and self._heap[0][3] is self._REMOVED:
+            heapq.heappop(self._heap)
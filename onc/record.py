@@ -0,0 +1,173 @@
+"""
+Compact patient records.
+
+PatientRecord keeps only the clinical fields of a completed triage, as menu
+codes plus the few free-text answers, in a slotted dataclass with no
+per-instance __dict__. PatientBatch stores many records column by column
+(struct-of-arrays) in typed arrays for a full day's census and history.
+Display strings are looked up from the onc.vocabulary code tables only when
+needed.
+"""
+from array import array
+from dataclasses import dataclass, fields
+
+from .core import MENU_FIELDS, PATIENT_SYMPTOMS, RED_FLAG_CHECKLIST, is_alert_score
+from .dosing import body_metrics, dose_check
+from .vocabulary import display
+
+# Menu-coded fields in record order; 0 means "not asked"
+CODE_FIELDS = tuple(MENU_FIELDS)
+
+
+@dataclass(slots=True)
+class PatientRecord:
+    """One patient's validated triage answers."""
+    name: str
+    age: int
+    sex: str
+    weight: float
+    height: float
+    status: str = "complete"      # "complete" or "emergency"
+    red_flag: int = 0             # 1-7: checklist item answered 'Y', 0 when none
+    visit_reason: int = 0
+    pathology_type: int = 0
+    pathology_stage: int = 0
+    treatment: int = 0
+    medication: int = 0
+    dosage: int = 0
+    frequency: int = 0
+    body_area: int = 0
+    symptom: int = 0
+    severity: int = 0
+    duration: int = 0
+    functional_status: int = 0
+    recent_tests: int = 0
+    symptom_scores: bytes = b""   # the six 0-10 scores, PATIENT_SYMPTOMS order
+    patient_concern: str = ""
+    other: dict = None            # free text of 'Other' answers, keyed by field
+
+    @property
+    def BMI(self):
+        return self.derived_metrics.bmi
+
+    @property
+    def derived_metrics(self):
+        """BMI, BSA, ideal/adjusted body weight (onc.dosing, memoised)."""
+        return body_metrics(self.weight, self.height, self.sex)
+
+    @property
+    def dose_check(self):
+        """onc.dosing.DoseCheck of the prescribed dosage, or None when not checked."""
+        return dose_check(self.medication, self.dosage, self.weight, self.height, self.sex)
+
+    @property
+    def symptom_selection(self):
+        return dict(zip(PATIENT_SYMPTOMS, self.symptom_scores))
+
+    @property
+    def alerts(self):
+        return [symptom for symptom, score in zip(PATIENT_SYMPTOMS, self.symptom_scores)
+                if is_alert_score(score)]
+
+    def display(self, field):
+        """Display string of a menu-coded field ('Other' returns the typed text)."""
+        code = getattr(self, field)
+        if not code:
+            return None
+        if code == MENU_FIELDS[field][1]:
+            return self.other[field]
+        return display(field, code)
+
+    def to_dict(self):
+        """Display form of the record, as written to JSON results."""
+        result = {"status": self.status, "name": self.name, "age": self.age,
+                  "sex": self.sex, "weight": self.weight,
+                  "height": self.height, "BMI": self.BMI,
+                  "red_flag": RED_FLAG_CHECKLIST[self.red_flag - 1] if self.red_flag else None}
+        if self.status == "emergency":
+            # Nothing past the safety check is collected for an emergency
+            return result
+        for field in CODE_FIELDS:
+            result[field] = self.display(field)
+        result["symptom_selection"] = self.symptom_selection
+        result["alerts"] = self.alerts
+        result["patient_concern"] = self.patient_concern
+        return result
+
+
+class PatientBatch:
+    """
+    Columnar (struct-of-arrays) store of PatientRecords.
+    Codes live in unsigned byte arrays, metrics in double arrays and the six
+    symptom scores in one flat byte array (row i at [6*i, 6*i + 6]).
+    """
+    __slots__ = ("names", "ages", "sexes", "weights", "heights", "statuses",
+                 "red_flags", "codes", "symptom_scores", "concerns", "other")
+
+    def __init__(self, records=()):
+        self.names = []
+        self.ages = array("H")
+        self.sexes = []
+        self.weights = array("d")
+        self.heights = array("d")
+        self.statuses = []
+        self.red_flags = array("B")
+        self.codes = {field: array("B") for field in CODE_FIELDS}
+        self.symptom_scores = array("B")
+        self.concerns = []
+        self.other = {}               # row -> 'Other' free text, only when present
+        for record in records:
+            self.append(record)
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, record):
+        """
+        Adds one record. Values a column cannot hold (an age of -4, a code
+        above 255...) raise OverflowError, TypeError or ValueError before any
+        column grows, so a rejected record leaves the batch aligned.
+        """
+        row = len(self.names)
+        age = array("H", (record.age,))
+        metrics = array("d", (record.weight, record.height))
+        red_flag = array("B", (record.red_flag,))
+        codes = array("B", (getattr(record, field) for field in CODE_FIELDS))
+        # Emergencies stop before the symptom stage: keep rows aligned with zeros
+        scores = record.symptom_scores or bytes(len(PATIENT_SYMPTOMS))
+        if len(scores) != len(PATIENT_SYMPTOMS):
+            raise ValueError(f"expected {len(PATIENT_SYMPTOMS)} symptom scores, got {len(scores)}")
+        self.names.append(record.name)
+        self.ages.extend(age)
+        self.sexes.append(record.sex)
+        self.weights.append(metrics[0])
+        self.heights.append(metrics[1])
+        self.statuses.append(record.status)
+        self.red_flags.extend(red_flag)
+        for field, code in zip(CODE_FIELDS, codes):
+            self.codes[field].append(code)
+        self.symptom_scores.frombytes(scores)
+        self.concerns.append(record.patient_concern)
+        if record.other:
+            self.other[row] = record.other
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self)
+        width = len(PATIENT_SYMPTOMS)
+        scores = self.symptom_scores[row * width:(row + 1) * width].tobytes()
+        return PatientRecord(
+            name=self.names[row], age=self.ages[row], sex=self.sexes[row],
+            weight=self.weights[row], height=self.heights[row],
+            status=self.statuses[row], red_flag=self.red_flags[row],
+            symptom_scores=scores if self.statuses[row] != "emergency" else b"",
+            patient_concern=self.concerns[row], other=self.other.get(row),
+            **{field: self.codes[field][row] for field in CODE_FIELDS})
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+
+# Field names in declaration order, for exporters and stores
+RECORD_FIELDS = tuple(field.name for field in fields(PatientRecord))
@@ -0,0 +1,243 @@
+"""
+Buffered, templated report renderer.
+
+The SOAP (Subjective, Objective, Assessment, Plan) summary of a PatientRecord
+is filled into a template compiled once at import and returned as one
+string: plain text for the desk and kiosks, JSON for dashboards, or HTML
+with a print stylesheet that any HTML-to-PDF tool turns into a paginated
+PDF. write_reports() renders a whole census into a file or stream in large
+buffered writes instead of one terminal write per line.
+"""
+import html
+import json
+import sys
+
+from .core import RED_FLAG_CHECKLIST, is_alert_score
+
+RULE = "═" * 60
+THIN_RULE = "─" * 60
+
+# Reports rendered per write() call by ReportWriter
+WRITE_CHUNK = 256
+
+# --- Templates (compiled once; only str.format_map runs per patient) ---
+
+TEXT_TEMPLATE = "\n".join([
+    "\n" + RULE,
+    "                 OFFICIAL CLINICAL SUMMARY",
+    RULE,
+    # Chief Complaint
+    "REASON FOR VISIT:  [ {visit_reason} ]",
+    THIN_RULE,
+    # Objective Metrics
+    "PATIENT: {name_upper}",
+    "METRICS: {age}y | {height}m | {weight}kg | BMI: {bmi}",
+    THIN_RULE,
+    # Clinical Background
+    "FUNCTIONAL & CLINICAL CONTEXT:",
+    "• Mobility Status: {functional_status}",
+    "• Background:      {patient_concern}",
+    THIN_RULE,
+    # Diagnosis & Plan
+    "DIAGNOSIS: {pathology_type} ({pathology_stage})",
+    "CURRENT REGIMEN: {medication} ({dosage})",
+    "FREQUENCY:       {frequency}",
+    THIN_RULE,
+    # Subjective Symptoms
+    "CURRENT ISSUE: {symptom} ({body_area})",
+    "\nREPORTED SEVERITY (0-10):",
+    "{severity_lines}",
+    RULE,
+    "REPORT COMPLETE - FORWARDED TO CLINICAL DASHBOARD",
+    RULE,
+])
+TEXT_SEVERITY_LINE = "  {marker} {symptom}: {score}"
+
+TEXT_EMERGENCY_TEMPLATE = "\n".join([
+    "\n" + RULE,
+    "                 EMERGENCY ROUTING",
+    RULE,
+    "PATIENT: {name_upper}",
+    "METRICS: {age}y | {height}m | {weight}kg | BMI: {bmi}",
+    THIN_RULE,
+    "RED FLAG: {red_flag}",
+    "Session stopped at the safety check - patient directed to the Emergency Room.",
+    RULE,
+])
+
+HTML_STYLE = """<style>
+body { font-family: sans-serif; margin: 2em; }
+section.report { border: 1px solid #999; padding: 1em; margin-bottom: 2em; page-break-after: always; }
+section.emergency { border-color: #c00; }
+h1 { font-size: 1.3em; }
+dt { font-weight: bold; }
+li.alert { color: #c00; font-weight: bold; }
+@page { size: A4; margin: 15mm; }
+@media print { section.report { border: none; } }
+</style>"""
+
+HTML_HEAD = "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n" \
+            "<title>Clinical Summaries</title>\n" + HTML_STYLE + "\n</head>\n<body>\n"
+HTML_TAIL = "</body>\n</html>\n"
+
+HTML_TEMPLATE = """<section class="report">
+<h1>Official Clinical Summary</h1>
+<p><strong>Reason for visit:</strong> {visit_reason}</p>
+<dl>
+<dt>Patient</dt><dd>{name}</dd>
+<dt>Metrics</dt><dd>{age}y | {height}m | {weight}kg | BMI: {bmi}</dd>
+<dt>Mobility status</dt><dd>{functional_status}</dd>
+<dt>Background</dt><dd>{patient_concern}</dd>
+<dt>Diagnosis</dt><dd>{pathology_type} ({pathology_stage})</dd>
+<dt>Current regimen</dt><dd>{medication} ({dosage})</dd>
+<dt>Frequency</dt><dd>{frequency}</dd>
+<dt>Current issue</dt><dd>{symptom} ({body_area})</dd>
+</dl>
+<h2>Reported severity (0-10)</h2>
+<ul>
+{severity_lines}
+</ul>
+</section>
+"""
+HTML_SEVERITY_LINE = "<li{css}>{symptom}: {score}</li>"
+
+HTML_EMERGENCY_TEMPLATE = """<section class="report emergency">
+<h1>Emergency Routing</h1>
+<dl>
+<dt>Patient</dt><dd>{name}</dd>
+<dt>Metrics</dt><dd>{age}y | {height}m | {weight}kg | BMI: {bmi}</dd>
+<dt>Red flag</dt><dd>{red_flag}</dd>
+</dl>
+<p>Session stopped at the safety check - patient directed to the Emergency Room.</p>
+</section>
+"""
+
+_DISPLAY_FIELDS = ("visit_reason", "functional_status", "pathology_type",
+                   "pathology_stage", "medication", "dosage", "frequency",
+                   "symptom", "body_area")
+
+
+def _fields(record, escape):
+    values = {"name": escape(record.name), "name_upper": escape(record.name.upper()),
+              "age": record.age, "height": record.height, "weight": record.weight,
+              "bmi": round(record.BMI, 1)}
+    if record.status == "emergency":
+        values["red_flag"] = escape(RED_FLAG_CHECKLIST[record.red_flag - 1].strip())
+        return values
+    for field in _DISPLAY_FIELDS:
+        values[field] = escape(str(record.display(field)))
+    values["patient_concern"] = escape(record.patient_concern)
+    return values
+
+
+def _keep(value):
+    return value
+
+
+def render_text(record):
+    """Plain-text SOAP summary (what the desk prints), as one string."""
+    if record.status == "emergency":
+        return TEXT_EMERGENCY_TEMPLATE.format_map(_fields(record, _keep))
+    values = _fields(record, _keep)
+    values["severity_lines"] = "\n".join(
+        TEXT_SEVERITY_LINE.format(marker="⚠️" if is_alert_score(score) else "•",
+                                  symptom=symptom, score=score)
+        for symptom, score in record.symptom_selection.items())
+    return TEXT_TEMPLATE.format_map(values)
+
+
+def render_json(record):
+    """Structured summary for dashboards: the record's display form as one JSON object."""
+    return json.dumps(record.to_dict(), ensure_ascii=False)
+
+
+def render_html(record):
+    """One <section> of print-ready HTML (wrap with HTML_HEAD/HTML_TAIL for a document)."""
+    if record.status == "emergency":
+        return HTML_EMERGENCY_TEMPLATE.format_map(_fields(record, html.escape))
+    values = _fields(record, html.escape)
+    values["severity_lines"] = "\n".join(
+        HTML_SEVERITY_LINE.format(css=' class="alert"' if is_alert_score(score) else "",
+                                  symptom=html.escape(symptom.strip()), score=score)
+        for symptom, score in record.symptom_selection.items())
+    return HTML_TEMPLATE.format_map(values)
+
+
+# format -> (renderer, document head, separator, document tail)
+FORMATS = {
+    "text": (render_text, "", "\n", ""),
+    "json": (render_json, "", "\n", ""),         # JSON lines, one report per line
+    "html": (render_html, HTML_HEAD, "", HTML_TAIL),
+}
+
+
+def build_professional_report(record):
+    """
+    Builds the SOAP (Subjective, Objective, Assessment, Plan) clinical summary
+    for a completed PatientRecord and returns it as a single string.
+    """
+    return render_text(record)
+
+
+def render(record, fmt="text"):
+    """One report in the requested format ("text", "json" or "html")."""
+    try:
+        renderer = FORMATS[fmt][0]
+    except KeyError:
+        raise ValueError(f"unknown report format {fmt!r}; choose from {', '.join(FORMATS)}") from None
+    return renderer(record)
+
+
+class ReportWriter:
+    """
+    Streams rendered reports to an open text stream, WRITE_CHUNK reports per
+    write() call. close() flushes the rest and ends the document (HTML).
+    """
+
+    def __init__(self, out, fmt="text"):
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown report format {fmt!r}; choose from {', '.join(FORMATS)}")
+        self.out = out
+        self.renderer, head, self.separator, self.tail = FORMATS[fmt]
+        self.written = 0
+        self._chunk = []
+        out.write(head)
+
+    def add(self, record):
+        self.add_rendered(self.renderer(record))
+
+    def add_rendered(self, report):
+        """Queues a report already rendered in this writer's format."""
+        self._chunk.append(report)
+        if len(self._chunk) >= WRITE_CHUNK:
+            self.flush()
+
+    def flush(self):
+        if self._chunk:
+            self.out.write(self.separator.join(self._chunk) + self.separator)
+            self.written += len(self._chunk)
+            self._chunk = []
+
+    def close(self):
+        self.flush()
+        self.out.write(self.tail)
+        self.out.flush()
+
+
+def write_reports(records, destination=None, fmt="text"):
+    """
+    Renders every record and writes them to destination: a path, an open
+    text stream, or standard output when None. Returns how many were written.
+    """
+    if isinstance(destination, str):
+        with open(destination, "w", encoding="utf-8") as out:
+            return _write_reports(records, out, fmt)
+    return _write_reports(records, sys.stdout if destination is None else destination, fmt)
+
+
+def _write_reports(records, out, fmt):
+    writer = ReportWriter(out, fmt)
+    for record in records:
+        writer.add(record)
+    writer.close()
+    return writer.written
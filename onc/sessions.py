@@ -0,0 +1,324 @@
+"""
+Asyncio session server.
+
+Each kiosk or tablet conversation is a TriageSession: a small state machine
+that walks the declared flow of onc.flow (registration -> red flags -> pathology -> regimen ->
+side effects -> context -> summary) one answer at a time instead of blocking
+on input(). A SessionManager keeps thousands of them in memory and a single
+event loop multiplexes them over newline-delimited JSON, on a local TCP or
+unix socket or on stdin/stdout:
+
+    -> {"session": "kiosk-3"}                      opens a session (or repeats its pending prompt)
+    <- {"session": "kiosk-3", "prompt": "...", "done": false}
+    -> {"session": "kiosk-3", "answer": "Jane Doe"}
+    <- {"session": "kiosk-3", "prompt": "...", "done": false}
+    ...
+    <- {"session": "kiosk-3", "done": true, "status": "complete", "report": "..."}
+
+A session that fails (e.g. an IntakeError from the engine) is closed with
+{"session": ..., "done": true, "error": "..."}; the other sessions of the
+connection carry on.
+"""
+import argparse
+import asyncio
+import functools
+import json
+import sys
+import time
+
+from .census import DEFAULT_SITE, CensusEngine
+from .engine import triage_answers
+from .escalation import FileSink, escalate
+from .events import open_dashboard
+from .metrics import Metrics
+from .flow import FLOW, KIOSK_FLOW, RED_FLAG_FIELDS, render
+from .report import render_text
+from .store import PatientStore
+
+# Sessions untouched for this long are dropped (seconds)
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+
+class _SessionContext:
+    # Display text of the answers given so far, for the flow templates
+    __slots__ = ("answers",)
+
+    def __init__(self, answers):
+        self.answers = answers
+
+    def __getitem__(self, key):
+        answer = self.answers[key]
+        if key not in FLOW or FLOW[key].menu is None:
+            return answer
+        compiled = FLOW[key]
+        code = compiled.parse(answer)
+        if code == compiled.other_code:
+            return self.answers.get(f"{key}_other", "")
+        return compiled.menu[code]
+
+
+_POSITION = {field: index for index, field in enumerate(KIOSK_FLOW)}
+
+
+class TriageSession:
+    """One patient's conversation; feed() takes an answer and returns the reply."""
+    __slots__ = ("session_id", "answers", "step", "other_for", "last_seen", "record")
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.answers = {}
+        self.step = 0
+        self.other_for = None       # menu field waiting for its 'Other' free text
+        self.last_seen = time.monotonic()
+        self.record = None
+
+    def start(self):
+        return self._reply(prompt=self._prompt())
+
+    def pending(self):
+        """The question still waiting for an answer (a kiosk reconnecting), nothing answered."""
+        self.last_seen = time.monotonic()
+        if self.other_for is not None:
+            return self._reply(prompt=FLOW[self.other_for].step.other_prompt)
+        return self._reply(prompt=self._prompt())
+
+    def feed(self, answer):
+        self.last_seen = time.monotonic()
+        answer = str(answer).strip()
+        if self.other_for is not None:
+            if not answer:
+                return self._reply(prompt=FLOW[self.other_for].step.other_prompt,
+                                   error="⛔️ Please type a short description.")
+            self.answers[f"{self.other_for}_other"] = answer
+            self.other_for = None
+            return self._advance()
+
+        field = KIOSK_FLOW[self.step]
+        compiled = FLOW[field]
+        error = compiled.check(answer, _SessionContext(self.answers))
+        if error is not None:
+            return self._reply(prompt=self._prompt(), error=error)
+        self.answers[field] = answer
+
+        if field == "registration_confirmed" and answer.upper() in ("N", "NO"):
+            self.step = _POSITION["name"]
+            return self._reply(prompt=self._prompt(),
+                               notice="Validation Declined ⛔️. Please restart the registration.")
+        if field == "regimen_confirmed" and answer.upper() in ("N", "NO"):
+            self.step = _POSITION["treatment"]
+            return self._reply(prompt=self._prompt(),
+                               notice="⚠️ Profile Redirected:⚠️ Please try Again..")
+        if field in RED_FLAG_FIELDS and answer.upper() == "Y":
+            # Safety stop: nothing else is collected for this patient
+            return self._finish()
+        if compiled.other_code is not None and compiled.parse(answer) == compiled.other_code:
+            self.other_for = field
+            return self._reply(prompt=compiled.step.other_prompt)
+        return self._advance()
+
+    def _advance(self):
+        self.step += 1
+        if self.step == len(KIOSK_FLOW):
+            return self._finish()
+        return self._reply(prompt=self._prompt())
+
+    def _finish(self):
+        # Every answer was checked on the way in; the engine builds the record
+        self.record = triage_answers(self.answers)
+        reply = self._reply(done=True, status=self.record.status)
+        if self.record.status == "complete":
+            reply["report"] = render_text(self.record)
+        return reply
+
+    def _prompt(self):
+        compiled = FLOW[KIOSK_FLOW[self.step]]
+        prompt = render(compiled.step.prompt, _SessionContext(self.answers)).strip()
+        return f"{compiled.menu_text.strip()}\n{prompt}" if compiled.menu_text else prompt
+
+    def _reply(self, done=False, **fields):
+        return {"session": self.session_id, "done": done, **fields}
+
+
+class SessionManager:
+    """
+    Routes messages to their TriageSession by session id.
+    on_complete(record) receives every finished record (complete or emergency).
+    metrics (onc.metrics.Metrics) times each question from prompt to valid
+    answer and counts re-prompts and declined confirmations per field.
+    """
+
+    def __init__(self, emergency_sink=None, on_complete=None,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT, metrics=None):
+        self.sessions = {}
+        self.emergency_sink = emergency_sink
+        self.on_complete = on_complete
+        self.idle_timeout = idle_timeout
+        self.metrics = metrics
+
+    def handle(self, message):
+        session_id = message.get("session")
+        if not session_id:
+            return {"error": "⛔️ Every message needs a 'session' id.", "done": False}
+        session = self.sessions.get(session_id)
+        if session is None or message.get("restart"):
+            session = self.sessions[session_id] = TriageSession(session_id)
+            return session.start()
+        if "answer" not in message:
+            # Resuming an open session: repeat its prompt without advancing
+            return session.pending()
+        try:
+            if self.metrics is None:
+                reply = session.feed(message["answer"])
+            else:
+                reply = self._feed_measured(session, message["answer"])
+            if reply["done"]:
+                del self.sessions[session_id]
+                record = session.record
+                if self.metrics is not None:
+                    self.metrics.session_finished(record.status)
+                if record.red_flag:
+                    escalate(self.emergency_sink, record.name, record.red_flag, source="kiosk")
+                if self.on_complete is not None:
+                    self.on_complete(record)
+        except Exception as error:  # one failed session must not drop the connection it shares
+            self.sessions.pop(session_id, None)
+            if self.metrics is not None:
+                self.metrics.session_finished("failed")
+            return {"session": session_id, "done": True,
+                    "error": f"⛔️ Session closed, please start again: {error}"}
+        return reply
+
+    def _feed_measured(self, session, answer):
+        field = (KIOSK_FLOW[session.step] if session.other_for is None
+                 else f"{session.other_for}_other")
+        asked = session.last_seen
+        reply = session.feed(answer)
+        if "error" in reply:
+            self.metrics.invalid(field)
+        else:
+            self.metrics.observe(field, session.last_seen - asked)
+            if "notice" in reply:
+                # Registration or regimen review answered 'N'
+                self.metrics.declined(field)
+        return reply
+
+    def expire_idle(self):
+        """Drops sessions idle for longer than idle_timeout; returns how many."""
+        deadline = time.monotonic() - self.idle_timeout
+        expired = [session_id for session_id, session in self.sessions.items()
+                   if session.last_seen < deadline]
+        for session_id in expired:
+            del self.sessions[session_id]
+        return len(expired)
+
+
+def _handle_line(manager, line):
+    try:
+        message = json.loads(line)
+        if not isinstance(message, dict):
+            raise ValueError("not an object")
+    except ValueError:
+        reply = {"error": "⛔️ Messages must be JSON objects, one per line.", "done": False}
+    else:
+        reply = manager.handle(message)
+    return (json.dumps(reply, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+async def _serve_connection(manager, reader, writer):
+    # One connection may carry many sessions (e.g. a gateway for a room of tablets)
+    try:
+        while line := await reader.readline():
+            if line.strip():
+                writer.write(_handle_line(manager, line))
+                await writer.drain()
+    finally:
+        writer.close()
+
+
+async def _expire_idle_sessions(manager, interval):
+    while True:
+        await asyncio.sleep(interval)
+        manager.expire_idle()
+
+
+async def serve(manager, host="127.0.0.1", port=8765, path=None):
+    """Serves the protocol on a local unix socket (path) or TCP host:port until cancelled."""
+    handler = functools.partial(_serve_connection, manager)
+    if path:
+        server = await asyncio.start_unix_server(handler, path=path)
+    else:
+        server = await asyncio.start_server(handler, host, port)
+    sweeper = asyncio.create_task(_expire_idle_sessions(manager, 60))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        sweeper.cancel()
+
+
+async def serve_stdio(manager):
+    """Serves the protocol on stdin/stdout (one process per kiosk gateway)."""
+    loop = asyncio.get_running_loop()
+    # A reader thread works for pipes, terminals and redirected files alike
+    while line := await loop.run_in_executor(None, sys.stdin.buffer.readline):
+        if line.strip():
+            sys.stdout.buffer.write(_handle_line(manager, line))
+            sys.stdout.flush()
+
+
+def serve_main(argv):
+    """Command line entry: python -m onc --serve [--port N | --unix PATH | --stdio]."""
+    parser = argparse.ArgumentParser(
+        prog="python -m onc --serve",
+        description="Serve many concurrent triage sessions over newline-delimited JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a unix socket instead of TCP")
+    parser.add_argument("--stdio", action="store_true", help="read requests from stdin, reply on stdout")
+    parser.add_argument("--emergency-log",
+                        help="append every emergency event as a JSON line to this file")
+    parser.add_argument("--store", metavar="DB",
+                        help="save every finished session to this SQLite patient store")
+    parser.add_argument("--dashboard", metavar="TARGET",
+                        help="stream dashboard events to tcp://HOST:PORT, unix:PATH or a JSON-lines file")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="write per-question timings and error counters to FILE at exit "
+                             "(.prom: Prometheus text, else JSON)")
+    parser.add_argument("--census", metavar="FILE",
+                        help="write the census of finished sessions (counts per visit reason, pathology, "
+                             "grade...) to FILE at exit as JSON")
+    parser.add_argument("--site", default=DEFAULT_SITE,
+                        help="site name the kiosk sessions are counted under in the census")
+    options = parser.parse_args(argv)
+    sink = FileSink(options.emergency_log) if options.emergency_log else None
+    store = PatientStore(options.store) if options.store else None
+    dashboard = open_dashboard(options.dashboard) if options.dashboard else None
+    census = CensusEngine(options.site) if options.census else None
+
+    def on_complete(record):
+        if store is not None:
+            store.add(record)
+        if dashboard is not None:
+            dashboard.publish_record(record, "kiosk")
+        if census is not None:
+            census.add_record(record)
+
+    metrics = Metrics() if options.metrics else None
+    manager = SessionManager(emergency_sink=sink, on_complete=on_complete, metrics=metrics)
+    try:
+        if options.stdio:
+            asyncio.run(serve_stdio(manager))
+        else:
+            asyncio.run(serve(manager, options.host, options.port, options.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if store is not None:
+            store.close()
+        if dashboard is not None:
+            dashboard.close()
+        if metrics is not None:
+            metrics.write(options.metrics)
+        if census is not None:
+            census.write(options.census)
+    return 0
@@ -0,0 +1,220 @@
+"""
+Persistent patient store (SQLite).
+
+Every completed or emergency triage is written as one row of the patients
+table, so the day's census survives the end of the desk loop. Indexes on
+patient name, visit reason, pathology/stage and alert status keep the usual
+lookups off full table scans, and add_many() inserts high-volume intake in
+chunked transactions instead of committing row by row. last_visit() serves
+returning patients from a small LRU cache of latest records, so a same-day
+repeat visitor does not cost a query.
+
+A returning patient is identified by name and age together: namesakes are
+common, and a record on file is only offered when its age is consistent
+with the age given today (within a year of its age plus the years since).
+"""
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+
+from .record import CODE_FIELDS, PatientRecord
+
+# Rows per transaction in add_many(): one commit (and fsync) per chunk
+DEFAULT_CHUNK_SIZE = 500
+# Patients whose latest record (or absence of one) is kept in memory
+DEFAULT_RECENT_CAPACITY = 256
+# Seconds per year, for the age a patient has reached since a stored visit
+YEAR_SECONDS = 365.25 * 24 * 3600
+
+_COLUMNS = ("recorded_at", "name", "name_key", "age", "sex", "weight", "height",
+            "status", "red_flag", "alert", *CODE_FIELDS,
+            "symptom_scores", "patient_concern", "other")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS patients (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    age INTEGER NOT NULL,
+    sex TEXT NOT NULL,
+    weight REAL NOT NULL,
+    height REAL NOT NULL,
+    status TEXT NOT NULL,
+    red_flag INTEGER NOT NULL,
+    alert INTEGER NOT NULL,
+    {", ".join(f"{field} INTEGER NOT NULL" for field in CODE_FIELDS)},
+    symptom_scores BLOB NOT NULL,
+    patient_concern TEXT NOT NULL,
+    other TEXT
+);
+CREATE INDEX IF NOT EXISTS patients_name ON patients (name_key);
+CREATE INDEX IF NOT EXISTS patients_visit_reason ON patients (visit_reason);
+CREATE INDEX IF NOT EXISTS patients_pathology ON patients (pathology_type, pathology_stage);
+CREATE INDEX IF NOT EXISTS patients_alert ON patients (alert);
+"""
+
+_INSERT = (f"INSERT INTO patients ({', '.join(_COLUMNS)}) "
+           f"VALUES ({', '.join('?' for _ in _COLUMNS)})")
+_SELECT = f"SELECT {', '.join(_COLUMNS)} FROM patients"
+
+
+def name_key(name):
+    """Lookup key of a patient name: case and surrounding spaces ignored."""
+    return " ".join(name.split()).casefold()
+
+
+def _row(record, recorded_at):
+    alert = bool(record.red_flag or record.alerts)
+    return (recorded_at, record.name, name_key(record.name), record.age, record.sex,
+            record.weight, record.height, record.status, record.red_flag, alert,
+            *(getattr(record, field) for field in CODE_FIELDS),
+            record.symptom_scores, record.patient_concern,
+            json.dumps(record.other, ensure_ascii=False) if record.other else None)
+
+
+def _record(row):
+    values = dict(zip(_COLUMNS, row))
+    return PatientRecord(
+        name=values["name"], age=values["age"], sex=values["sex"],
+        weight=values["weight"], height=values["height"],
+        status=values["status"], red_flag=values["red_flag"],
+        symptom_scores=bytes(values["symptom_scores"]),
+        patient_concern=values["patient_concern"],
+        other=json.loads(values["other"]) if values["other"] else None,
+        **{field: values[field] for field in CODE_FIELDS})
+
+
+class PatientStore:
+    """
+    SQLite-backed store of PatientRecords. path=":memory:" keeps it in RAM
+    (handy for a single run); any other path is created on first use.
+    """
+
+    def __init__(self, path=":memory:", recent_capacity=DEFAULT_RECENT_CAPACITY):
+        self.path = path
+        self.recent_capacity = recent_capacity
+        # name_key -> {age: latest record or None}, least recent name first
+        self._recent = OrderedDict()
+        self._db = sqlite3.connect(path)
+        # WAL lets the dashboard read while the desk keeps writing
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM patients").fetchone()[0]
+
+    def close(self):
+        self._db.close()
+
+    def add(self, record, recorded_at=None):
+        """Stores one record in its own transaction; returns its patient id."""
+        with self._db:
+            cursor = self._db.execute(
+                _INSERT, _row(record, time.time() if recorded_at is None else recorded_at))
+        # Cached lookups of this name at other ages may predate this visit
+        self._recent.pop(name_key(record.name), None)
+        self._remember(name_key(record.name), record.age, record)
+        return cursor.lastrowid
+
+    def add_many(self, records, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Stores any iterable of records, chunk_size rows per transaction.
+        Returns how many were written.
+        """
+        written = 0
+        chunk = []
+        for record in records:
+            chunk.append(_row(record, time.time()))
+            key = chunk[-1][2]
+            if key in self._recent:
+                # Keep cached latest visits current without flooding the cache
+                self._recent[key] = {record.age: record}
+            if len(chunk) >= chunk_size:
+                written += self._insert_chunk(chunk)
+                chunk = []
+        if chunk:
+            written += self._insert_chunk(chunk)
+        return written
+
+    def _insert_chunk(self, rows):
+        with self._db:
+            self._db.executemany(_INSERT, rows)
+        return len(rows)
+
+    def get(self, patient_id):
+        """The record stored under patient_id; KeyError when unknown."""
+        row = self._db.execute(f"{_SELECT} WHERE id = ?", (patient_id,)).fetchone()
+        if row is None:
+            raise KeyError(patient_id)
+        return _record(row)
+
+    def last_visit(self, name, age):
+        """
+        The most recent record of this patient (same name, stored age
+        consistent with today's `age`), or None for a first visit.
+        """
+        key = name_key(name)
+        ages = self._recent.get(key)
+        if ages is not None and age in ages:
+            self._recent.move_to_end(key)
+            return ages[age]
+        # Someone aged `age` today was aged within a year of age - years_since at that visit
+        row = self._db.execute(
+            f"{_SELECT} WHERE name_key = :key "
+            "AND ABS(:age - age - (:now - recorded_at) / :year) < 1 ORDER BY id DESC LIMIT 1",
+            {"key": key, "age": age, "now": time.time(), "year": YEAR_SECONDS}).fetchone()
+        record = _record(row) if row is not None else None
+        self._remember(key, age, record)
+        return record
+
+    def _remember(self, key, age, record):
+        self._recent.setdefault(key, {})[age] = record
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.recent_capacity:
+            self._recent.popitem(last=False)
+
+    def iter_visits(self):
+        """Streams every stored (recorded_at, record), oldest first."""
+        cursor = self._db.execute(f"{_SELECT} ORDER BY id")
+        for row in cursor:
+            yield row[0], _record(row)
+
+    def latest_visits(self):
+        """Streams (recorded_at, record) of each patient's most recent visit, oldest first."""
+        cursor = self._db.execute(
+            f"{_SELECT} WHERE id IN (SELECT MAX(id) FROM patients GROUP BY name_key) ORDER BY id")
+        for row in cursor:
+            yield row[0], _record(row)
+
+    # --- Indexed lookups: lists of (patient_id, record), oldest first ---
+
+    def find_by_name(self, name):
+        return self._query("name_key = ?", name_key(name))
+
+    def find_by_visit_reason(self, visit_reason):
+        return self._query("visit_reason = ?", visit_reason)
+
+    def find_by_pathology(self, pathology_type, pathology_stage=None):
+        if pathology_stage is None:
+            return self._query("pathology_type = ?", pathology_type)
+        return self._query("pathology_type = ? AND pathology_stage = ?",
+                           pathology_type, pathology_stage)
+
+    def find_alerts(self):
+        """Patients with a red flag or at least one symptom at alert level."""
+        return self._query("alert = 1")
+
+    def _query(self, where, *parameters):
+        cursor = self._db.execute(
+            f"SELECT id, {', '.join(_COLUMNS)} FROM patients WHERE {where} ORDER BY id",
+            parameters)
+        return [(row[0], _record(row[1:])) for row in cursor]
@@ -0,0 +1,202 @@
+"""
+Seeded synthetic patient generator.
+
+synthetic_patients() yields intake answers dicts in the batch format of
+onc.engine, reproducible from a seed and covering every branch of the flow:
+each menu option including 'Other' with its free text, the red-flag early
+exit, declined registrations, optional CTCAE grade/duration and skipped
+concerns. desk_script() turns the same answers into the stdin lines the
+interactive desk expects, so one generator drives the batch engine, the
+kiosks and the desk alike.
+"""
+import argparse
+import json
+import random
+import sys
+
+from .core import MENU_FIELDS
+from .flow import RED_FLAG_FIELDS, SYMPTOM_FIELDS
+from .store import name_key
+from .vocabulary import VisitReason
+
+FIRST_NAMES = ("Jane", "John", "Amara", "Luis", "Mei", "Omar", "Sofia", "Ivan",
+               "Chloe", "Kwame", "Priya", "Lucas", "Hana", "Mateo", "Nadia", "Theo")
+LAST_NAMES = ("Doe", "Roe", "Okafor", "Garcia", "Chen", "Haddad", "Rossi", "Petrov",
+              "Martin", "Mensah", "Patel", "Silva", "Sato", "Lopez", "Karim", "Muller")
+SEXES = ("M", "F", "Other", "male", "female")
+# Free text typed after each menu's 'Other' option: some spellings of a listed
+# option (which onc.matcher resolves), the rest genuinely outside the menu
+OTHER_TEXTS = {
+    "pathology_type": ("Breast cancer", "Lung cancer", "Glioblastoma", "Mesothelioma",
+                       "Cholangiocarcinoma", "Osteosarcoma"),
+    "treatment": ("Chemo", "Radiotherapy", "Stem cell transplant", "CAR-T cell therapy",
+                  "Clinical trial protocol"),
+    "medication": ("Keytruda", "Capecitabine", "Carboplatin, Pemetrexed", "Denosumab", "Olaparib"),
+    "dosage": ("1000 mg", "75 mg/m2", "2 mg/kg", "200 mg"),
+    "frequency": ("Every 3 weeks", "Every other day", "Days 1 to 14 of each cycle"),
+    "body_area": ("Lower back", "Left flank", "Pelvis", "Groin"),
+    "symptom": ("Hiccups", "Intermittent tremor", "Hair loss", "Insomnia"),
+    "severity": ("Unsure of the grade", "Comes and goes", "Worse at night"),
+    "duration": ("Since the last cycle", "On and off for a month", "A few hours after each infusion"),
+    "functional_status": ("Uses a cane", "Needs a wheelchair outside", "Works part time"),
+    "recent_tests": ("Blood work", "PET scan", "Tumor marker panel", "Genetic panel", "Bone scan"),
+}
+CONCERNS = ("Worried about nausea at night", "Will the treatment affect my work?",
+            "Pain is getting harder to manage", "Can I travel next month?",
+            "I feel more tired after each cycle")
+
+# Menu fields in the order the desk asks them (severity/duration are batch-only)
+DESK_MENU_FIELDS = ("visit_reason", "pathology_type", "pathology_stage", "treatment",
+                    "medication", "dosage", "frequency", "body_area", "symptom")
+
+
+def synthetic_patients(count, seed=0, red_flag_rate=0.05, other_rate=0.08,
+                       decline_rate=0.02, alert_rate=0.15):
+    """
+    Yields count answers dicts. The same seed always yields the same patients.
+    red_flag_rate: share of patients answering 'Y' to one red flag (emergency);
+    other_rate: chance of picking 'Other' at each menu that has one;
+    decline_rate: share of declined registrations (rejected by the batch engine,
+    re-entered at the desk); alert_rate: chance of each symptom scoring >= 8.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield _patient(rng, red_flag_rate, other_rate, decline_rate, alert_rate)
+
+
+def _patient(rng, red_flag_rate, other_rate, decline_rate, alert_rate):
+    answers = {
+        "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        "age": str(rng.randint(18, 95)),
+        "sex": rng.choice(SEXES),
+        "weight": f"{rng.uniform(40.0, 130.0):.1f}",
+        "height": f"{rng.uniform(1.45, 2.00):.2f}",
+        "registration_confirmed": "N" if rng.random() < decline_rate else "Y",
+    }
+    red_flag = rng.randrange(len(RED_FLAG_FIELDS)) if rng.random() < red_flag_rate else -1
+    for index, field in enumerate(RED_FLAG_FIELDS):
+        answers[field] = "Y" if index == red_flag else "N"
+    for field, (menu, other_code) in MENU_FIELDS.items():
+        if field in ("severity", "duration") and rng.random() < 0.5:
+            continue                      # optional at the desk: sometimes not collected
+        if other_code is not None and rng.random() < other_rate:
+            answers[field] = str(other_code)
+            answers[f"{field}_other"] = rng.choice(OTHER_TEXTS[field])
+        else:
+            answers[field] = str(rng.choice([code for code in menu if code != other_code]))
+    for field in SYMPTOM_FIELDS:
+        score = rng.randint(8, 10) if rng.random() < alert_rate else rng.randint(0, 7)
+        answers[field] = str(score)
+    answers["regimen_confirmed"] = "Y"
+    answers["patient_concern"] = "N" if rng.random() < 0.3 else rng.choice(CONCERNS)
+    return answers
+
+
+def desk_script(answers, journal=False, visits=None):
+    """
+    The stdin lines that walk the interactive desk (python -m onc) through
+    these answers, confirming every review question. A declined registration
+    is typed as 'n', 'A' (re-enter everything) and the same registration again.
+    journal: the desk runs with --journal, so each session starts by pressing
+    Enter at the resume prompt. visits: the desk runs with --store holding
+    these (name, age, status) visits, oldest first (desk_scripts() keeps the
+    list current); the returning-patient offers they trigger are declined,
+    so the answers typed are always the ones recorded.
+    """
+    registration = _registration_lines(answers, visits)
+    lines = [""] if journal else []
+    lines += registration
+    if answers.get("registration_confirmed", "Y").upper() in ("N", "NO"):
+        lines += ["n", "A", *registration]
+    lines.append("y")
+    for field in RED_FLAG_FIELDS:
+        lines.append(answers[field])
+        if answers[field].upper() == "Y":
+            return lines                  # safety stop: the session ends here
+    for field in DESK_MENU_FIELDS:
+        lines += _menu_lines(answers, field, confirmed=field != "visit_reason")
+        if field == "visit_reason" and answers[field] == str(int(VisitReason.FOLLOW_UP)):
+            last = _last_visit(answers, visits)
+            if last is not None and last[2] == "complete":
+                lines.append("N")         # the regimen on file is not carried over
+    lines += [answers[field] for field in SYMPTOM_FIELDS]
+    lines.append("Y")                     # regimen verification
+    lines += _menu_lines(answers, "functional_status")
+    if answers["functional_status"] == str(MENU_FIELDS["functional_status"][1]):
+        lines.append("y")                 # the desk re-confirms this 'Other' text
+    lines += _menu_lines(answers, "recent_tests")
+    lines += [answers["patient_concern"], "Y"]
+    return lines
+
+
+def desk_scripts(patients, journal=False, store=False):
+    """
+    Yields the desk_script() of each answers dict in turn. store: the desk
+    runs with a new (empty) --store, so patients met earlier in the script
+    come back as returning patients.
+    """
+    visits = [] if store else None
+    for answers in patients:
+        yield desk_script(answers, journal, visits)
+        if visits is not None:
+            emergency = any(answers[field].upper() == "Y" for field in RED_FLAG_FIELDS)
+            visits.append((name_key(answers["name"]), int(answers["age"]),
+                           "emergency" if emergency else "complete"))
+
+
+def _last_visit(answers, visits):
+    # What PatientStore.last_visit() finds minutes later: the same name, aged
+    # the same or a year younger (a birthday may have passed since)
+    if not visits:
+        return None
+    key, age = name_key(answers["name"]), int(answers["age"])
+    return next((visit for visit in reversed(visits)
+                 if visit[0] == key and age - 1 <= visit[1] <= age), None)
+
+
+def _registration_lines(answers, visits):
+    name, age, *details = (answers[field] for field in ("name", "age", "sex", "weight", "height"))
+    lines = [name, age]
+    if _last_visit(answers, visits) is not None:
+        lines.append("N")                 # details on file not reused
+    return lines + details
+
+
+def _menu_lines(answers, field, confirmed=True):
+    lines = [answers[field]]
+    if confirmed:
+        lines.append("Y")
+    if answers[field] == str(MENU_FIELDS[field][1]):
+        lines.append(answers[f"{field}_other"])
+    return lines
+
+
+def synthetic_main(argv):
+    """Command line entry: python -m onc --synthetic N [--seed S] [--desk [--journal] [--store]] [-o FILE]."""
+    parser = argparse.ArgumentParser(
+        prog="python -m onc --synthetic",
+        description="Write seeded synthetic patients as JSONL intake (or desk input).")
+    parser.add_argument("count", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--desk", action="store_true",
+                        help="write stdin lines for the interactive desk instead of JSONL")
+    parser.add_argument("--journal", action="store_true",
+                        help="with --desk: the desk runs with --journal (answer its resume prompt)")
+    parser.add_argument("--store", action="store_true",
+                        help="with --desk: the desk runs with a new, empty --store "
+                             "(decline its returning-patient offers)")
+    parser.add_argument("-o", "--output", help="output file (default: standard output)")
+    options = parser.parse_args(argv)
+    out = open(options.output, "w", encoding="utf-8") if options.output else sys.stdout
+    patients = synthetic_patients(options.count, options.seed)
+    try:
+        if options.desk:
+            for lines in desk_scripts(patients, options.journal, options.store):
+                out.write("\n".join(lines) + "\n")
+        else:
+            for answers in patients:
+                out.write(json.dumps(answers) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
@@ -0,0 +1,200 @@
+"""
+Longitudinal symptom trends across visits.
+
+TrendEngine keeps, per patient, every visit's six 0-10 symptom scores
+(PATIENT_SYMPTOMS order) and CTCAE grade in compact typed arrays, and
+updates each patient's trend state as a visit is appended: the delta since
+the previous visit, a rolling (exponentially weighted) average, and the run
+of consecutive rises of each symptom. Alerts are decided from that state
+alone (a symptom rising by rise_threshold points or more over span visits,
+or rising visit after visit), so a visit costs the same whether the patient
+has two visits or two hundred, and the set of worsening patients the
+dashboard reads is always current without rescanning any history.
+"""
+import time
+from array import array
+from typing import NamedTuple
+
+from .core import PATIENT_SYMPTOMS
+from .store import name_key
+from .vocabulary import Grade
+
+DEFAULT_RISE_THRESHOLD = 3     # points gained over `span` visits that raise an alert
+DEFAULT_SPAN = 2               # visits compared: 2 = this visit against the previous one
+DEFAULT_STREAK = 2             # consecutive rises that mark a symptom as worsening
+DEFAULT_SMOOTHING = 0.5        # weight of the newest visit in the rolling average
+
+# Alert kinds
+RISE = "rise"
+WORSENING = "worsening"
+
+_WIDTH = len(PATIENT_SYMPTOMS)
+
+
+class TrendAlert(NamedTuple):
+    patient: str
+    symptom: str
+    kind: str                  # RISE or WORSENING
+    previous: int              # score `span - 1` visits ago (RISE) or before the run (WORSENING)
+    current: int
+    delta: int
+
+
+class PatientTrend:
+    """
+    One patient's visit history and incremental trend state.
+    scores: flat byte array, visit i at [6*i, 6*i + 6]; grades: CTCAE grade
+    per visit (0: not graded); times: epoch seconds per visit.
+    """
+    __slots__ = ("name", "scores", "grades", "times", "deltas", "rolling", "streaks",
+                 "run_start", "alerts")
+
+    def __init__(self, name):
+        self.name = name
+        self.scores = array("B")
+        self.grades = array("B")
+        self.times = array("d")
+        self.deltas = array("b", bytes(_WIDTH))     # change since the previous visit
+        self.rolling = array("d", bytes(8 * _WIDTH))
+        self.streaks = array("B", bytes(_WIDTH))    # consecutive rises so far
+        self.run_start = array("B", bytes(_WIDTH))  # score before the current run of rises
+        self.alerts = []                            # alerts raised by the latest visit
+
+    def __len__(self):
+        return len(self.times)
+
+    def visit(self, index):
+        """(timestamp, scores tuple, grade) of one visit; negative indexes count from the last."""
+        if index < 0:
+            index += len(self)
+        return (self.times[index], tuple(self.scores[index * _WIDTH:(index + 1) * _WIDTH]),
+                self.grades[index])
+
+    @property
+    def latest(self):
+        return tuple(self.scores[-_WIDTH:])
+
+    def series(self, symptom):
+        """Every visit's score of one symptom (PATIENT_SYMPTOMS index)."""
+        return self.scores[symptom::_WIDTH].tolist()
+
+    @property
+    def worsening(self):
+        return bool(self.alerts)
+
+    def to_dict(self):
+        """Dashboard view of the latest state, without the full history."""
+        return {
+            "patient": self.name,
+            "visits": len(self),
+            "last_visit": self.times[-1] if self.times else None,
+            "grade": self.grades[-1] if self.grades else 0,
+            "symptoms": {symptom.strip(): {"score": score, "delta": delta,
+                                           "rolling": round(rolling, 2), "rising_for": streak}
+                         for symptom, score, delta, rolling, streak in zip(
+                             PATIENT_SYMPTOMS, self.latest, self.deltas,
+                             self.rolling, self.streaks)},
+            "alerts": [alert._asdict() for alert in self.alerts],
+        }
+
+
+class TrendEngine:
+    """Symptom histories of many patients, keyed by name (case and spacing ignored)."""
+
+    def __init__(self, rise_threshold=DEFAULT_RISE_THRESHOLD, span=DEFAULT_SPAN,
+                 streak=DEFAULT_STREAK, smoothing=DEFAULT_SMOOTHING):
+        if span < 2:
+            raise ValueError("span must cover at least two visits")
+        self.rise_threshold = rise_threshold
+        self.span = span
+        self.streak = streak
+        self.smoothing = smoothing
+        self._patients = {}
+        self._worsening = set()        # keys of patients whose latest visit raised an alert
+
+    def __len__(self):
+        return len(self._patients)
+
+    def __contains__(self, name):
+        return name_key(name) in self._patients
+
+    def history(self, name):
+        """PatientTrend of this patient; KeyError when no visit was recorded."""
+        return self._patients[name_key(name)]
+
+    def add_visit(self, name, scores, grade=0, timestamp=None):
+        """
+        Appends one visit's six scores and CTCAE grade (0-4) and returns the
+        TrendAlerts it raised. Only the last `span` visits are read.
+        """
+        if len(scores) != _WIDTH:
+            raise ValueError(f"expected {_WIDTH} symptom scores, got {len(scores)}")
+        key = name_key(name)
+        trend = self._patients.get(key)
+        if trend is None:
+            trend = self._patients[key] = PatientTrend(name)
+        first = not trend.times
+        earlier = None
+        if len(trend) >= self.span - 1:
+            start = (len(trend) - (self.span - 1)) * _WIDTH
+            earlier = trend.scores[start:start + _WIDTH]
+        previous = None if first else trend.scores[-_WIDTH:]
+
+        alerts = []
+        for symptom, score in enumerate(scores):
+            if first:
+                trend.rolling[symptom] = score
+                continue
+            delta = score - previous[symptom]
+            trend.deltas[symptom] = delta
+            trend.rolling[symptom] += self.smoothing * (score - trend.rolling[symptom])
+            if delta > 0:
+                if not trend.streaks[symptom]:
+                    trend.run_start[symptom] = previous[symptom]
+                trend.streaks[symptom] = min(trend.streaks[symptom] + 1, 255)
+            else:
+                trend.streaks[symptom] = 0
+            label = PATIENT_SYMPTOMS[symptom].strip()
+            if earlier is not None and score - earlier[symptom] >= self.rise_threshold:
+                alerts.append(TrendAlert(name, label, RISE, earlier[symptom], score,
+                                         score - earlier[symptom]))
+            elif trend.streaks[symptom] >= self.streak:
+                alerts.append(TrendAlert(name, label, WORSENING, trend.run_start[symptom], score,
+                                         score - trend.run_start[symptom]))
+
+        trend.scores.extend(scores)
+        trend.grades.append(grade)
+        trend.times.append(time.time() if timestamp is None else timestamp)
+        trend.alerts = alerts
+        if alerts:
+            self._worsening.add(key)
+        else:
+            self._worsening.discard(key)
+        return alerts
+
+    def add_record(self, record, timestamp=None):
+        """Appends a completed PatientRecord; emergencies carry no scores and are skipped."""
+        if not record.symptom_scores:
+            return []
+        # Severity codes are CTCAE grades; 'Other' and "not asked" have no grade
+        grade = 0 if record.severity == Grade.OTHER else record.severity
+        return self.add_visit(record.name, record.symptom_scores, grade, timestamp)
+
+    def load(self, visits):
+        """Replays (timestamp, record) pairs in visit order, e.g. PatientStore.iter_visits()."""
+        for timestamp, record in visits:
+            self.add_record(record, timestamp)
+        return self
+
+    def worsening(self):
+        """PatientTrends whose latest visit raised an alert (kept current on every visit)."""
+        return [self._patients[key] for key in self._worsening]
+
+
+def describe(alert):
+    """One-line message of a TrendAlert, as the desk prints it."""
+    if alert.kind == RISE:
+        return (f"⚠️ Trend alert: {alert.symptom} rose from {alert.previous} to "
+                f"{alert.current} (+{alert.delta}) since the last visit.")
+    return (f"⚠️ Trend alert: {alert.symptom} has worsened visit after visit, "
+            f"from {alert.previous} to {alert.current} (+{alert.delta}).")
@@ -0,0 +1,163 @@
+"""
+Vectorized red-flag and symptom-score evaluation (requires NumPy).
+
+Re-scores a whole waiting-room census in one pass: an N x 6 matrix of 0-10
+symptom scores (PATIENT_SYMPTOMS order) and an N x 7 boolean matrix of red-flag
+answers (RED_FLAG_CHECKLIST order) go in, alert masks, per-patient worst
+severity and emergency routing come out. Same rules as assess_symptom and
+clinical_red_flag, without a Python loop per cell.
+
+census_body_metrics() and dose_review() are the whole-census forms of
+onc.dosing: derived metrics and the weight-based dose check of every patient
+of a PatientBatch (the morning pharmacy recheck of the infusion list).
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from .core import (DOSAGE_LIST, MEDICATION_CHECKLIST, PATIENT_SYMPTOMS,
+                   RED_FLAG_CHECKLIST, SYMPTOM_ALERT_THRESHOLD)
+from .dosing import (ADJUSTED_WEIGHT_FACTOR, DEVINE_BASE, DEVINE_BASE_OTHER,
+                     DEVINE_PER_INCH, DOSE_LIMITS, INCH, PER_M2, dose_mg)
+
+# Routing codes, in increasing order of urgency
+ROUTE_ROUTINE = 0     # no alert: regular review queue
+ROUTE_URGENT = 1      # at least one symptom score >= threshold
+ROUTE_EMERGENCY = 2   # at least one red flag answered 'Y': send to the ER
+
+
+class BatchAssessment(NamedTuple):
+    alert_mask: np.ndarray       # N x 6 bool: score >= threshold
+    alert_count: np.ndarray      # N: number of alerting symptoms
+    max_severity: np.ndarray     # N: highest 0-10 score
+    worst_symptom: np.ndarray    # N: column index of the highest score
+    emergency: np.ndarray        # N bool: any red flag answered 'Y'
+    first_red_flag: np.ndarray   # N: 1-7 checklist item that fired first, 0 if none
+    routing: np.ndarray          # N: ROUTE_ROUTINE / ROUTE_URGENT / ROUTE_EMERGENCY
+
+
+def evaluate_batch(symptom_scores, red_flags, threshold=SYMPTOM_ALERT_THRESHOLD):
+    """
+    Evaluates every patient of a batch at once.
+    symptom_scores: N x 6 integer matrix; red_flags: N x 7 boolean matrix.
+    """
+    scores = np.asarray(symptom_scores)
+    flags = np.asarray(red_flags, dtype=bool)
+    if scores.ndim != 2 or scores.shape[1] != len(PATIENT_SYMPTOMS):
+        raise ValueError(
+            f"symptom_scores must be N x {len(PATIENT_SYMPTOMS)}, got {scores.shape}")
+    if flags.shape != (scores.shape[0], len(RED_FLAG_CHECKLIST)):
+        raise ValueError(
+            f"red_flags must be {scores.shape[0]} x {len(RED_FLAG_CHECKLIST)}, got {flags.shape}")
+
+    alert_mask = scores >= threshold
+    alert_count = alert_mask.sum(axis=1)
+    if len(scores):
+        max_severity = scores.max(axis=1)
+        worst_symptom = scores.argmax(axis=1)
+    else:
+        # argmax has no identity element, so an empty census needs explicit shapes
+        max_severity = np.zeros(0, dtype=scores.dtype)
+        worst_symptom = np.zeros(0, dtype=np.intp)
+    emergency = flags.any(axis=1)
+    first_red_flag = np.where(emergency, flags.argmax(axis=1) + 1, 0)
+    routing = np.where(emergency, ROUTE_EMERGENCY,
+                       np.where(alert_count > 0, ROUTE_URGENT, ROUTE_ROUTINE))
+    return BatchAssessment(alert_mask, alert_count, max_severity, worst_symptom,
+                           emergency, first_red_flag, routing.astype(np.int8))
+
+
+def symptom_matrix(batch):
+    """N x 6 uint8 copy of a PatientBatch's symptom scores (one memcpy, no loop)."""
+    # Copy so the view does not pin the batch's array against further appends
+    flat = np.frombuffer(batch.symptom_scores, dtype=np.uint8).copy()
+    return flat.reshape(-1, len(PATIENT_SYMPTOMS))
+
+
+def red_flag_matrix(batch):
+    """N x 7 boolean matrix rebuilt from a PatientBatch's first-red-flag column."""
+    first = np.frombuffer(batch.red_flags, dtype=np.uint8).copy()
+    return first[:, None] == np.arange(1, len(RED_FLAG_CHECKLIST) + 1)
+
+
+def evaluate_census(batch, threshold=SYMPTOM_ALERT_THRESHOLD):
+    """Convenience wrapper: evaluate_batch over a whole PatientBatch."""
+    return evaluate_batch(symptom_matrix(batch), red_flag_matrix(batch), threshold)
+
+
+# --- Derived metrics and dose checks ---
+
+class BatchBodyMetrics(NamedTuple):
+    bmi: np.ndarray                   # N float
+    bsa_mosteller: np.ndarray         # N float, m² (0 when weight/height <= 0)
+    bsa_dubois: np.ndarray            # N float, m²
+    ideal_body_weight: np.ndarray     # N float, kg
+    adjusted_body_weight: np.ndarray  # N float, kg
+
+
+class DoseReview(NamedTuple):
+    checked: np.ndarray               # N bool: medication group has a ceiling and a mg dose
+    dose_per_unit: np.ndarray         # N float: mg/kg or mg/m², 0 when not checked
+    limit: np.ndarray                 # N float: ceiling in the same unit, 0 when not checked
+    over_limit: np.ndarray            # N bool: flagged for pharmacist review
+
+
+def body_metrics_batch(weights, heights, sexes):
+    """
+    onc.dosing.body_metrics for N patients at once.
+    weights (kg), heights (m): length-N numbers; sexes: length-N strings.
+    """
+    weight = np.asarray(weights, dtype=np.float64)
+    height = np.asarray(heights, dtype=np.float64)
+    base = np.array([DEVINE_BASE.get(sex.lower(), DEVINE_BASE_OTHER) for sex in sexes],
+                    dtype=np.float64)
+    valid = (weight > 0) & (height > 0)
+    # Clip before the powers so invalid rows cannot produce NaN; they are zeroed below
+    safe_weight = np.where(valid, weight, 1.0)
+    safe_height = np.where(valid, height, 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bmi = weight / height ** 2
+    mosteller = np.where(valid, np.sqrt(safe_height * 100 * safe_weight / 3600), 0.0)
+    dubois = np.where(valid, 0.007184 * safe_weight ** 0.425 * (safe_height * 100) ** 0.725, 0.0)
+    ideal = np.maximum(base + DEVINE_PER_INCH * (height / INCH - 60), 0.0)
+    adjusted = np.where(weight > ideal, ideal + ADJUSTED_WEIGHT_FACTOR * (weight - ideal), weight)
+    return BatchBodyMetrics(bmi, mosteller, dubois, ideal, adjusted)
+
+
+def census_body_metrics(batch):
+    """body_metrics_batch over a whole PatientBatch."""
+    return body_metrics_batch(np.frombuffer(batch.weights, dtype=np.float64),
+                              np.frombuffer(batch.heights, dtype=np.float64), batch.sexes)
+
+
+def _code_table(values):
+    # Lookup table indexed by menu code (0 = not asked)
+    table = np.zeros(max(max(MEDICATION_CHECKLIST), max(DOSAGE_LIST)) + 1, dtype=np.float64)
+    for code, value in values.items():
+        table[code] = value
+    return table
+
+
+_DOSE_MG = _code_table({code: dose_mg(code) or 0.0 for code in DOSAGE_LIST})
+_LIMIT = _code_table({code: ceiling for code, (_, ceiling) in DOSE_LIMITS.items()})
+_PER_M2 = _code_table({code: basis == PER_M2 for code, (basis, _) in DOSE_LIMITS.items()}) > 0
+
+
+def dose_review(batch, metrics=None):
+    """
+    Weight-based dose check of every patient of a PatientBatch, the same
+    rule as onc.dosing.dose_check. Pass metrics to reuse an earlier
+    census_body_metrics(batch).
+    """
+    if metrics is None:
+        metrics = census_body_metrics(batch)
+    medication = np.frombuffer(batch.codes["medication"], dtype=np.uint8)
+    dosage = np.frombuffer(batch.codes["dosage"], dtype=np.uint8)
+    weight = np.frombuffer(batch.weights, dtype=np.float64)
+    milligrams = _DOSE_MG[dosage]
+    limit = _LIMIT[medication]
+    size = np.where(_PER_M2[medication], metrics.bsa_mosteller, weight)
+    checked = (limit > 0) & (milligrams > 0) & (size > 0)
+    per_unit = np.where(checked, milligrams / np.where(checked, size, 1.0), 0.0)
+    return DoseReview(checked, per_unit, np.where(checked, limit, 0.0),
+                      checked & (per_unit > limit))
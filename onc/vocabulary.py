@@ -0,0 +1,236 @@
+"""
+Coded clinical vocabulary.
+
+Every menu option has a stable IntEnum code (the number the patient types,
+and the value PatientRecord, PatientBatch and the patient store keep), and
+every code maps to a Term: the display string, interned once, plus an ID in
+an external terminology where one applies (ICD-O-3 morphology for the
+pathology types, AJCC stage groups, CTCAE grades, SNOMED CT for treatments
+and body sites). Records carry only the codes; display strings are looked
+up at output time, and counts per option come straight from the code
+columns (tally()).
+
+The codes are the onc.core menu keys; a mismatch between an enum and its
+menu fails at import instead of mislabelling stored data.
+"""
+import sys
+from enum import IntEnum
+from typing import NamedTuple
+
+from .core import MENU_FIELDS
+
+# External terminologies
+ICD_O_3 = "ICD-O-3"
+AJCC = "AJCC"
+CTCAE = "CTCAE v5.0"
+SNOMED_CT = "SNOMED CT"
+
+
+class VisitReason(IntEnum):
+    NEW_DIAGNOSIS = 1
+    FOLLOW_UP = 2
+    TREATMENT_SESSION = 3
+    SIDE_EFFECTS = 4
+    RESULTS_REVIEW = 5
+
+
+class PathologyType(IntEnum):
+    CARCINOMA = 1
+    SARCOMA = 2
+    LYMPHOMA = 3
+    LEUKEMIA = 4
+    MELANOMA = 5
+    NEUROENDOCRINE = 6
+    OTHER = 7
+
+
+class PathologyStage(IntEnum):
+    I = 1
+    II = 2
+    III = 3
+    IV = 4
+
+
+class Treatment(IntEnum):
+    CHEMOTHERAPY = 1
+    RADIATION = 2
+    IMMUNOTHERAPY = 3
+    HORMONAL = 4
+    TARGETED = 5
+    SUPPORTIVE = 6
+    OTHER = 7
+
+
+class MedicationGroup(IntEnum):
+    CYTOTOXIC = 1
+    CHECKPOINT_INHIBITOR = 2
+    SUPPORTIVE = 3
+    HORMONAL = 4
+    TARGETED = 5
+    SYMPTOM_CONTROL = 6
+    OTHER = 7
+
+
+class Dosage(IntEnum):
+    MG_5 = 1
+    MG_10 = 2
+    MG_25 = 3
+    MG_50 = 4
+    MG_100 = 5
+    MG_250 = 6
+    MG_500 = 7
+    OTHER = 8
+
+
+class Frequency(IntEnum):
+    DAILY_MORNING = 1
+    DAILY_NIGHT = 2
+    TWICE_DAILY = 3
+    THREE_TIMES_DAILY = 4
+    FOUR_TIMES_DAILY = 5
+    WEEKLY = 6
+    AS_NEEDED = 7
+    OTHER = 8
+
+
+class BodyArea(IntEnum):
+    HEAD_NECK = 1
+    CHEST = 2
+    GASTROINTESTINAL = 3
+    EXTREMITIES = 4
+    SYSTEMIC = 5
+    SKIN = 6
+    OTHER = 7
+
+
+class SymptomGroup(IntEnum):
+    HEAD_NECK = 1
+    CHEST = 2
+    GASTROINTESTINAL = 3
+    EXTREMITIES = 4
+    SYSTEMIC = 5
+    SKIN = 6
+    OTHER = 7
+
+
+class Grade(IntEnum):
+    MILD = 1
+    MODERATE = 2
+    SEVERE = 3
+    LIFE_THREATENING = 4
+    OTHER = 5
+
+
+class Duration(IntEnum):
+    UNDER_24_HOURS = 1
+    DAYS_1_TO_3 = 2
+    DAYS_4_TO_7 = 3
+    WEEKS_1_TO_2 = 4
+    OVER_2_WEEKS = 5
+    OTHER = 6
+
+
+class FunctionalStatus(IntEnum):
+    INDEPENDENT = 1
+    MODIFIED_INDEPENDENT = 2
+    PARTIALLY_RESTRICTED = 3
+    SEVERELY_RESTRICTED = 4
+    OTHER = 5
+
+
+class RecentTests(IntEnum):
+    LABORATORY = 1
+    IMAGING = 2
+    PATHOLOGY = 3
+    FUNCTIONAL = 4
+    NONE = 5
+    OTHER = 6
+
+
+# Record field -> enum of its codes
+ENUMS = {
+    "visit_reason": VisitReason,
+    "pathology_type": PathologyType,
+    "pathology_stage": PathologyStage,
+    "treatment": Treatment,
+    "medication": MedicationGroup,
+    "dosage": Dosage,
+    "frequency": Frequency,
+    "body_area": BodyArea,
+    "symptom": SymptomGroup,
+    "severity": Grade,
+    "duration": Duration,
+    "functional_status": FunctionalStatus,
+    "recent_tests": RecentTests,
+}
+
+# External IDs where a standard code applies: enum -> {member: (system, id)}.
+# Keyed per enum because IntEnum members of different enums compare equal.
+EXTERNAL_CODES = {
+    PathologyType: {
+        PathologyType.CARCINOMA: (ICD_O_3, "8010/3"),
+        PathologyType.SARCOMA: (ICD_O_3, "8800/3"),
+        PathologyType.LYMPHOMA: (ICD_O_3, "9590/3"),
+        PathologyType.LEUKEMIA: (ICD_O_3, "9800/3"),
+        PathologyType.MELANOMA: (ICD_O_3, "8720/3"),
+        PathologyType.NEUROENDOCRINE: (ICD_O_3, "8246/3"),
+    },
+    PathologyStage: {stage: (AJCC, stage.name) for stage in PathologyStage},
+    Grade: {grade: (CTCAE, f"Grade {grade.value}") for grade in Grade if grade != Grade.OTHER},
+    Treatment: {
+        Treatment.CHEMOTHERAPY: (SNOMED_CT, "367336001"),
+        Treatment.RADIATION: (SNOMED_CT, "108290001"),
+        Treatment.IMMUNOTHERAPY: (SNOMED_CT, "76334006"),
+        Treatment.HORMONAL: (SNOMED_CT, "169413002"),
+    },
+    BodyArea: {
+        BodyArea.HEAD_NECK: (SNOMED_CT, "774007"),
+        BodyArea.CHEST: (SNOMED_CT, "51185008"),
+        BodyArea.GASTROINTESTINAL: (SNOMED_CT, "86762007"),
+        BodyArea.SYSTEMIC: (SNOMED_CT, "38266002"),
+        BodyArea.SKIN: (SNOMED_CT, "39937001"),
+    },
+}
+
+
+class Term(NamedTuple):
+    code: IntEnum
+    display: str               # menu text, interned
+    system: str = None         # external terminology, when mapped
+    external_id: str = None
+
+
+def _terms(field, enum):
+    menu, _ = MENU_FIELDS[field]
+    if set(menu) != {member.value for member in enum}:
+        raise RuntimeError(f"{enum.__name__} codes do not match the {field} menu")
+    external = EXTERNAL_CODES.get(enum, {})
+    return {member: Term(member, sys.intern(menu[member]), *external.get(member, ()))
+            for member in enum}
+
+
+# Record field -> {code: Term}
+TERMS = {field: _terms(field, enum) for field, enum in ENUMS.items()}
+
+
+def term(field, code):
+    """Term of a field's code; ValueError for a code the menu does not have."""
+    return TERMS[field][ENUMS[field](code)]
+
+
+def display(field, code):
+    """Interned display string of a field's code (None when not asked)."""
+    if not code:
+        return None
+    return TERMS[field][code].display
+
+
+def tally(batch, field):
+    """{code: patients} of one field over a PatientBatch, straight from its code column."""
+    column = batch.codes[field].tobytes()
+    counts = {}
+    for code in ENUMS[field]:
+        count = column.count(code)
+        if count:
+            counts[code] = count
+    return counts
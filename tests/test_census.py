@@ -0,0 +1,74 @@
+"""CensusEngine counts and rollups per site, day and hour."""
+import time
+
+import pytest
+
+from onc.census import CensusEngine
+from onc.record import PatientRecord
+from onc.vocabulary import Grade, PathologyStage, PathologyType, VisitReason
+
+HOUR = 3600
+START = time.mktime((2026, 3, 2, 9, 15, 0, 0, 0, -1))      # local time
+
+
+def visit(scores=bytes(6), status="complete", **codes):
+    return PatientRecord("Ada Lee", 60, "f", 60.0, 1.6, status=status,
+                         symptom_scores=scores, **codes)
+
+
+@pytest.fixture
+def census():
+    census = CensusEngine(site="north")
+    census.add_record(visit(visit_reason=VisitReason.FOLLOW_UP, pathology_type=PathologyType.CARCINOMA,
+                            pathology_stage=PathologyStage.II, severity=Grade.MODERATE), START)
+    census.add_record(visit(bytes([9, 0, 0, 0, 0, 0]), visit_reason=VisitReason.FOLLOW_UP,
+                            pathology_type=PathologyType.CARCINOMA,
+                            pathology_stage=PathologyStage.III), START + 10, site="south")
+    census.add_record(visit(status="emergency", red_flag=2), START + HOUR)
+    census.add_record(visit(visit_reason=VisitReason.NEW_DIAGNOSIS), START + 24 * HOUR)
+    return census
+
+
+def test_totals(census):
+    total = census.snapshot()
+    assert (total["sessions"], total["completed"], total["emergencies"]) == (4, 3, 1)
+    assert total["symptom_alerts"] == 1 and total["symptom_alert_rate"] == round(1 / 3, 4)
+    assert total["visit_reason"] == {"FOLLOW_UP": 2, "NEW_DIAGNOSIS": 1}
+    assert total["severity"] == {"MODERATE": 1}
+    assert total["pathology_type_by_stage"] == {"CARCINOMA": {"II": 1, "III": 1}}
+
+
+def test_rollup_by_site(census):
+    sites = census.rollup("site")
+    assert sorted(sites) == ["north", "south"]
+    assert sites["north"]["sessions"] == 3 and sites["south"]["sessions"] == 1
+    assert census.snapshot("south")["pathology_stage"] == {"III": 1}
+
+
+def test_rollup_by_day_and_hour(census):
+    assert census.rollup("day") == {
+        "2026-03-02": census.snapshot(day="2026-03-02"),
+        "2026-03-03": census.snapshot(day="2026-03-03")}
+    assert census.snapshot(day="2026-03-02")["sessions"] == 3
+    hours = census.rollup("hour", site="north")
+    assert {hour: counts["sessions"] for hour, counts in hours.items()} == {
+        "2026-03-02T09:00": 1, "2026-03-02T10:00": 1, "2026-03-03T09:00": 1}
+    # An empty bucket reads as zeros, not a KeyError
+    assert census.snapshot("east", day="2026-03-02")["sessions"] == 0
+
+
+def test_hour_buckets_are_bounded():
+    census = CensusEngine(hour_retention=2)
+    for hour in range(3):
+        census.add_record(visit(), START + hour * HOUR)
+    assert list(census.rollup("hour")) == ["2026-03-02T10:00", "2026-03-02T11:00"]
+    # Day and site totals keep everything
+    assert census.snapshot()["sessions"] == census.snapshot(day="2026-03-02")["sessions"] == 3
+
+
+def test_load_and_write(tmp_path, census):
+    replayed = CensusEngine().load([(START, visit()), (START + 1, visit(status="emergency"))])
+    assert replayed.rollup("site") == {"main": replayed.snapshot()}
+    path = tmp_path / "census.json"
+    census.write(str(path))
+    assert '"north"' in path.read_text(encoding="utf-8")
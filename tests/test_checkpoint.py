@@ -0,0 +1,92 @@
+"""SessionJournal: resuming interrupted sessions and compacting the journal."""
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from onc.checkpoint import SessionJournal
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "journal.jsonl")
+
+
+def lines(path):
+    with open(path, encoding="utf-8") as journal:
+        return [json.loads(line) for line in journal]
+
+
+def interrupted(path, session_id="a1"):
+    # Two stages answered, then the process dies (no finish())
+    journal = SessionJournal(path)
+    checkpoint = journal.session(session_id)
+    app = SimpleNamespace(name="Jane Doe", age=54, metrics=object())
+    checkpoint.save(app)
+    app.age, app.symptom_selection = 55, ["Pain"]
+    checkpoint.save(app)
+    journal.close()
+
+
+def test_interrupted_session_resumes_with_its_answers(path):
+    interrupted(path)
+    journal = SessionJournal(path)
+    assert "a1" in journal
+    checkpoint = journal.session("a1")
+    app = SimpleNamespace()
+    assert checkpoint.resumed and checkpoint.restore(app) == 2
+    assert vars(app) == {"name": "Jane Doe", "age": 55, "symptom_selection": ["Pain"]}
+    journal.close()
+
+
+def test_only_changed_answers_are_journaled(path):
+    interrupted(path)
+    saved = lines(path)
+    assert [entry["state"] for entry in saved] == [
+        {"name": "Jane Doe", "age": 54}, {"age": 55, "symptom_selection": ["Pain"]}]
+
+
+def test_reopening_compacts_to_one_line_per_open_session(path):
+    interrupted(path, "a1")
+    interrupted(path, "b2")
+    journal = SessionJournal(path)
+    checkpoint = journal.session("b2")
+    checkpoint.finish("complete")
+    journal.close()
+    with open(path, "a", encoding="utf-8") as torn:
+        torn.write('{"session": "c3", "sta')
+    SessionJournal(path).close()
+    (entry,) = lines(path)
+    assert entry["session"] == "a1" and entry["stages"] == 2
+    assert entry["state"] == {"name": "Jane Doe", "age": 55, "symptom_selection": ["Pain"]}
+
+
+def test_sessions_older_than_max_age_are_dropped(path):
+    interrupted(path)
+    journal = SessionJournal(path, max_age=60)
+    assert journal.open_sessions() == ["a1"]
+    journal.close()
+    entry = lines(path)[0]
+    entry["at"] = time.time() - 120
+    with open(path, "w", encoding="utf-8") as journal:
+        journal.write(json.dumps(entry) + "\n")
+    reopened = SessionJournal(path, max_age=60)
+    assert reopened.open_sessions() == []
+    reopened.close()
+
+
+def test_parked_session_can_be_resumed_from_the_same_journal(path):
+    journal = SessionJournal(path)
+    checkpoint = journal.session()
+    checkpoint.save(SimpleNamespace(name="Jane Doe"))
+    checkpoint.park()
+    assert checkpoint.session_id in journal
+    resumed = journal.session(checkpoint.session_id)
+    app = SimpleNamespace()
+    assert resumed.restore(app) == 1 and app.name == "Jane Doe"
+    journal.close()
+    # And from a later journal, after a restart
+    reopened = SessionJournal(path)
+    assert reopened.open_sessions() == [checkpoint.session_id]
+    reopened.close()
@@ -0,0 +1,55 @@
+"""Derived body metrics and weight-based dose checks."""
+import pytest
+
+from onc.dosing import PER_KG, PER_M2, body_metrics, dose_check, dose_mg
+from onc.record import PatientRecord
+
+CYTOTOXIC, CHECKPOINT_INHIBITOR, SUPPORTIVE, TARGETED = 1, 2, 3, 5
+MG_100, MG_250, MG_500, OTHER_DOSAGE = 5, 6, 7, 8
+
+
+def test_body_metrics():
+    metrics = body_metrics(62.5, 1.65, "f")
+    assert metrics.bmi == pytest.approx(22.96, abs=0.01)
+    assert metrics.bsa_mosteller == pytest.approx(1.6925, abs=1e-4)
+    assert metrics.bsa_dubois == pytest.approx(1.6877, abs=1e-3)
+    # Devine: 50 kg + 2.3 kg per inch over 5 ft for men
+    male = body_metrics(100.0, 70 * 0.0254, "m")
+    assert male.ideal_body_weight == pytest.approx(73.0)
+    assert male.adjusted_body_weight == pytest.approx(73.0 + 0.4 * 27.0)
+    assert body_metrics(50.0, 1.0, "f").ideal_body_weight == 0.0
+
+
+def test_body_metrics_are_memoised():
+    assert body_metrics(70.0, 1.7, "m") is body_metrics(70.0, 1.7, "m")
+
+
+def test_per_m2_ceiling():
+    within = dose_check(CYTOTOXIC, MG_100, 62.5, 1.65, "f")
+    assert within.basis == PER_M2 and within.within_limit
+    assert within.dose_per_unit == pytest.approx(100 / 1.6925, abs=0.01)
+    over = dose_check(CYTOTOXIC, MG_250, 62.5, 1.65, "f")
+    assert not over.within_limit and over.limit == 75.0
+
+
+def test_per_kg_ceiling():
+    over = dose_check(CHECKPOINT_INHIBITOR, MG_500, 40.0, 1.6, "f")
+    assert over.basis == PER_KG and over.dose_per_unit == 12.5 and not over.within_limit
+    assert dose_check(TARGETED, MG_500, 40.0, 1.6, "f").within_limit
+
+
+@pytest.mark.parametrize("medication, dosage, weight, height", [
+    (SUPPORTIVE, MG_500, 60.0, 1.6),           # dosed flat
+    (CYTOTOXIC, OTHER_DOSAGE, 60.0, 1.6),      # no milligrams to check
+    (CYTOTOXIC, MG_100, 0.0, 1.6),             # no body size to scale by
+    (CHECKPOINT_INHIBITOR, MG_100, 0.0, 1.6),
+])
+def test_unchecked_doses(medication, dosage, weight, height):
+    assert dose_check(medication, dosage, weight, height, "f") is None
+
+
+def test_dose_mg_and_record_property():
+    assert dose_mg(MG_250) == 250.0
+    assert dose_mg(OTHER_DOSAGE) is None
+    record = PatientRecord("Ada Lee", 60, "f", 40.0, 1.6, medication=CHECKPOINT_INHIBITOR, dosage=MG_500)
+    assert record.dose_check == dose_check(CHECKPOINT_INHIBITOR, MG_500, 40.0, 1.6, "f")
@@ -0,0 +1,57 @@
+"""EventBus flush timing and coalescing."""
+import time
+
+from onc.events import REGISTRATION_COMPLETE, DashboardEvent, EventBus
+from onc.record import PatientRecord
+
+
+class ListSink:
+    def __init__(self):
+        self.events = []
+
+    def emit_batch(self, events):
+        self.events.extend(events)
+
+
+def test_routine_event_is_flushed_after_the_interval():
+    sink = ListSink()
+    bus = EventBus(sink, batch_size=50, flush_interval=0.05)
+    bus.publish(DashboardEvent(REGISTRATION_COMPLETE, "Ada Lee"))
+    assert sink.events == []
+    deadline = time.monotonic() + 2.0
+    while not sink.events and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [event.patient for event in sink.events] == ["Ada Lee"]
+    assert len(bus) == 0
+    bus.close()
+
+
+def test_close_delivers_and_stops_the_timer():
+    sink = ListSink()
+    bus = EventBus(sink, flush_interval=60)
+    bus.publish(DashboardEvent(REGISTRATION_COMPLETE, "Ada Lee"))
+    bus.close()
+    assert len(sink.events) == 1
+    assert bus._timer is None
+
+
+def test_namesakes_are_not_coalesced():
+    sink = ListSink()
+    bus = EventBus(sink, flush_interval=60)
+    for age in (34, 71):
+        bus.publish_record(PatientRecord("Amara Patel", age, "f", 60.0, 1.6, symptom_scores=bytes(6)))
+    bus.publish(DashboardEvent(REGISTRATION_COMPLETE, "Amara Patel", {"age": 71}, session="row-2"))
+    bus.close()
+    assert bus.coalesced == 0
+    assert sorted(event.data["age"] for event in sink.events
+                  if event.kind == REGISTRATION_COMPLETE) == [34, 71, 71]
+
+
+def test_same_visit_is_coalesced():
+    sink = ListSink()
+    bus = EventBus(sink, flush_interval=60)
+    bus.publish(DashboardEvent(REGISTRATION_COMPLETE, "Ada Lee", {"BMI": 23.0}, session="7"))
+    bus.publish(DashboardEvent(REGISTRATION_COMPLETE, "Ada Lee", {"BMI": 23.4}, session="7"))
+    bus.close()
+    assert bus.coalesced == 1
+    assert [event.data["BMI"] for event in sink.events] == [23.4]
@@ -0,0 +1,17 @@
+"""ColumnarWriter skips records it cannot store and keeps the rows it buffered."""
+import csv
+
+from onc.export import CSV, ColumnarWriter
+from onc.record import PatientRecord
+
+
+def test_bad_record_is_skipped_and_buffered_rows_are_written(tmp_path):
+    path = tmp_path / "sessions.csv"
+    with ColumnarWriter(str(path), CSV, row_group_size=2) as writer:
+        assert writer.add(PatientRecord("Ada Lee", 60, "f", 60.0, 1.6), 1.0)
+        assert not writer.add(PatientRecord("Bad Age", -4, "f", 60.0, 1.6), 2.0)
+        assert writer.add(PatientRecord("Ben Roe", 70, "m", 80.0, 1.8), 3.0)
+        assert writer.add(PatientRecord("Cy Poe", 50, "m", 75.0, 1.7), 4.0)
+    rows = list(csv.DictReader(path.open(encoding="utf-8")))
+    assert [row["name"] for row in rows] == ["Ada Lee", "Ben Roe", "Cy Poe"]
+    assert (writer.written, writer.skipped) == (3, 1)
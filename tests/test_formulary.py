@@ -0,0 +1,80 @@
+"""FormularyIndex verdicts for coded and free-text regimens."""
+import pytest
+
+from onc.formulary import (CATEGORY, DOSE, FREQUENCY, INTERACTION, UNKNOWN_DRUG,
+                           FormularyIndex, load_formulary)
+from onc.record import PatientBatch, PatientRecord
+
+CHEMOTHERAPY, RADIATION, IMMUNOTHERAPY = 1, 2, 3
+CYTOTOXIC, CHECKPOINT_INHIBITOR, SUPPORTIVE, OTHER_MEDICATION = 1, 2, 3, 7
+MG_50, MG_100, MG_500 = 4, 5, 7
+DAILY, WEEKLY = 1, 6
+
+FORMULARY = {
+    "treatments": {"1": [1, 3], "2": [3], "3": [2, 3]},
+    "groups": {"1": {"frequencies": [1, 6]}, "2": {"frequencies": [6]},
+               "3": {"frequencies": [1, 2, 3]}},
+    "drugs": {"Cisplatin": {"group": 1, "dose_mg": [20, 200]},
+              "Doxorubicin": {"group": 1, "dose_mg": [10, 150]},
+              "Nivolumab": {"group": 2, "dose_mg": [240, 480]},
+              "Dexamethasone": {"group": 3, "dose_mg": [1, 40]}},
+    "interactions": [["Cisplatin", "Doxorubicin", "moderate", "Additive myelosuppression."]],
+}
+
+
+@pytest.fixture(scope="module")
+def formulary():
+    return FormularyIndex(FORMULARY)
+
+
+def kinds(issues):
+    return [issue.kind for issue in issues]
+
+
+def test_consistent_coded_regimen(formulary):
+    assert formulary.check(CHEMOTHERAPY, CYTOTOXIC, MG_100, WEEKLY) == ()
+
+
+@pytest.mark.parametrize("regimen, expected", [
+    ((RADIATION, CYTOTOXIC, MG_100, WEEKLY), [CATEGORY]),
+    ((CHEMOTHERAPY, CYTOTOXIC, MG_500, WEEKLY), [DOSE]),          # group range is 10-200 mg
+    ((IMMUNOTHERAPY, CHECKPOINT_INHIBITOR, MG_100, DAILY), [DOSE, FREQUENCY]),
+    ((RADIATION, CHECKPOINT_INHIBITOR, MG_500, WEEKLY), [CATEGORY, DOSE]),
+])
+def test_coded_regimen_issues(formulary, regimen, expected):
+    assert kinds(formulary.check(*regimen)) == expected
+
+
+def test_other_medication_text_is_analysed(formulary):
+    issues = formulary.check(CHEMOTHERAPY, OTHER_MEDICATION, MG_100, WEEKLY,
+                             "cisplatin, Doxorubicin, Unobtainium")
+    assert kinds(issues) == [UNKNOWN_DRUG, INTERACTION]
+    assert issues[1].message.startswith("Cisplatin + Doxorubicin (moderate)")
+    assert kinds(formulary.check(RADIATION, OTHER_MEDICATION, MG_500, WEEKLY, "Nivolumab")) == \
+        [CATEGORY, DOSE]
+
+
+def test_interaction_lookup_ignores_order_and_case(formulary):
+    assert formulary.interaction("DOXORUBICIN", "cisplatin").severity == "moderate"
+    assert formulary.interaction("Cisplatin", "Dexamethasone") is None
+
+
+def test_records_and_batch_review(formulary):
+    consistent = PatientRecord("Ada Lee", 60, "f", 60.0, 1.6, treatment=CHEMOTHERAPY,
+                               medication=CYTOTOXIC, dosage=MG_100, frequency=WEEKLY)
+    wrong_category = PatientRecord("Bo Chen", 60, "m", 70.0, 1.7, treatment=RADIATION,
+                                   medication=CYTOTOXIC, dosage=MG_100, frequency=WEEKLY)
+    emergency = PatientRecord("Cy Diaz", 60, "m", 70.0, 1.7, status="emergency", red_flag=1)
+    free_text = PatientRecord("Di Ruiz", 60, "f", 60.0, 1.6, treatment=CHEMOTHERAPY,
+                              medication=OTHER_MEDICATION, dosage=MG_50, frequency=WEEKLY,
+                              other={"medication": "Cisplatin, Doxorubicin"})
+    assert formulary.check_record(consistent) == ()
+    assert formulary.check_record(emergency) == ()
+    batch = PatientBatch([consistent, wrong_category, emergency, free_text])
+    assert [(row, kinds(issues)) for row, issues in formulary.review(batch)] == \
+        [(1, [CATEGORY]), (3, [INTERACTION])]
+
+
+def test_bundled_formulary_loads():
+    formulary = load_formulary()
+    assert formulary.interaction("Doxorubicin", "Trastuzumab").severity == "major"
@@ -0,0 +1,49 @@
+"""Regression tests of onc.matcher: near misses must stay 'Other'."""
+import pytest
+
+from onc.matcher import TermMatcher
+from onc.record import PatientRecord
+from onc.vocabulary import MedicationGroup, PathologyType, Treatment
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return TermMatcher()
+
+
+@pytest.mark.parametrize("field, text", [
+    ("dosage", "1000 mg"),
+    ("dosage", "2.5 mg"),
+    ("dosage", "250 mcg"),
+    ("frequency", "every 48 hours"),
+    ("frequency", "every 24 hours"),
+    ("frequency", "every 4 hours"),
+    ("frequency", "twice weekly"),
+    ("duration", "more than 2 months"),
+    ("pathology_type", "Cancer"),
+    ("treatment", "Radiotherapy + chemo"),
+    ("pathology_type", "Stage 2 melanoma"),
+])
+def test_near_misses_stay_other(matcher, field, text):
+    assert matcher.resolve(field, text) is None
+
+
+@pytest.mark.parametrize("field, text, code", [
+    ("pathology_type", "Metastatic breast cancer", PathologyType.CARCINOMA),
+    ("pathology_type", "lung adenocarcinoma", PathologyType.CARCINOMA),
+    ("treatment", "chemo", Treatment.CHEMOTHERAPY),
+    ("medication", "Keytruda", MedicationGroup.CHECKPOINT_INHIBITOR),
+])
+def test_confident_matches(matcher, field, text, code):
+    assert matcher.resolve(field, text).code == code
+
+
+def test_recode_leaves_quantities_alone(matcher):
+    record = PatientRecord(name="Ada Lee", age=60, sex="female", weight=60.0, height=1.6,
+                           pathology_type=7, dosage=8, frequency=8,
+                           other={"pathology_type": "breast cancer", "dosage": "1000 mg",
+                                  "frequency": "every 48 hours"})
+    recoded = matcher.recode(record)
+    assert set(recoded) == {"pathology_type"}
+    assert (record.pathology_type, record.dosage, record.frequency) == (1, 8, 8)
+    assert record.other["dosage"] == "1000 mg"
@@ -0,0 +1,18 @@
+"""Worker results match the single-process engine, bad rows included."""
+from onc.engine import run_batch
+from onc.parallel import parallel_triage
+from onc.synthetic import synthetic_patients
+
+
+def _summary(results):
+    return [(row, record.to_dict() if record else None, error and (error.field, error.message))
+            for row, record, error, *_ in results]
+
+
+def test_workers_match_single_process_with_bad_ages():
+    rows = list(synthetic_patients(60, seed=4))
+    rows[5]["age"] = "-4"
+    rows[17]["age"] = "70000"
+    expected = _summary(run_batch(rows))
+    assert _summary(parallel_triage(rows, workers=2, chunk_size=16)) == expected
+    assert [row for row, _, error in expected if error and error[0] == "age"] == [6, 18]
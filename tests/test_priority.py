@@ -0,0 +1,63 @@
+"""TriageQueue serves the most urgent patient first and keeps arrival order on ties."""
+import pytest
+
+from onc.priority import RED_FLAG_WEIGHT, TriageQueue, acuity_score
+from onc.record import PatientRecord
+
+
+def patient(name, worst_score=0, red_flag=0):
+    return PatientRecord(name, 60, "f", 60.0, 1.6, red_flag=red_flag,
+                         symptom_scores=bytes([worst_score, 0, 0, 0, 0, 0]))
+
+
+def test_most_urgent_first_then_arrival_order():
+    queue = TriageQueue()
+    queue.push(1, patient("Ada Lee", 3))
+    queue.push(2, patient("Bo Chen", 9))
+    queue.push(3, patient("Cy Diaz", 3))
+    queue.push(4, patient("Di Ruiz", red_flag=2))
+    assert [queue.pop()[0] for _ in range(len(queue))] == [4, 2, 1, 3]
+
+
+def test_namesakes_wait_separately():
+    queue = TriageQueue()
+    queue.push(1, patient("Amara Patel", 2))
+    queue.push(2, patient("Amara Patel", 8))
+    assert len(queue) == 2
+    assert queue.pop()[0] == 2
+    assert queue.pop()[0] == 1
+
+
+def test_update_reprioritizes_and_keeps_arrival_rank():
+    queue = TriageQueue()
+    queue.push(1, patient("Ada Lee", 2))
+    queue.push(2, patient("Bo Chen", 5))
+    queue.push(3, patient("Cy Diaz", 5))
+    assert queue.update(1, patient("Ada Lee", 5)) == acuity_score(patient("Ada Lee", 5))
+    # Same acuity as the others now, and Ada arrived first
+    assert queue.peek()[0] == 1
+    assert len(queue) == 3
+    assert [queue.pop()[0] for _ in range(3)] == [1, 2, 3]
+
+
+def test_update_of_a_patient_not_waiting_raises():
+    queue = TriageQueue()
+    with pytest.raises(KeyError):
+        queue.update(1, patient("Ada Lee"))
+
+
+def test_remove_skips_the_entry():
+    queue = TriageQueue()
+    queue.push(1, patient("Ada Lee", red_flag=1))
+    queue.push(2, patient("Bo Chen", 4))
+    queue.remove(1)
+    assert 1 not in queue
+    assert queue.peek()[0] == 2
+    assert queue.pop()[2] == acuity_score(patient("Bo Chen", 4))
+    with pytest.raises(KeyError):
+        queue.pop()
+
+
+def test_red_flag_outranks_any_symptom_picture():
+    assert acuity_score(patient("Ada Lee", red_flag=1)) == RED_FLAG_WEIGHT
+    assert acuity_score(patient("Bo Chen", 10)) < RED_FLAG_WEIGHT
@@ -0,0 +1,24 @@
+"""PatientBatch columns stay aligned when a record cannot be stored."""
+import pytest
+
+from onc.engine import IntakeError, triage_answers
+from onc.record import PatientBatch, PatientRecord
+from onc.synthetic import synthetic_patients
+
+
+@pytest.mark.parametrize("age", [-4, 70000])
+def test_rejected_append_leaves_columns_aligned(age):
+    batch = PatientBatch([PatientRecord("Ada Lee", 60, "f", 60.0, 1.6)])
+    with pytest.raises(OverflowError):
+        batch.append(PatientRecord("Ada Lee", age, "f", 60.0, 1.6))
+    assert len(batch.ages) == len(batch.weights) == len(batch.codes["dosage"]) == len(batch) == 1
+    assert len(batch.symptom_scores) == 6
+
+
+@pytest.mark.parametrize("age", ["-4", "131", "70000"])
+def test_engine_rejects_implausible_age(age):
+    answers = next(iter(synthetic_patients(1)))
+    answers["age"] = age
+    with pytest.raises(IntakeError) as rejected:
+        triage_answers(answers)
+    assert rejected.value.field == "age"
@@ -0,0 +1,93 @@
+"""Registration state machine: retries, single-field corrections and the returning-patient path."""
+import pytest
+
+from onc.clinical import Receptionnist
+from onc.metrics import Metrics
+from onc.record import PatientRecord
+from onc.store import PatientStore
+
+
+@pytest.fixture
+def answers(monkeypatch):
+    """Feeds the desk prompts from a list; records every prompt asked."""
+    prompts = []
+    queue = []
+
+    def fake_input(prompt):
+        prompts.append(prompt)
+        return queue.pop(0)
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    return queue, prompts
+
+
+def desk(**collaborators):
+    patient = Receptionnist(name="", age=0, sex="", weight=0.0, height=0.0, BMI=0.0)
+    for attribute, value in collaborators.items():
+        setattr(patient, attribute, value)
+    return patient
+
+
+def test_invalid_answers_are_asked_again(answers):
+    queue, prompts = answers
+    queue += ["J4ne", "Jane Doe", "abc", "131", "54", "x", "F", "heavy", "62.5", "0", "1.65", "y"]
+    metrics = Metrics()
+    patient = desk(metrics=metrics)
+    patient.run_registration()
+    assert (patient.name, patient.age, patient.sex, patient.weight, patient.height) == \
+        ("Jane Doe", 54, "f", 62.5, 1.65)
+    assert round(patient.BMI, 1) == 23.0
+    assert patient.registration_state == "done"
+    assert sum(metrics.validation_failures.values()) == 6
+    assert len(prompts) == 12
+
+
+def test_declined_confirmation_corrects_one_field(answers):
+    queue, prompts = answers
+    queue += ["Jane Doe", "54", "F", "62.5", "1.65", "no", "7", "4", "64", "yes"]
+    patient = desk()
+    patient.run_registration()
+    assert patient.weight == 64.0
+    assert (patient.name, patient.age, patient.height) == ("Jane Doe", 54, 1.65)
+    # The other fields were not asked again
+    assert sum("weight" in prompt for prompt in prompts) == 2
+    assert sum("full legal name" in prompt for prompt in prompts) == 1
+
+
+def test_re_enter_everything_restarts_without_recursion(answers):
+    queue, _ = answers
+    queue += ["Jane Doe", "54", "F", "62.5", "1.65", "n", "A",
+              "Jane Roe", "55", "F", "63", "1.66", "y"]
+    patient = desk()
+    patient.run_registration()
+    assert (patient.name, patient.age, patient.weight) == ("Jane Roe", 55, 63.0)
+
+
+def test_steps_resume_where_the_last_one_stopped(answers):
+    queue, _ = answers
+    queue += ["Jane Doe", "54", "F"]
+    patient = desk()
+    patient.patient_registration_step1()
+    assert patient.registration_state == "weight"
+    queue += ["62.5", "1.65"]
+    patient.patient_registration_step2()
+    assert patient.registration_state == "confirm"
+    queue += ["y"]
+    patient.patient_registration_step3()
+    assert patient.registration_state == "done"
+
+
+def test_returning_patient_needs_name_and_age(answers):
+    queue, prompts = answers
+    with PatientStore() as store:
+        store.add(PatientRecord("Jane Doe", 54, "f", 62.5, 1.65))
+        # A namesake of another age is registered from scratch
+        queue += ["Jane Doe", "30", "F", "70", "1.7", "y"]
+        desk(patient_lookup=store).run_registration()
+        assert not any("Welcome back" in prompt for prompt in prompts)
+        # Same name and age: the details on file are offered and reviewed
+        queue += ["Jane Doe", "54", "Y", "y"]
+        patient = desk(patient_lookup=store)
+        patient.run_registration()
+        assert any("Welcome back" in prompt for prompt in prompts)
+        assert (patient.sex, patient.weight, patient.height) == ("f", 62.5, 1.65)
@@ -0,0 +1,30 @@
+"""SessionManager resumes open sessions and isolates a failing one."""
+from onc.sessions import SessionManager
+
+NAME_PROMPT = "Welcome to our clinic. Please provide your full legal name as it appears on your ID:"
+
+
+def test_session_message_without_answer_repeats_the_prompt():
+    manager = SessionManager()
+    assert manager.handle({"session": "k1"})["prompt"] == NAME_PROMPT
+    manager.handle({"session": "k1", "answer": "Jane Doe"})
+    resumed = manager.handle({"session": "k1"})
+    assert resumed["prompt"].startswith("Please enter your current age")
+    assert "error" not in resumed
+    assert manager.sessions["k1"].answers == {"name": "Jane Doe"}
+
+
+def test_failing_session_is_closed_and_the_others_carry_on():
+    def on_complete(record):
+        raise OSError("store unavailable")
+
+    manager = SessionManager(on_complete=on_complete)
+    manager.handle({"session": "k1"})
+    manager.handle({"session": "k2"})
+    for answer in ("Jane Doe", "54", "F", "62.5", "1.65", "Y"):
+        manager.handle({"session": "k1", "answer": answer})
+    # First red flag answered 'Y': the session finishes, then on_complete fails
+    reply = manager.handle({"session": "k1", "answer": "Y"})
+    assert reply["done"] and "store unavailable" in reply["error"]
+    assert "k1" not in manager.sessions
+    assert manager.handle({"session": "k2", "answer": "Bo Chen"})["prompt"].startswith("Please enter")
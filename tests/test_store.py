@@ -0,0 +1,66 @@
+"""PatientStore bulk inserts and returning-patient lookups."""
+import time
+
+import pytest
+
+from onc.record import PatientRecord
+from onc.store import YEAR_SECONDS, PatientStore, _row
+
+
+def patient(name="Ada Lee", age=60, weight=60.0):
+    return PatientRecord(name, age, "f", weight, 1.6, symptom_scores=bytes(6))
+
+
+@pytest.fixture
+def store():
+    with PatientStore() as store:
+        yield store
+
+
+def test_add_many_writes_every_record_in_chunks(store):
+    records = [patient(f"Patient {chr(65 + index % 26)}", 20 + index % 50) for index in range(1203)]
+    assert store.add_many(records, chunk_size=100) == 1203
+    assert len(store) == 1203
+    assert [record.age for _, record in store.find_by_name("patient c")][:2] == [22, 48]
+
+
+def test_add_many_refreshes_a_cached_patient(store):
+    store.add(patient(weight=60.0))
+    assert store.last_visit("Ada Lee", 60).weight == 60.0
+    store.add_many([patient(weight=58.0)])
+    assert store.last_visit("ada  LEE", 60).weight == 58.0
+
+
+def test_last_visit_needs_a_consistent_age(store):
+    store.add(patient("Amara Patel", 34))
+    store.add(patient("Amara Patel", 71, weight=80.0))
+    assert store.last_visit("Amara Patel", 34).age == 34
+    assert store.last_visit("Amara Patel", 71).weight == 80.0
+    assert store.last_visit("Amara Patel", 50) is None
+    assert store.last_visit("Amara Patel", 33) is None
+
+
+def test_last_visit_allows_for_the_years_since(store):
+    store.add(patient(age=60), recorded_at=time.time() - 2.5 * YEAR_SECONDS)
+    assert store.last_visit("Ada Lee", 62).age == 60
+    assert store.last_visit("Ada Lee", 63).age == 60
+    assert store.last_visit("Ada Lee", 64) is None
+    assert store.last_visit("Ada Lee", 61) is None
+
+
+def test_first_visit_is_cached_and_replaced_by_the_new_visit(store):
+    assert store.last_visit("Ada Lee", 60) is None
+    # The absence is cached: a row written behind the store's back is not seen
+    store._insert_chunk([_row(patient(age=60), time.time())])
+    assert store.last_visit("Ada Lee", 60) is None
+    # A visit through the store replaces the cached None, at every age
+    store.add(patient(age=61))
+    assert store.last_visit("Ada Lee", 61).age == 61
+    assert store.last_visit("Ada Lee", 60).age == 60
+
+
+def test_cache_keeps_only_the_most_recent_patients():
+    with PatientStore(recent_capacity=2) as store:
+        for name in ("Ada Lee", "Bo Chen", "Cy Diaz"):
+            store.last_visit(name, 60)
+        assert list(store._recent) == ["bo chen", "cy diaz"]
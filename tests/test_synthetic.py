@@ -0,0 +1,33 @@
+"""Synthetic desk scripts stay in step with the desk's extra prompts."""
+import pytest
+
+from onc.__main__ import main
+from onc.synthetic import desk_scripts, synthetic_patients
+
+
+@pytest.mark.parametrize("journal, store", [(False, False), (True, False), (False, True), (True, True)])
+def test_desk_script_walks_every_session(tmp_path, monkeypatch, capsys, journal, store):
+    count = 300
+    lines = iter([line for script in desk_scripts(synthetic_patients(count, seed=5), journal, store)
+                  for line in script])
+
+    def scripted_input(prompt):
+        print(prompt)
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError from None
+
+    monkeypatch.setattr("builtins.input", scripted_input)
+    argv = ["--soft-capacity", "0"]
+    if journal:
+        argv += ["--journal", str(tmp_path / "journal.jsonl")]
+    if store:
+        argv += ["--store", str(tmp_path / "patients.db")]
+    main(argv)
+    output = capsys.readouterr().out
+    assert f"DESK CLOSED - {count} patient sessions served" in output
+    # Only the scripted declined registrations are rejected
+    assert output.count("⛔️") == output.count("Validation Declined")
+    if store:
+        assert "Welcome back" in output
@@ -0,0 +1,69 @@
+"""TrendEngine alerts on rising symptom scores across visits."""
+import pytest
+
+from onc.record import PatientRecord
+from onc.trends import RISE, WORSENING, TrendEngine, describe
+
+
+def scores(pain=0, fatigue=0):
+    return bytes([pain, 0, fatigue, 0, 0, 0])
+
+
+def test_first_visit_raises_nothing():
+    engine = TrendEngine()
+    assert engine.add_visit("Ada Lee", scores(9)) == []
+    assert engine.worsening() == []
+
+
+def test_rise_since_the_previous_visit():
+    engine = TrendEngine()
+    engine.add_visit("Ada Lee", scores(pain=2), timestamp=1.0)
+    (alert,) = engine.add_visit("ada  lee", scores(pain=6), timestamp=2.0)
+    assert (alert.symptom, alert.kind, alert.previous, alert.current, alert.delta) == \
+        ("Pain", RISE, 2, 6, 4)
+    assert describe(alert) == "⚠️ Trend alert: Pain rose from 2 to 6 (+4) since the last visit."
+    assert [trend.name for trend in engine.worsening()] == ["Ada Lee"]
+
+
+def test_small_rises_visit_after_visit():
+    engine = TrendEngine()
+    engine.add_visit("Ada Lee", scores(fatigue=3))
+    assert engine.add_visit("Ada Lee", scores(fatigue=4)) == []
+    (alert,) = engine.add_visit("Ada Lee", scores(fatigue=5))
+    assert (alert.kind, alert.previous, alert.current, alert.delta) == (WORSENING, 3, 5, 2)
+    # A fall ends the run and clears the patient from the worsening set
+    assert engine.add_visit("Ada Lee", scores(fatigue=4)) == []
+    assert engine.worsening() == []
+    assert engine.history("Ada Lee").streaks[2] == 0
+
+
+def test_span_compares_against_older_visits():
+    engine = TrendEngine(span=3, streak=10)
+    for pain in (1, 3, 4):
+        alerts = engine.add_visit("Ada Lee", scores(pain))
+    assert [(alert.kind, alert.previous) for alert in alerts] == [(RISE, 1)]
+
+
+def test_state_is_kept_per_patient():
+    engine = TrendEngine(smoothing=0.5)
+    engine.add_visit("Ada Lee", scores(4), grade=1, timestamp=1.0)
+    engine.add_visit("Bo Chen", scores(9))
+    engine.add_visit("Ada Lee", scores(6), grade=2, timestamp=2.0)
+    trend = engine.history("Ada Lee")
+    assert len(engine) == 2 and len(trend) == 2
+    assert trend.series(0) == [4, 6]
+    assert trend.visit(-1) == (2.0, (6, 0, 0, 0, 0, 0), 2)
+    assert trend.rolling[0] == 5.0 and trend.deltas[0] == 2
+
+
+def test_emergency_records_are_skipped():
+    engine = TrendEngine()
+    assert engine.add_record(PatientRecord("Ada Lee", 60, "f", 60.0, 1.6, status="emergency")) == []
+    assert "Ada Lee" not in engine
+
+
+def test_scores_must_cover_every_symptom():
+    with pytest.raises(ValueError):
+        TrendEngine().add_visit("Ada Lee", b"\x01\x02")
+    with pytest.raises(ValueError):
+        TrendEngine(span=1)